@@ -0,0 +1,619 @@
+#!/usr/bin/env python3
+"""
+Benchmark.py - Mesures de performance hors pygame
+
+Usage : python Benchmark.py [codec] [delta] [framing] [server] [sim] [collisions] [raster] [shells] [pool] [tanks] [sprites] [terrain] [map] [hud] [--iterations N]
+"""
+
+import argparse
+import copy
+import json
+import random
+import subprocess
+import sys
+import time
+from Game.Network_Codec import JsonCodec, BinaryCodec
+from Game.Snapshot_Delta import DeltaEncoder, DeltaDecoder
+from Game.Network_Framing import FrameBuffer, frame
+from Game.Network import NetworkClient
+from Game.Network_Engine import NetworkEngine
+from Game.Core.Geometry import Rect
+from Game.Collisions.Spatial_Grid import SpatialGrid
+from Game.Collisions.Map_Collisions import MapCollisions
+from Game.Collisions.Shell_Collisions import ShellCollisions
+
+
+def _sample_state(n_shells, n_powerups=3, seed=1):
+    """Snapshot d'état représentatif de MultiGame.send_player_data."""
+    rng = random.Random(seed)
+    return {
+        "x": rng.uniform(0, 2520), "y": rng.uniform(0, 1560),
+        "hull_angle": rng.uniform(-90, 270),
+        "turret_angle": rng.uniform(-90, 270),
+        "health": 75,
+        "shells_data": [
+            {"id": 1000 + i, "x": round(rng.uniform(0, 2560), 1), "y": round(rng.uniform(0, 1600), 1),
+             "vx": round(rng.uniform(-8, 8), 2), "vy": round(rng.uniform(-8, 8), 2),
+             "bounces": rng.randint(0, 3)}
+            for i in range(n_shells)
+        ],
+        "powerups_data": [
+            {"id": i, "x": round(rng.uniform(40, 2520), 1), "y": round(rng.uniform(40, 1560), 1),
+             "type": rng.choice(["heal", "speed"])}
+            for i in range(n_powerups)
+        ],
+        "picked_powerup_ids": [],
+    }
+
+
+def _timeit(fn, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return time.perf_counter() - start
+
+
+def _keyframe(state):
+    """Snapshot complet tel qu'envoyé sans base acquittée."""
+    return DeltaEncoder().encode(state, -1)
+
+
+def _advance(state, frame):
+    """Fait avancer les shells d'une frame ; le tank ne bouge qu'une frame sur quatre."""
+    if frame % 4 == 0:
+        state["x"] += 4
+    for s in state["shells_data"]:
+        s["x"] = round(s["x"] + s["vx"], 1)
+        s["y"] = round(s["y"] + s["vy"], 1)
+    return state
+
+
+def bench_codec(iterations):
+    """Débit encode/decode et taille par snapshot, JSON vs binaire."""
+    print(f"{'codec':<8}{'shells':>8}{'octets':>10}{'encode/s':>14}{'decode/s':>14}")
+    for n_shells in (0, 6, 30, 120):
+        snapshot = _keyframe(_sample_state(n_shells))
+        for codec in (JsonCodec(), BinaryCodec()):
+            raw = codec.encode(snapshot)
+            t_enc = _timeit(lambda: codec.encode(snapshot), iterations)
+            t_dec = _timeit(lambda: codec.decode(raw), iterations)
+            print(f"{codec.name:<8}{n_shells:>8}{len(raw):>10}"
+                  f"{iterations / t_enc:>14,.0f}{iterations / t_dec:>14,.0f}")
+
+
+def bench_delta(iterations):
+    """Octets moyens par snapshot : keyframes systématiques vs deltas acquittés."""
+    frames = max(60, iterations // 100)
+    print(f"{'codec':<8}{'shells':>8}{'keyframe':>10}{'delta':>10}{'ratio':>8}")
+    for n_shells in (0, 6, 30):
+        for codec in (JsonCodec(), BinaryCodec()):
+            state = _sample_state(n_shells)
+            encoder, decoder = DeltaEncoder(), DeltaDecoder()
+            full_bytes = delta_bytes = 0
+            for frame in range(frames):
+                state = _advance(copy.deepcopy(state), frame)
+                full_bytes += len(codec.encode(_keyframe(state)))
+                raw = codec.encode(encoder.encode(state, -1))
+                delta_bytes += len(raw)
+                decoder.decode(codec.decode(raw))
+                encoder.on_ack(decoder.ack)     # ack immédiat (latence nulle)
+            print(f"{codec.name:<8}{n_shells:>8}{full_bytes / frames:>10.0f}"
+                  f"{delta_bytes / frames:>10.0f}{full_bytes / delta_bytes:>8.1f}")
+
+
+def _split_frames(stream, chunk_size):
+    """Ancien découpage : concaténation + split par message (référence)."""
+    buffer, count = b"", 0
+    for i in range(0, len(stream), chunk_size):
+        buffer += stream[i:i + chunk_size]
+        while b"\n" in buffer:
+            raw, buffer = buffer.split(b"\n", 1)
+            count += 1
+    return count
+
+
+def _frame_buffer(stream, chunk_size, length_prefixed):
+    frames, count = FrameBuffer(length_prefixed), 0
+    for i in range(0, len(stream), chunk_size):
+        frames.feed(stream[i:i + chunk_size])
+        for _ in frames.frames():
+            count += 1
+    return count
+
+
+def bench_framing(iterations):
+    """Découpage d'une rafale de snapshots reçue en un seul recv."""
+    payload = JsonCodec().encode(_keyframe(_sample_state(6)))
+    print(f"{'messages':>10}{'split':>12}{'FrameBuffer':>14}{'longueur':>12}   (ms)")
+    for burst in (10, 100, 1000):
+        newline = b"".join(frame(payload, False) for _ in range(burst))
+        prefixed = b"".join(frame(payload, True) for _ in range(burst))
+        chunk = len(newline)
+        repeats = max(1, iterations // (burst * 10))
+        t_split = _timeit(lambda: _split_frames(newline, chunk), repeats)
+        t_view = _timeit(lambda: _frame_buffer(newline, chunk, False), repeats)
+        t_len = _timeit(lambda: _frame_buffer(prefixed, chunk, True), repeats)
+        print(f"{burst:>10}{t_split * 1000 / repeats:>12.3f}{t_view * 1000 / repeats:>14.3f}"
+              f"{t_len * 1000 / repeats:>12.3f}")
+
+
+def _run_bots(port, n_bots, duration, rng):
+    """Connecte `n_bots` clients qui envoient des entrées aléatoires à 30 Hz."""
+    engine = NetworkEngine()
+    bots = []
+    for _ in range(n_bots):
+        bot = NetworkClient("127.0.0.1", port, engine=engine)
+        if bot.connect():
+            bots.append(bot)
+    received = dict.fromkeys(bots, 0)
+
+    end = time.perf_counter() + duration
+    next_input = 0.0
+    while time.perf_counter() < end:
+        now = time.perf_counter()
+        if now >= next_input:
+            next_input = now + 1 / 30
+            for bot in bots:
+                bot.send_state({"input": {
+                    "move": [rng.randint(-1, 1), rng.randint(-1, 1)],
+                    "aim": rng.uniform(0, 360), "fire": rng.random() < 0.1}})
+        engine.pump(0.005)
+        for bot in bots:
+            if bot.receive_state() is not None:
+                received[bot] += 1
+    udp = sum(bot.udp_ready for bot in bots)
+    for bot in bots:
+        bot.disconnect()
+    return len(bots), udp, sum(received.values()) / max(1, len(bots)) / duration
+
+
+def bench_server(iterations):
+    """Serveur dédié (processus séparé) face à N bots : ticks/s tenus et snapshots reçus."""
+    duration = 5.0
+    rng = random.Random(3)
+    print(f"{'bots':>6}{'connectés':>11}{'udp':>6}{'ticks/s':>10}{'tick moy':>10}"
+          f"{'tick max':>10}{'retards':>9}{'snap/s':>9}")
+    for i, n_bots in enumerate((2, 8, 16)):
+        port = 5650 + i
+        server = subprocess.Popen(
+            [sys.executable, "Dedicated_Server.py", "--port", str(port), "--max-players", str(n_bots),
+             "--duration", str(duration + 3), "--summary"],
+            stdout=subprocess.PIPE, text=True)
+        server.stdout.readline()     # bannière : le serveur écoute
+        connected, udp, snaps = _run_bots(port, n_bots, duration, rng)
+        summary = json.loads(server.communicate()[0].strip().splitlines()[-1])
+        print(f"{n_bots:>6}{connected:>11}{udp:>6}{summary['tick_rate']:>10.1f}"
+              f"{summary['avg_tick_ms']:>10.2f}{summary['max_tick_ms']:>10.2f}"
+              f"{summary['late_ticks']:>9}{snaps:>9.1f}")
+
+
+def bench_sim(iterations):
+    """GameState seul (ni affichage ni réseau) : pas de simulation par seconde vs temps réel."""
+    from Config import SIM_HZ
+    from Game.Core.Game_State import GameState
+    from Game.Assets.Shell_Pool import NUMPY_AVAILABLE
+    ticks = max(300, iterations // 20)
+    print(f"{'joueurs':>8}{'pas/s':>10}{'ms/pas':>9}{'x temps réel':>14}")
+    for n_players in (2, 8, 32):
+        state = GameState(seed=n_players)
+        rng = random.Random(n_players)
+        for client_id in range(1, n_players + 1):
+            state.add_player(client_id)
+
+        def run():
+            for tick in range(ticks):
+                if tick % 30 == 0:      # entrées de bots, renouvelées toutes les 0.5 s
+                    for player in state.players.values():
+                        player.apply_input({"move": (rng.randint(-1, 1), rng.randint(-1, 1)),
+                                            "aim": rng.uniform(0, 360),
+                                            "fire": rng.random() < 0.7})
+                state.step()
+
+        elapsed = _timeit(run, 1)
+        rate = ticks / elapsed
+        print(f"{n_players:>8}{rate:>10,.0f}{elapsed * 1000 / ticks:>9.3f}{rate / SIM_HZ:>14.0f}")
+    print(f"pygame importé : {'oui' if 'pygame' in sys.modules else 'non'}")
+
+    # Lockstep : deux états de même graine, mêmes entrées → mêmes checksums à chaque pas
+    def checksums(use_pool):
+        state, rng = GameState(seed=1234, use_pool=use_pool), random.Random(1234)
+        for client_id in range(1, 9):
+            state.add_player(client_id)
+        sums = []
+        for tick in range(ticks):
+            if tick % 30 == 0:
+                for player in state.players.values():
+                    player.apply_input({"move": (rng.randint(-1, 1), rng.randint(-1, 1)),
+                                        "aim": rng.uniform(0, 360), "fire": rng.random() < 0.7})
+            state.step()
+            sums.append(state.checksum())
+        return sums
+
+    reference = checksums(False)
+    identical = checksums(False) == reference and checksums(NUMPY_AVAILABLE) == reference
+    print(f"déterministe ({ticks} pas, 8 joueurs) : {'oui' if identical else 'NON'}")
+
+
+class _Body:
+    """Tank / shell minimal pour les requêtes de collision."""
+
+    def __init__(self, x, y):
+        self.x, self.y = x, y
+        self.width = self.height = 40
+        self.radius = 5
+
+
+def bench_collisions(iterations):
+    """Requêtes tank + shell : liste parcourue en entier vs grille uniforme."""
+    rng = random.Random(5)
+    queries = max(200, iterations // 20)
+    print(f"{'obstacles':>10}{'carte':>12}{'liste µs':>10}{'grille µs':>11}{'ratio':>8}")
+    for n_obstacles, scale in ((18, 1), (150, 3), (1200, 8)):
+        w, h = 2560 * scale, 1600 * scale
+        rects = [Rect(rng.randint(0, w - 200), rng.randint(0, h - 200),
+                      rng.randint(60, 200), rng.randint(60, 200)) for _ in range(n_obstacles)]
+        grid = SpatialGrid(rects)
+        bodies = [_Body(rng.uniform(0, w), rng.uniform(0, h)) for _ in range(queries)]
+
+        def run(obstacles):
+            for b in bodies:
+                MapCollisions.check_tank_collision(b, obstacles)
+                MapCollisions.check_shell_collision(b, obstacles)
+
+        t_list = _timeit(lambda: run(rects), 3) / 3
+        t_grid = _timeit(lambda: run(grid), 3) / 3
+        print(f"{n_obstacles:>10}{f'{w}x{h}':>12}{t_list * 1e6 / queries:>10.2f}"
+              f"{t_grid * 1e6 / queries:>11.2f}{t_list / t_grid:>8.1f}")
+
+
+def bench_raster(iterations):
+    """Raster de matériaux de MapLayout vs parcours des zones / requêtes de grille, µs par requête."""
+    from Game.Core.Map_Layout import MapLayout
+    from Game.Assets.Shell import Shell
+    layout = MapLayout()
+    rng = random.Random(9)
+    queries = max(2000, iterations // 2)
+    rects = [Rect(rng.uniform(0, 2520), rng.uniform(0, 1560), 40, 40) for _ in range(queries)]
+    solid = layout.get_solid_obstacles()
+    bouncing, destroying = layout.get_bouncing_obstacles(), layout.get_destroying_obstacles()
+    zones = layout.sand_zones + layout.dirt_zones
+    starts = [(r.x, r.y, rng.uniform(0, 360)) for r in rects[:2000]]
+
+    def shells(game_map):
+        batch = [Shell(x, y, a, None) for x, y, a in starts]
+        def run():
+            for _ in range(30):
+                for shell in batch:
+                    ShellCollisions.sweep(shell, bouncing, destroying, game_map)
+        return run
+
+    cases = (
+        ("vitesse terrain", lambda: [any(r.colliderect(z) for z in zones) for r in rects],
+         lambda: [layout.get_terrain_speed_modifier(r) for r in rects], queries),
+        ("passage tank", lambda: [any(r.colliderect(o) for o in solid.query(r)) for r in rects],
+         lambda: [layout.tank_blocked(r) for r in rects], queries),
+        ("shell balayé", shells(None), shells(layout), 30 * len(starts)),
+    )
+    print(f"{'requête':<16}{'zones/grille µs':>16}{'raster µs':>11}{'ratio':>8}")
+    for name, before, after, n in cases:
+        t_before, t_after = _timeit(before, 1), _timeit(after, 1)
+        print(f"{name:<16}{t_before * 1e6 / n:>16.2f}{t_after * 1e6 / n:>11.2f}{t_before / t_after:>8.1f}")
+
+
+def _shell_run(step, rects, shells, ticks):
+    """Temps par shell et par tick, puis traversées (trajet coupant un mur sans rebond)."""
+    states = [(s.x, s.y, s.vx, s.vy) for s in shells]
+    start = time.perf_counter()
+    for _ in range(ticks):
+        for shell in shells:
+            step(shell)
+    elapsed = time.perf_counter() - start
+
+    tunnels = 0
+    for shell, (x, y, vx, vy) in zip(shells, states):
+        shell.x, shell.y, shell.vx, shell.vy, shell.active = x, y, vx, vy, True
+    for _ in range(ticks):
+        for shell in shells:
+            before, bounces = (shell.x, shell.y), shell.bounces
+            step(shell)
+            if shell.bounces == bounces and any(r.clipline(before, (shell.x, shell.y)) for r in rects):
+                tunnels += 1
+    return elapsed, tunnels
+
+
+def bench_shells(iterations):
+    """Collision des shells : test discret (update + chevauchement) vs balayé (temps d'impact)."""
+    import pygame
+    from Game.Assets.Shell import Shell
+    rng = random.Random(7)
+    # Murs fins (6 px) en plus de blocs pleins
+    rects = [pygame.Rect(rng.randint(100, 2400), rng.randint(100, 1400), 6, rng.randint(80, 300))
+             for _ in range(30)]
+    rects += [pygame.Rect(rng.randint(100, 2300), rng.randint(100, 1300), 120, 120) for _ in range(10)]
+    grid = SpatialGrid(rects)
+    ticks = max(60, iterations // 200)
+
+    def discrete(shell):
+        shell.update()
+        ShellCollisions.check_all_collisions([shell], grid, ())
+
+    def swept(shell):
+        ShellCollisions.sweep(shell, grid)
+
+    print(f"{'vitesse':>8}{'méthode':>10}{'µs/shell':>10}{'traversées':>12}")
+    for speed in (8, 16, 32, 64):
+        starts = []
+        while len(starts) < 200:
+            x, y = rng.uniform(10, 2550), rng.uniform(10, 1590)
+            if not any(r.inflate(10, 10).collidepoint(x, y) for r in rects):
+                starts.append((x, y, rng.uniform(0, 360)))
+        for name, step in (("discret", discrete), ("balayé", swept)):
+            shells = []
+            for x, y, angle in starts:
+                shell = Shell(x, y, angle, None)
+                shell.max_bounces = 1000
+                shell.vx *= speed / shell.speed
+                shell.vy *= speed / shell.speed
+                shells.append(shell)
+            elapsed, tunnels = _shell_run(step, rects, shells, ticks)
+            print(f"{speed:>8}{name:>10}{elapsed * 1e6 / (ticks * len(shells)):>10.2f}{tunnels:>12}")
+
+
+def bench_pool(iterations):
+    """Milliers de shells : objets Shell (sweep un par un) vs ShellPool NumPy, ms par tick."""
+    from Game.Assets.Shell import Shell
+    from Game.Assets.Shell_Pool import ShellPool, NUMPY_AVAILABLE
+    from Game.Core.Map_Layout import MapLayout
+    if not NUMPY_AVAILABLE:
+        print("NumPy absent : ShellPool indisponible")
+        return
+    bouncing = MapLayout().get_bouncing_obstacles()
+    tanks = [_Body(x, y) for x, y in ((400, 400), (1200, 800), (2000, 1200), (600, 1300))]
+    rng = random.Random(11)
+    ticks = max(30, iterations // 1000)
+    print(f"{'shells':>8}{'objets ms':>11}{'pool ms':>10}{'ratio':>8}   (budget 60 FPS : 16.7 ms)")
+    for n_shells in (100, 1000, 5000, 20000):
+        starts = [(rng.uniform(0, 2560), rng.uniform(0, 1600), rng.uniform(0, 360)) for _ in range(n_shells)]
+        shells = [Shell(x, y, a, None) for x, y, a in starts]
+        pool = ShellPool()
+        for i, shell in enumerate(shells):
+            pool.add_shell(shell, i)
+
+        def objects():
+            for shell in shells:
+                ShellCollisions.sweep(shell, bouncing)
+            ShellCollisions.check_tank_hits(shells, tanks)
+
+        def batched():
+            pool.step(bouncing)
+            pool.hit_tanks(tanks, range(-len(tanks), 0))
+            pool.compact()
+
+        t_obj = _timeit(objects, ticks) / ticks
+        t_pool = _timeit(batched, ticks) / ticks
+        print(f"{n_shells:>8}{t_obj * 1000:>11.2f}{t_pool * 1000:>10.2f}{t_obj / t_pool:>8.1f}")
+
+
+def _set_broadphase(threshold):
+    """Seuil de tanks de la broadphase shell-tank, pour les deux chemins (sys.maxsize : coupée)."""
+    import Game.Collisions.Shell_Collisions as objects
+    import Game.Assets.Shell_Pool as pool
+    objects.BROADPHASE_MIN_TANKS = pool.BROADPHASE_MIN_TANKS = threshold
+
+
+def bench_tanks(iterations):
+    """Impacts shell-tank : toutes les paires vs sweep and prune sur x, tanks et shells variant séparément."""
+    from Game.Assets.Shell import Shell
+    from Game.Assets.Shell_Pool import ShellPool, NUMPY_AVAILABLE
+    from Game.Collisions.Shell_Collisions import BROADPHASE_MIN_TANKS
+    rng = random.Random(13)
+    ticks = max(5, iterations // 5000)
+    print(f"{'tanks':>6}{'shells':>8}{'objets ms':>11}{'+ SAP ms':>10}{'pool ms':>10}{'+ SAP ms':>10}")
+    for n_tanks in (2, 8, 32, 128):
+        tanks = [_Body(rng.uniform(0, 2520), rng.uniform(0, 1560)) for _ in range(n_tanks)]
+        for n_shells in (100, 1000, 5000):
+            shells = [Shell(rng.uniform(0, 2560), rng.uniform(0, 1600), rng.uniform(0, 360), None)
+                      for _ in range(n_shells)]
+            pool = None
+            if NUMPY_AVAILABLE:
+                pool = ShellPool()
+                for shell in shells:
+                    pool.add_shell(shell, -1)
+
+            def objects():
+                for shell in shells:
+                    shell.active = True
+                ShellCollisions.check_tank_hits(shells, tanks)
+
+            def batched():
+                pool.active[:pool.count] = True
+                pool.hit_tanks(tanks, range(n_tanks))
+
+            row = []
+            for run in (objects, batched):
+                for threshold in (sys.maxsize, 0):
+                    _set_broadphase(threshold)
+                    row.append(_timeit(run, ticks) / ticks * 1000 if pool or run is objects else float("nan"))
+            _set_broadphase(BROADPHASE_MIN_TANKS)
+            print(f"{n_tanks:>6}{n_shells:>8}" + "".join(f"{t:>{w}.2f}" for t, w in zip(row, (11, 10, 10, 10))))
+
+
+def bench_sprites(iterations):
+    """Dessin de tanks (pilote SDL factice) : sprites dessinés et tournés à chaque frame vs cache."""
+    import os
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    import pygame
+    from Game.Assets.Tank import Tank
+    from Game.Rendering.Entity_Renderer import EntityRenderer
+    from Game.Rendering.Sprite_Cache import SpriteCache
+    from Game.Core.Game_State import PLAYER_COLORS
+    pygame.display.init()
+    screen = pygame.display.set_mode((1280, 720))
+    rng = random.Random(17)
+    frames = max(60, iterations // 200)
+    print(f"{'tanks':>6}{'sans cache ms':>15}{'cache ms':>10}{'ratio':>8}{'sprites':>9}")
+    for n_tanks in (2, 8, 32):
+        tanks = [Tank(rng.uniform(0, 1240), rng.uniform(0, 680), PLAYER_COLORS[i % len(PLAYER_COLORS)])
+                 for i in range(n_tanks)]
+
+        def run():
+            for _ in range(frames):
+                for tank in tanks:     # tanks en mouvement : angles et santé changent
+                    tank.hull_angle = (tank.hull_angle + rng.uniform(-4, 4)) % 360
+                    tank.turret_angle = (tank.turret_angle + rng.uniform(-8, 8)) % 360
+                    tank.health = rng.randrange(0, 101, 25)
+                    EntityRenderer.draw_tank(screen, tank, 0, 0)
+
+        EntityRenderer.sprites = SpriteCache(max_sprites=0)
+        t_plain = _timeit(run, 1) / frames
+        EntityRenderer.sprites = cache = SpriteCache()
+        run()       # premier passage : remplit le cache
+        t_cached = _timeit(run, 1) / frames
+        print(f"{n_tanks:>6}{t_plain * 1000:>15.3f}{t_cached * 1000:>10.3f}{t_plain / t_cached:>8.1f}"
+              f"{len(cache._rotated):>9}")
+    pygame.display.quit()
+
+
+def bench_terrain(iterations):
+    """Texture du terrain : génération vs cache disque vs cache mémoire, ms par chargement."""
+    import os
+    import tempfile
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    import pygame
+    from Game.Core.Map_Layout import MapLayout
+    from Game.Rendering.Map_Renderer import MapRenderer
+    pygame.display.init()
+    pygame.display.set_mode((1280, 720))
+    layout = MapLayout()
+    with tempfile.TemporaryDirectory() as folder:
+        def load(cache_dir, keep_memory):
+            def run():
+                if not keep_memory:
+                    MapRenderer._textures.clear()
+                MapRenderer(layout, cache_dir)
+            return run
+
+        MapRenderer(layout, folder)     # écrit la texture sur disque
+        for name, run in (("génération", load(None, False)), ("disque", load(folder, False)),
+                          ("mémoire", load(folder, True))):
+            print(f"{name:<12}{_timeit(run, 5) / 5 * 1000:>8.2f} ms")
+    MapRenderer._textures.clear()
+    pygame.display.quit()
+
+
+def bench_map(iterations):
+    """Blit du terrain par frame : texture non convertie vs tuiles au format écran vs caméra immobile."""
+    import os
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    import pygame
+    from Game.Core.Map_Layout import MapLayout
+    from Game.Rendering.Map_Renderer import MapRenderer
+    pygame.display.init()
+    screen = pygame.display.set_mode((1024, 768))
+    renderer = MapRenderer(MapLayout(), None)
+    raw = renderer.surface.convert(24)      # ancien chemin : format différent de l'écran
+    frames = max(100, iterations // 100)
+    rng = random.Random(19)
+    cameras = [(rng.randint(0, 1536), rng.randint(0, 832)) for _ in range(frames)]
+    sprites = [pygame.Rect(rng.randint(0, 980), rng.randint(0, 720), 60, 60) for _ in range(10)]
+    hud = [pygame.Rect(10, 10, 420, 150), pygame.Rect(10, 738, 700, 20)]
+
+    def window():
+        for x, y in cameras:
+            screen.blit(raw, (0, 0), pygame.Rect(x, y, 1024, 768))
+
+    def tiles():
+        for x, y in cameras:
+            renderer.draw(screen, x, y)
+
+    def stationary():
+        for _ in cameras:
+            renderer.mark_dirty(sprites + hud)
+            renderer.draw(screen, 200, 200)
+
+    print(f"{'mode':<24}{'ms/frame':>10}")
+    for name, run in (("fenêtre non convertie", window), ("tuiles format écran", tiles),
+                      ("caméra immobile (dirty)", stationary)):
+        run()
+        print(f"{name:<24}{_timeit(run, 1) / frames * 1000:>10.3f}")
+    pygame.display.quit()
+
+
+def bench_hud(iterations):
+    """HUD solo par frame : font.render à chaque frame vs HudRenderer (rendu au changement de valeur)."""
+    import os
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    import pygame
+    from Game.Rendering.Hud_Renderer import HudRenderer
+    pygame.display.init()
+    pygame.font.init()
+    screen = pygame.display.set_mode((1024, 768))
+    font, font_small = pygame.font.Font(None, 36), pygame.font.Font(None, 24)
+    frames = max(300, iterations // 20)
+    # Partie type : position qui change un frame sur trois, PV / munitions quelques fois par seconde
+    states = [(200 + f // 3, 300, 100 - f // 90 % 100, 5 - f // 24 % 6) for f in range(frames)]
+    controls = "Flèches/ZQSD: Déplacer | Souris: Viser | Clic: Tirer | R: Recharger | ESC: Menu"
+
+    def texts(x, y, hp, ammo):
+        dots = '● ' * ammo + '○ ' * (5 - ammo)
+        return [(font_small, f"Pos: ({x}, {y}) | Shells: 0", (10, 10)), (font, f"HP: {hp}", (10, 35)),
+                (font_small, f"Munitions: {dots} [R] Recharger", (10, 92)), (font_small, controls, (10, 738))]
+
+    def immediate():
+        for x, y, hp, ammo in states:
+            for f, text, pos in texts(x, y, hp, ammo):
+                screen.blit(f.render(text, True, (255, 255, 255)), pos)
+            pygame.draw.rect(screen, (100, 0, 0), (10, 65, 200, 20))
+            pygame.draw.rect(screen, (0, 255, 0), (10, 65, 2 * hp, 20))
+            pygame.draw.rect(screen, (255, 255, 255), (10, 65, 200, 20), 2)
+
+    hud = HudRenderer(screen)
+
+    def cached():
+        for x, y, hp, ammo in states:
+            hud.begin_frame()
+            for i, (f, text, pos) in enumerate(texts(x, y, hp, ammo)):
+                hud.text(i, f, text, (255, 255, 255), topleft=pos)
+            hud.health_bar("hp_bar", (10, 65, 200, 20), hp)
+
+    t_plain = _timeit(immediate, 1) / frames
+    t_hud = _timeit(cached, 1) / frames
+    hud.total_renders = hud.total_reused = 0
+    cached()
+    print(f"{'mode':<12}{'ms/frame':>10}")
+    print(f"{'immédiat':<12}{t_plain * 1000:>10.3f}")
+    print(f"{'HUD caché':<12}{t_hud * 1000:>10.3f}   ratio {t_plain / t_hud:.1f}  "
+          f"rendus évités {hud.total_reused / frames:.1f}/frame sur {(hud.total_reused + hud.total_renders) / frames:.0f}")
+    pygame.display.quit()
+
+
+BENCHMARKS = {
+    "codec": bench_codec,
+    "delta": bench_delta,
+    "framing": bench_framing,
+    "server": bench_server,
+    "sim": bench_sim,
+    "collisions": bench_collisions,
+    "raster": bench_raster,
+    "shells": bench_shells,
+    "pool": bench_pool,
+    "tanks": bench_tanks,
+    "sprites": bench_sprites,
+    "terrain": bench_terrain,
+    "map": bench_map,
+    "hud": bench_hud,
+}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmarks Tank Battle")
+    parser.add_argument("names", nargs="*", metavar="nom",
+                        help=f"benchmarks à lancer parmi {', '.join(BENCHMARKS)} (tous par défaut)")
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    for name in args.names or BENCHMARKS:
+        if name not in BENCHMARKS:
+            parser.error(f"benchmark inconnu : {name}")
+        print(f"\n=== {name} ===")
+        BENCHMARKS[name](args.iterations)
@@ -3,7 +3,11 @@
 # Dimensions
 MENU_WIDTH = 1024
 MENU_HEIGHT = 768
-FPS = 60
+FPS = 60                # frames rendues par seconde (plafond)
+
+# Simulation à pas fixe, indépendante du rendu
+SIM_HZ = 60             # pas de simulation par seconde
+MAX_FRAME_TIME = 0.25   # s — une frame plus longue ralentit le jeu au lieu de rattraper sans fin
 
 MAP_WIDTH = 2560
 MAP_HEIGHT = 1600
@@ -14,6 +18,12 @@ TANK_HEIGHT = 50
 SHELL_WIDTH = 3
 SHELL_HEIGHT = 7
 
+# Gameplay en unités par seconde, converties en unités par pas (SIM_HZ)
+TANK_SPEED = 240        # px/s
+SHELL_SPEED = 480       # px/s
+FIRE_DELAY = 0.5        # s entre deux tirs
+RELOAD_TIME = 2.0       # s
+
 # Couleurs — UI
 COLOR_BG            = (20, 20, 30)
 COLOR_BG_GRADIENT   = (10, 10, 20)
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Dedicated_Server.py - Serveur dédié sans affichage (parties LAN à N joueurs)
+
+Usage : python Dedicated_Server.py [--port 5555] [--max-players 16] [--duration 0] [--no-udp] [--seed N] [--summary] [--telemetry-log FICHIER]
+"""
+
+import argparse
+import json
+import sys
+from Game.Network import NetworkServer
+from Game.Network_Engine import NetworkEngine
+from Game.Network_Config import DEFAULT_PORT, MAX_PLAYERS, USE_UDP, SERVER_TICK_RATE
+from Game.Server_Game import ServerGame
+
+
+def dedicated_server(port, max_players, duration, udp, summary, seed=None, telemetry_log=None):
+    server = NetworkServer(port, udp=udp, engine=NetworkEngine(), max_clients=max_players, seed=seed)
+    if telemetry_log:
+        server.telemetry.log_path = telemetry_log
+    if not server.start():
+        print("❌ Erreur: Impossible de démarrer le serveur")
+        return False
+
+    transport = "TCP + UDP" if server.udp else "TCP"
+    print(f"✅ Serveur dédié sur le port {port} ({transport}) — {max_players} joueurs max, "
+          f"{SERVER_TICK_RATE} ticks/s, graine {server.match_seed}", flush=True)
+    print("   (Ctrl+C pour arrêter)\n", flush=True)
+
+    game = ServerGame(server, server.match_seed)
+    try:
+        result = game.run(duration, report=lambda line: print(line, flush=True))
+    except KeyboardInterrupt:
+        result = None
+    server.stop()
+    print("✅ Serveur arrêté")
+    if summary and result:
+        print(json.dumps(result), flush=True)
+    return True
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serveur dédié Tank Battle")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--max-players", type=int, default=MAX_PLAYERS)
+    parser.add_argument("--duration", type=float, default=0, help="secondes (0 = sans fin)")
+    parser.add_argument("--no-udp", action="store_true", help="snapshots sur TCP uniquement")
+    parser.add_argument("--seed", type=int, help="graine de la partie (tirée au hasard sinon)")
+    parser.add_argument("--summary", action="store_true", help="résumé JSON en dernière ligne")
+    parser.add_argument("--telemetry-log", metavar="FICHIER", help="journal JSONL de télémétrie (désactivé sinon)")
+    args = parser.parse_args()
+
+    if not dedicated_server(args.port, args.max_players, args.duration,
+                            USE_UDP and not args.no_udp, args.summary, args.seed,
+                            args.telemetry_log):
+        sys.exit(1)
@@ -37,6 +37,7 @@ def demo_server():
     timeout = 60  # 60 secondes de timeout
 
     while time.time() - start_time < timeout:
+        server.pump()
         if server.client_socket is not None:
             print("✅ Client connecté !\n")
             break
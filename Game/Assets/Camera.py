@@ -10,10 +10,11 @@ class Camera:
         self.width = width
         self.height = height
 
-    def follow(self, target):
-        # Centrer sur la cible
-        self.x = target.x - self.width // 2 + target.width // 2
-        self.y = target.y - self.height // 2 + target.height // 2
+    def follow(self, target, alpha=1.0):
+        # Centrer sur la cible (pose interpolée entre deux pas de simulation)
+        x, y = target.render_pose(alpha)[:2]
+        self.x = x - self.width // 2 + target.width // 2
+        self.y = y - self.height // 2 + target.height // 2
         # Clamp aux limites
         self.x = max(0, min(self.x, MAP_WIDTH - self.width))
         self.y = max(0, min(self.y, MAP_HEIGHT - self.height))
\ No newline at end of file
@@ -1,16 +1,20 @@
-import pygame
 import math
-from Config import MAP_WIDTH, MAP_HEIGHT
+from Config import MAP_WIDTH, MAP_HEIGHT, SIM_HZ, SHELL_SPEED
 
 
 class Shell:
     """Projectile avec rebonds. Change de couleur à chaque rebond."""
 
-    _next_id = 0  # compteur global pour identifiant unique
+    __slots__ = ("shell_id", "x", "y", "angle", "owner", "radius", "speed", "color",
+                 "vx", "vy", "active", "bounces", "max_bounces", "prev_x", "prev_y")
 
-    def __init__(self, x, y, angle, owner):
-        Shell._next_id += 1
-        self.shell_id = Shell._next_id
+    _next_id = 0  # compteur global, si l'appelant ne fournit pas d'identifiant
+
+    def __init__(self, x, y, angle, owner, shell_id=None):
+        if shell_id is None:
+            Shell._next_id += 1
+            shell_id = Shell._next_id
+        self.shell_id = shell_id
 
         self.x = x
         self.y = y
@@ -18,7 +22,7 @@ class Shell:
         self.owner = owner  # pour ignorer la self-collision avant le 1er rebond
 
         self.radius = 4
-        self.speed = 8
+        self.speed = SHELL_SPEED / SIM_HZ    # px par pas de simulation
         self.color = (255, 255, 0)
 
         # Vecteur vitesse calculé depuis l'angle
@@ -30,6 +34,36 @@ class Shell:
         self.bounces = 0
         self.max_bounces = 3
 
+        self.prev_x, self.prev_y = x, y     # position avant le dernier pas (rendu)
+
+    @classmethod
+    def from_state(cls, data, owner):
+        """Shell adverse reçu du réseau : ni trigo, ni nouvel identifiant local."""
+        shell = cls.__new__(cls)
+        shell.shell_id = data["id"]
+        shell.owner = owner
+        shell.angle = 0
+        shell.radius = 4
+        shell.speed = SHELL_SPEED / SIM_HZ
+        shell.active = True
+        shell.max_bounces = 3
+        shell.bounces = -1
+        shell.apply_state(data)
+        shell.prev_x, shell.prev_y = shell.x, shell.y
+        return shell
+
+    def apply_state(self, data):
+        """Met à jour en place un shell adverse depuis son état réseau."""
+        self.x, self.y = data["x"], data["y"]
+        self.vx, self.vy = data["vx"], data["vy"]
+        if data["bounces"] != self.bounces:
+            self.bounces = data["bounces"]
+            self._update_color()
+
+    def save_pose(self):
+        """Mémorise la position courante, à appeler avant chaque pas de simulation."""
+        self.prev_x, self.prev_y = self.x, self.y
+
     def update(self):
         if not self.active:
             return
@@ -63,35 +97,31 @@ class Shell:
             self.bounces += 1
             self._update_color()
 
-    def bounce_horizontal(self):
-        """Rebond sur un mur vertical (inverse vx)."""
+    def reflect(self, nx, ny):
+        """Rebond sur une surface de normale unitaire (nx, ny) : v' = v - 2 (v·n) n."""
         if self.bounces < self.max_bounces:
-            self.vx = -self.vx
+            dot = self.vx * nx + self.vy * ny
+            self.vx -= 2 * dot * nx
+            self.vy -= 2 * dot * ny
             self.bounces += 1
             self._update_color()
             return True
         self.active = False
         return False
 
+    def bounce_horizontal(self):
+        """Rebond sur un mur vertical (inverse vx)."""
+        return self.reflect(1.0, 0.0)
+
     def bounce_vertical(self):
         """Rebond sur un mur horizontal (inverse vy)."""
-        if self.bounces < self.max_bounces:
-            self.vy = -self.vy
-            self.bounces += 1
-            self._update_color()
-            return True
-        self.active = False
-        return False
+        return self.reflect(0.0, 1.0)
 
     def _update_color(self):
         """Jaune → Orange → Orange foncé → Rouge selon les rebonds."""
-        colors = {1: (255, 200, 0), 2: (255, 100, 0)}
+        colors = {0: (255, 255, 0), 1: (255, 200, 0), 2: (255, 100, 0)}
         self.color = colors.get(self.bounces, (255, 0, 0))
 
-    def draw(self, screen, camera_x, camera_y):
-        if not self.active:
-            return
-        sx = int(self.x - camera_x)
-        sy = int(self.y - camera_y)
-        pygame.draw.circle(screen, self.color, (sx, sy), self.radius)
-        pygame.draw.circle(screen, (255, 255, 255), (sx, sy), max(1, self.radius // 2))
+    def draw(self, screen, camera_x, camera_y, alpha=1.0):
+        from Game.Rendering.Entity_Renderer import EntityRenderer
+        return EntityRenderer.draw_shell(screen, self, camera_x, camera_y, alpha)
@@ -0,0 +1,313 @@
+"""Pool de projectiles en tableaux NumPy (struct-of-arrays), optionnel.
+
+Positions, vitesses, rebonds, propriétaires et drapeaux d'activité sont
+stockés dans des tableaux contigus : déplacement balayé, rebonds sur les
+bords et les obstacles, dégâts aux tanks et compactage se font par lots
+vectorisés, sans objet Python ni pygame.Rect par shell. Même physique que
+ShellCollisions.sweep (temps d'impact exact contre les rects arrondis).
+
+NumPy n'est pas une dépendance du jeu : si l'import échoue, NUMPY_AVAILABLE
+vaut False et l'on garde des listes de Shell (ShellMovement / ShellCollisions).
+"""
+
+try:
+    import numpy as np
+except ImportError:     # NumPy absent : pool indisponible, API objet seulement
+    np = None
+
+from Config import MAP_WIDTH, MAP_HEIGHT
+from Game.Collisions.Shell_Collisions import SWEEP_EPSILON, BROADPHASE_MIN_TANKS
+
+NUMPY_AVAILABLE = np is not None
+
+BOUNCE_COLORS = ((255, 255, 0), (255, 200, 0), (255, 100, 0), (255, 0, 0))
+
+
+def _slab(p, d, lo, hi):
+    """Intervalle [entrée, sortie] du paramètre t dans une bande lo < p + t·d < hi."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t0 = (lo - p) / d
+        t1 = (hi - p) / d
+    still = d == 0
+    inside = (p > lo) & (p < hi)
+    t_in = np.where(still, np.where(inside, -np.inf, np.inf), np.minimum(t0, t1))
+    t_out = np.where(still, np.where(inside, np.inf, -np.inf), np.maximum(t0, t1))
+    return t_in, t_out
+
+
+def _ray_boxes(px, py, dx, dy, left, top, right, bottom):
+    """Version vectorisée de _ray_box : (t, nx, ny), t = inf sans impact."""
+    tx_in, tx_out = _slab(px, dx, left, right)
+    ty_in, ty_out = _slab(py, dy, top, bottom)
+    t_in = np.maximum(tx_in, ty_in)
+    t_out = np.minimum(np.minimum(tx_out, ty_out), 1.0)
+    hit = (t_in > 0) & (t_in <= t_out)
+    x_axis = tx_in >= ty_in
+    nx = np.where(x_axis, -np.sign(dx), 0.0)
+    ny = np.where(x_axis, 0.0, -np.sign(dy))
+    return np.where(hit, t_in, np.inf), nx, ny
+
+
+def _ray_circles(px, py, dx, dy, cx, cy, r):
+    """Version vectorisée de _ray_circle : (t, nx, ny), t = inf sans impact."""
+    fx, fy = px - cx, py - cy
+    a = dx * dx + dy * dy
+    b = fx * dx + fy * dy
+    disc = b * b - a * (fx * fx + fy * fy - r * r)
+    ok = (b < 0) & (a > 0) & (disc >= 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = (-b - np.sqrt(np.where(ok, disc, 0.0))) / np.where(ok, a, 1.0)
+    ok &= (t >= 0) & (t <= 1)
+    t = np.where(ok, t, np.inf)
+    return t, (fx + dx * np.where(ok, t, 0.0)) / r, (fy + dy * np.where(ok, t, 0.0)) / r
+
+
+def _sweep_pairs(px, py, dx, dy, r, left, top, right, bottom):
+    """Temps d'impact exact cercle / rect pour des paires (shell, obstacle)."""
+    best_t = np.full(px.shape, np.inf)
+    best_nx = np.zeros(px.shape)
+    best_ny = np.zeros(px.shape)
+    for t, nx, ny in (_ray_boxes(px, py, dx, dy, left - r, top, right + r, bottom),
+                      _ray_boxes(px, py, dx, dy, left, top - r, right, bottom + r),
+                      _ray_circles(px, py, dx, dy, left, top, r),
+                      _ray_circles(px, py, dx, dy, right, top, r),
+                      _ray_circles(px, py, dx, dy, left, bottom, r),
+                      _ray_circles(px, py, dx, dy, right, bottom, r)):
+        better = t < best_t
+        best_t = np.where(better, t, best_t)
+        best_nx = np.where(better, nx, best_nx)
+        best_ny = np.where(better, ny, best_ny)
+
+    # Déjà en contact au départ : rebond immédiat si le shell s'enfonce
+    qx = np.clip(px, left, right)
+    qy = np.clip(py, top, bottom)
+    ox, oy = px - qx, py - qy
+    d2 = ox * ox + oy * oy
+    overlap = d2 < r * r
+    if overlap.any():
+        d = np.sqrt(d2)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            onx, ony = ox / d, oy / d
+        inside = overlap & (d2 == 0)
+        if inside.any():    # centre dans le rect : sortie par la face la plus proche
+            faces = np.stack((px - left, right - px, py - top, bottom - py))
+            face = faces.argmin(axis=0)
+            onx = np.where(inside, np.choose(face, (-1.0, 1.0, 0.0, 0.0)), onx)
+            ony = np.where(inside, np.choose(face, (0.0, 0.0, -1.0, 1.0)), ony)
+        entering = overlap & (dx * onx + dy * ony < 0)
+        best_t = np.where(overlap, np.where(entering, 0.0, np.inf), best_t)
+        best_nx = np.where(overlap, onx, best_nx)
+        best_ny = np.where(overlap, ony, best_ny)
+    return best_t, best_nx, best_ny
+
+
+def _tank_pairs(sx, shells, cx, reach):
+    """Sweep and prune sur x : paires (shell, tank) dont les centres sont à moins de `reach` en x."""
+    order = np.argsort(cx, kind="stable")
+    xs = cx[order]
+    lo = np.searchsorted(xs, sx - reach, "left")
+    hi = np.searchsorted(xs, sx + reach, "right")
+    counts = hi - lo
+    total = int(counts.sum())
+    if not total:
+        return np.empty(0, np.int64), np.empty(0, np.int64)
+    pair_shells = np.repeat(shells, counts)
+    # Rang dans la fenêtre [lo, hi) de chaque shell
+    starts = np.repeat(lo - np.cumsum(counts) + counts, counts)
+    return pair_shells, order[starts + np.arange(total)]
+
+
+class ShellPool:
+    """Shells actifs en tableaux NumPy ; les `count` premiers slots sont occupés."""
+
+    def __init__(self, capacity=256, radius=4, max_bounces=3):
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("ShellPool nécessite NumPy")
+        self.radius = radius
+        self.max_bounces = max_bounces
+        self.count = 0
+        self._obstacles_key = None
+        self._alloc(capacity)
+
+    def _alloc(self, capacity):
+        old = self.__dict__.get("x")
+        n = self.count
+        fields = {"x": np.float64, "y": np.float64, "vx": np.float64, "vy": np.float64,
+                  "bounces": np.int16, "owner": np.int64, "ids": np.int64, "active": np.bool_}
+        for name, dtype in fields.items():
+            array = np.zeros(capacity, dtype)
+            if old is not None:
+                array[:n] = getattr(self, name)[:n]
+            setattr(self, name, array)
+
+    def __len__(self):
+        return self.count
+
+    # ── Ajout / retrait ─────────────────────────────────────────
+
+    def add(self, x, y, vx, vy, owner, shell_id, bounces=0):
+        if self.count == len(self.x):
+            self._alloc(2 * len(self.x))
+        i = self.count
+        self.x[i], self.y[i], self.vx[i], self.vy[i] = x, y, vx, vy
+        self.bounces[i], self.owner[i], self.ids[i], self.active[i] = bounces, owner, shell_id, True
+        self.count += 1
+
+    def add_shell(self, shell, owner):
+        """Range un Shell (ex. renvoyé par Tank.fire) ; `owner` est un identifiant entier."""
+        self.add(shell.x, shell.y, shell.vx, shell.vy, owner, shell.shell_id, shell.bounces)
+
+    def compact(self):
+        """Retire les shells inactifs en les tassant en tête des tableaux."""
+        n = self.count
+        keep = np.flatnonzero(self.active[:n])
+        if len(keep) == n:
+            return
+        for array in (self.x, self.y, self.vx, self.vy, self.bounces, self.owner, self.ids, self.active):
+            array[:len(keep)] = array[keep]
+        self.count = len(keep)
+
+    def clear(self):
+        self.count = 0
+
+    # ── Physique ────────────────────────────────────────────────
+
+    def _obstacle_arrays(self, bouncing, destroying):
+        """Bords des obstacles en tableaux, recalculés seulement si les listes changent."""
+        key = (id(bouncing), len(bouncing), id(destroying), len(destroying))
+        if key != self._obstacles_key:
+            rects = [(r.left, r.top, r.right, r.bottom, False) for r in bouncing]
+            rects += [(r.left, r.top, r.right, r.bottom, True) for r in destroying]
+            table = np.array([r[:4] for r in rects], np.float64).reshape(-1, 4)
+            self._obstacles = (table[:, 0], table[:, 1], table[:, 2], table[:, 3],
+                               np.array([r[4] for r in rects], np.bool_))
+            self._obstacles_key = key
+        return self._obstacles
+
+    def step(self, bouncing_obstacles=(), destroying_obstacles=()):
+        """Un tick de déplacement balayé pour tout le pool, plusieurs rebonds compris."""
+        n = self.count
+        if not n:
+            return
+        r = float(self.radius)
+        left, top, right, bottom, kills = self._obstacle_arrays(bouncing_obstacles, destroying_obstacles)
+        x, y, vx, vy = self.x[:n], self.y[:n], self.vx[:n], self.vy[:n]
+        bounces, active = self.bounces[:n], self.active[:n]
+        remaining = np.ones(n)
+        pending = np.flatnonzero(active)
+
+        for _ in range(self.max_bounces + 2):
+            if not len(pending):
+                break
+            px, py = x[pending], y[pending]
+            dx, dy = vx[pending] * remaining[pending], vy[pending] * remaining[pending]
+            k = len(pending)
+            t_hit = np.full(k, np.inf)
+            nx, ny = np.zeros(k), np.zeros(k)
+            destroy = np.zeros(k, np.bool_)
+
+            # Bords de la map (demi-plans)
+            for dist, speed, bnx, bny in ((px - r, -dx, 1.0, 0.0), (MAP_WIDTH - r - px, dx, -1.0, 0.0),
+                                          (py - r, -dy, 0.0, 1.0), (MAP_HEIGHT - r - py, dy, 0.0, -1.0)):
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    t = np.maximum(0.0, dist / speed)
+                better = (speed > 0) & (t <= 1.0) & (t < t_hit)
+                t_hit = np.where(better, t, t_hit)
+                nx = np.where(better, bnx, nx)
+                ny = np.where(better, bny, ny)
+
+            # Obstacles : phase large (boîtes balayées), puis temps d'impact exact par paire
+            if len(left):
+                x0 = np.minimum(px, px + dx) - r
+                x1 = np.maximum(px, px + dx) + r
+                y0 = np.minimum(py, py + dy) - r
+                y1 = np.maximum(py, py + dy) + r
+                near = ((right >= x0[:, None]) & (left <= x1[:, None])
+                        & (bottom >= y0[:, None]) & (top <= y1[:, None]))
+                rows, cols = np.nonzero(near)
+                if len(rows):
+                    t, pnx, pny = _sweep_pairs(px[rows], py[rows], dx[rows], dy[rows], r,
+                                               left[cols], top[cols], right[cols], bottom[cols])
+                    # Premier impact par shell (à égalité, l'obstacle inséré en premier)
+                    order = np.lexsort((cols, t, rows))
+                    rows, t, pnx, pny, cols = rows[order], t[order], pnx[order], pny[order], cols[order]
+                    first = np.flatnonzero(np.r_[True, rows[1:] != rows[:-1]])
+                    rows, t = rows[first], t[first]
+                    better = t < t_hit[rows]
+                    rows = rows[better]
+                    t_hit[rows] = t[better]
+                    nx[rows] = pnx[first][better]
+                    ny[rows] = pny[first][better]
+                    destroy[rows] = kills[cols[first][better]]
+
+            hit = np.isfinite(t_hit)
+            free = pending[~hit]
+            x[free] += dx[~hit]
+            y[free] += dy[~hit]
+
+            idx = pending[hit]
+            t, nx, ny = t_hit[hit], nx[hit], ny[hit]
+            x[idx] = px[hit] + dx[hit] * t + nx * SWEEP_EPSILON
+            y[idx] = py[hit] + dy[hit] * t + ny * SWEEP_EPSILON
+            remaining[idx] *= 1.0 - t
+
+            # Réflexion v' = v - 2 (v·n) n, ou destruction (eau, rebonds épuisés)
+            dies = destroy[hit] | (bounces[idx] >= self.max_bounces)
+            active[idx[dies]] = False
+            alive, nx, ny = idx[~dies], nx[~dies], ny[~dies]
+            dot = vx[alive] * nx + vy[alive] * ny
+            vx[alive] -= 2 * dot * nx
+            vy[alive] -= 2 * dot * ny
+            bounces[alive] += 1
+            pending = alive[remaining[alive] > 0]
+
+    def hit_tanks(self, tanks, keys):
+        """Shells touchant un tank (friendly fire seulement après ≥1 rebond).
+
+        `keys[i]` identifie le propriétaire du tank `tanks[i]` (même espace que
+        `owner`). Les shells qui touchent sont désactivés. Retourne une liste
+        de (indice du tank, propriétaire du shell, id du shell).
+        Paires candidates : toutes si peu de tanks, sinon sweep and prune sur x.
+        """
+        n = self.count
+        if not n or not tanks:
+            return []
+        cx = np.array([t.x + t.width / 2 for t in tanks])
+        cy = np.array([t.y + t.height / 2 for t in tanks])
+        reach = np.array([max(t.width, t.height) / 2 for t in tanks]) + self.radius
+        keys = np.asarray(keys, np.int64)
+        live = np.flatnonzero(self.active[:n])
+        if len(tanks) < BROADPHASE_MIN_TANKS:
+            # Peu de tanks : matrice dense shells x tanks
+            shells = np.repeat(live, len(tanks))
+            victims = np.tile(np.arange(len(tanks)), len(live))
+        else:
+            shells, victims = _tank_pairs(self.x[live], live, cx, reach.max())
+
+        dx = self.x[shells] - cx[victims]
+        dy = self.y[shells] - cy[victims]
+        touch = dx * dx + dy * dy < reach[victims] * reach[victims]
+        touch &= ~((self.owner[shells] == keys[victims]) & (self.bounces[shells] == 0))
+        shells, victims = shells[touch], victims[touch]
+        if not len(shells):
+            return []
+        # Premier tank touché (ordre de `tanks`) par shell
+        order = np.lexsort((victims, shells))
+        shells, victims = shells[order], victims[order]
+        first = np.r_[True, shells[1:] != shells[:-1]]
+        shells, victims = shells[first], victims[first]
+        self.active[shells] = False
+        return list(zip(victims.tolist(), self.owner[shells].tolist(), self.ids[shells].tolist()))
+
+    # ── Export ──────────────────────────────────────────────────
+
+    def rows(self):
+        """(id, x, y, vx, vy, bounces) des shells actifs, en types Python."""
+        n = self.count
+        live = np.flatnonzero(self.active[:n])
+        return zip(self.ids[live].tolist(), self.x[live].tolist(), self.y[live].tolist(),
+                   self.vx[live].tolist(), self.vy[live].tolist(), self.bounces[live].tolist())
+
+    def draw(self, screen, camera_x, camera_y):
+        from Game.Rendering.Entity_Renderer import EntityRenderer
+        return EntityRenderer.draw_shell_pool(screen, self, camera_x, camera_y)
@@ -1,28 +1,35 @@
-import pygame
 import math
+from Config import SIM_HZ, TANK_SPEED, FIRE_DELAY, RELOAD_TIME
+from Game.Interpolation import lerp, lerp_angle
 
 class Tank:
+    __slots__ = ("x", "y", "width", "height", "color", "speed", "hull_angle", "turret_angle",
+                 "health", "mag_size", "ammo", "fire_cooldown", "fire_delay",
+                 "reloading", "reload_cooldown", "reload_time", "prev_pose")
+
     def __init__(self, x, y, color):
         self.x = x
         self.y = y
         self.width = 40
         self.height = 40
         self.color = color
-        self.speed = 4
+        self.speed = TANK_SPEED / SIM_HZ     # px par pas de simulation
         self.hull_angle = 0      # Angle du châssis (déplacement)
         self.turret_angle = 0    # Angle de la tourelle (souris)
 
         self.health = 100
 
-        # Chargeur : 3 balles, 0.5s entre chaque tir, 2s de reload
+        # Chargeur : 3 balles, 0.5s entre chaque tir, 2s de reload (comptés en pas de simulation)
         self.mag_size = 3
         self.ammo = self.mag_size
         self.fire_cooldown = 0
-        self.fire_delay = 30        # ~0.5s @ 60 FPS
+        self.fire_delay = round(FIRE_DELAY * SIM_HZ)
 
         self.reloading = False
         self.reload_cooldown = 0
-        self.reload_time = 120      # ~2s @ 60 FPS
+        self.reload_time = round(RELOAD_TIME * SIM_HZ)
+
+        self.prev_pose = None    # pose avant le dernier pas (interpolation du rendu)
 
     def aim_at_mouse(self, mouse_x, mouse_y, camera_x, camera_y):
         """Oriente la tourelle vers le curseur (indépendamment du châssis)."""
@@ -32,8 +39,20 @@ class Tank:
         dy = (mouse_y + camera_y) - tank_cy
         self.turret_angle = math.degrees(math.atan2(dy, dx)) + 90
 
+    def save_pose(self):
+        """Mémorise la pose courante, à appeler avant chaque pas de simulation."""
+        self.prev_pose = (self.x, self.y, self.hull_angle, self.turret_angle)
+
+    def render_pose(self, alpha=1.0):
+        """(x, y, châssis, tourelle) entre le pas précédent (0) et le courant (1)."""
+        if self.prev_pose is None or alpha >= 1.0:
+            return self.x, self.y, self.hull_angle, self.turret_angle
+        x, y, hull, turret = self.prev_pose
+        return (lerp(x, self.x, alpha), lerp(y, self.y, alpha),
+                lerp_angle(hull, self.hull_angle, alpha), lerp_angle(turret, self.turret_angle, alpha))
+
     def update(self):
-        """Tick : cooldown de tir + progression du rechargement."""
+        """Pas de simulation : cooldown de tir + progression du rechargement."""
         if self.fire_cooldown > 0:
             self.fire_cooldown -= 1
 
@@ -57,8 +76,11 @@ class Tank:
     def can_fire(self):
         return self.fire_cooldown == 0 and self.ammo > 0 and not self.reloading
 
-    def fire(self):
-        """Tire un projectile depuis le bout du canon (tourelle). Retourne un Shell ou None."""
+    def fire(self, shell_id=None):
+        """Tire un projectile depuis le bout du canon (tourelle). Retourne un Shell ou None.
+
+        `shell_id` : identifiant alloué par la simulation (compteur global sinon).
+        """
         if not self.can_fire():
             return None
 
@@ -78,69 +100,9 @@ class Tank:
             self.reloading = True
             self.reload_cooldown = self.reload_time
 
-        return Shell(start_x, start_y, self.turret_angle, self)
-
-    def draw(self, screen, camera_x, camera_y):
-        sx = self.x - camera_x
-        sy = self.y - camera_y
-        cx = sx + self.width // 2
-        cy = sy + self.height // 2
-
-        body_color = self.color
-        body_dark = tuple(max(0, c - 40) for c in self.color)
-        tread_color = (40, 40, 40)
-
-        # ===== CHÂSSIS (hull) avec rotation hull_angle =====
-        hull_surface = pygame.Surface((self.width + 10, self.height + 10), pygame.SRCALPHA)
-        offset = 5
-
-        # Corps principal
-        pygame.draw.rect(hull_surface, body_color, (offset, offset, self.width, self.height))
-        pygame.draw.rect(hull_surface, body_dark, (offset, offset, self.width, self.height), 2)
-
-        # Chenilles gauche/droite
-        pygame.draw.rect(hull_surface, tread_color, (offset - 4, offset, 4, self.height))
-        pygame.draw.rect(hull_surface, (20, 20, 20), (offset - 4, offset, 4, self.height), 1)
-        pygame.draw.rect(hull_surface, tread_color, (offset + self.width, offset, 4, self.height))
-        pygame.draw.rect(hull_surface, (20, 20, 20), (offset + self.width, offset, 4, self.height), 1)
-
-        rotated_hull = pygame.transform.rotate(hull_surface, -self.hull_angle)
-        hull_rect = rotated_hull.get_rect(center=(cx, cy))
-        screen.blit(rotated_hull, hull_rect.topleft)
-
-        # ===== TOURELLE (turret) avec rotation turret_angle =====
-        turret_surface = pygame.Surface((60, 60), pygame.SRCALPHA)
-        t_center = 30
-
-        # Tourelle circulaire
-        pygame.draw.circle(turret_surface, body_color, (t_center, t_center), 12)
-        pygame.draw.circle(turret_surface, body_dark, (t_center, t_center), 12, 2)
-        # Écoutille
-        pygame.draw.circle(turret_surface, tuple(min(255, c + 60) for c in body_color), (t_center, t_center), 4)
-
-        # Canon (vers le haut de la surface non-tournée)
-        barrel_length = 28
-        barrel_end_y = t_center - barrel_length
-        pygame.draw.line(turret_surface, (200, 200, 200), (t_center, t_center), (t_center, barrel_end_y), 5)
-        pygame.draw.line(turret_surface, (100, 100, 100), (t_center, t_center), (t_center, barrel_end_y), 2)
-        pygame.draw.circle(turret_surface, (150, 150, 150), (t_center, int(barrel_end_y)), 4)
-        pygame.draw.circle(turret_surface, (80, 80, 80), (t_center, int(barrel_end_y)), 4, 1)
-
-        rotated_turret = pygame.transform.rotate(turret_surface, -self.turret_angle)
-        turret_rect = rotated_turret.get_rect(center=(cx, cy))
-        screen.blit(rotated_turret, turret_rect.topleft)
-
-        # ===== BARRE DE SANTÉ (non-tournée) =====
-        health_ratio = max(0, self.health / 100.0)
-        hb_x, hb_y = sx, sy - 8
-        hb_w, hb_h = self.width, 5
-        pygame.draw.rect(screen, (50, 50, 50), (hb_x, hb_y, hb_w, hb_h))
-        if health_ratio > 0.5:
-            hc = (0, 255, 0)
-        elif health_ratio > 0.25:
-            hc = (255, 200, 0)
-        else:
-            hc = (255, 0, 0)
-        pygame.draw.rect(screen, hc, (hb_x, hb_y, hb_w * health_ratio, hb_h))
-        pygame.draw.rect(screen, (255, 255, 255), (hb_x, hb_y, hb_w, hb_h), 1)
+        return Shell(start_x, start_y, self.turret_angle, self, shell_id)
 
+    def draw(self, screen, camera_x, camera_y, alpha=1.0):
+        """Rendu délégué à la couche Rendering (pygame importé seulement à l'affichage)."""
+        from Game.Rendering.Entity_Renderer import EntityRenderer
+        return EntityRenderer.draw_tank(screen, self, camera_x, camera_y, alpha)
@@ -1,14 +1,19 @@
-import pygame
+from Game.Core.Geometry import Rect, entity_rect
+from Game.Collisions.Spatial_Grid import nearby
 
 
 class MapCollisions:
-    """Collisions entre entités et obstacles de la map."""
+    """Collisions entre entités et obstacles de la map.
+
+    `obstacles` est une liste de rects ou une SpatialGrid (GameMap) : avec une
+    grille, seuls les obstacles des cellules voisines sont testés.
+    """
 
     @staticmethod
     def check_tank_collision(tank, obstacles):
         """Retourne le premier obstacle en collision avec le tank, ou None."""
-        tank_rect = pygame.Rect(tank.x, tank.y, tank.width, tank.height)
-        for obs in obstacles:
+        tank_rect = entity_rect(tank)
+        for obs in nearby(obstacles, tank_rect):
             if tank_rect.colliderect(obs):
                 return obs
         return None
@@ -16,11 +21,11 @@ class MapCollisions:
     @staticmethod
     def check_shell_collision(shell, obstacles):
         """Retourne {'obstacle': Rect, 'side': str} si le shell touche un obstacle."""
-        shell_rect = pygame.Rect(
+        shell_rect = Rect(
             shell.x - shell.radius, shell.y - shell.radius,
             shell.radius * 2, shell.radius * 2
         )
-        for obs in obstacles:
+        for obs in nearby(obstacles, shell_rect):
             if shell_rect.colliderect(obs):
                 side = MapCollisions._get_collision_side(shell, obs)
                 return {'obstacle': obs, 'side': side}
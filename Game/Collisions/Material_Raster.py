@@ -0,0 +1,156 @@
+"""Raster de matériaux de la map, précalculé au chargement.
+
+La map est découpée en cellules de `cell_size` px. Chaque cellule garde le
+matériau sous son centre (`cells`, une lecture par requête ponctuelle) et
+deux masques de bits par matériau : présent dans la cellule (`cover`) ou la
+couvrant entièrement (`full`). Une table de sommes préfixées par masque dit
+en quatre lectures si une boîte peut toucher un matériau (`touches`).
+
+Pour une taille d'entité donnée (tank), `footprint_state` va plus loin : un
+état par cellule pour toutes les positions du coin haut-gauche dans cette
+cellule (libre / bloqué / à vérifier), soit une seule lecture par requête.
+"""
+
+import math
+from array import array
+from itertools import accumulate
+
+FREE, BLOCKED, MIXED = range(3)     # états d'une cellule de footprint
+
+# Matériaux (codes des cellules) ; le masque d'un matériau est 1 << code
+GRASS, SAND, DIRT, WATER, ROCK = range(5)
+
+RASTER_CELL = 8     # px
+
+
+def mask(*materials):
+    """Masque de bits regroupant plusieurs matériaux."""
+    m = 0
+    for material in materials:
+        m |= 1 << material
+    return m
+
+
+class MaterialRaster:
+    """Grille de matériaux figée, construite une fois depuis les zones de la map."""
+
+    def __init__(self, width, height, layers, cell_size=RASTER_CELL):
+        """`layers` : [(matériau, rects)] dans l'ordre de dessin, le dernier l'emporte."""
+        self.cell_size = cell_size
+        self.cols = -(-width // cell_size)
+        self.rows = -(-height // cell_size)
+        n = self.cols * self.rows
+        self.cells = bytearray(n)       # GRASS = 0 par défaut
+        self.cover = bytearray(n)
+        self.full = bytearray(n)
+        self._sums = {}                 # (plan, masque) → sommes préfixées
+        self._footprints = {}           # (largeur, hauteur, masque) → états par cellule
+
+        cs, cols = cell_size, self.cols
+        for material, rects in layers:
+            bit = 1 << material
+            for rect in rects:
+                x0, x1 = self._touched(rect.left, rect.right, self.cols)
+                y0, y1 = self._touched(rect.top, rect.bottom, self.rows)
+                for cy in range(y0, y1 + 1):
+                    for i in range(cy * cols + x0, cy * cols + x1 + 1):
+                        self.cover[i] |= bit
+                x0, x1 = self._inside(rect.left, rect.right, self.cols)
+                y0, y1 = self._inside(rect.top, rect.bottom, self.rows)
+                for cy in range(y0, y1 + 1):
+                    for i in range(cy * cols + x0, cy * cols + x1 + 1):
+                        self.full[i] |= bit
+                # Cellules dont le centre est dans le rect
+                x0 = max(0, math.ceil(rect.left / cs - 0.5))
+                x1 = min(self.cols, math.ceil(rect.right / cs - 0.5)) - 1
+                y0 = max(0, math.ceil(rect.top / cs - 0.5))
+                y1 = min(self.rows, math.ceil(rect.bottom / cs - 0.5)) - 1
+                for cy in range(y0, y1 + 1):
+                    for i in range(cy * cols + x0, cy * cols + x1 + 1):
+                        self.cells[i] = material
+
+    def _touched(self, lo, hi, n):
+        """Cellules dont l'intérieur coupe ]lo, hi[ (bornes incluses, éventuellement vide)."""
+        cs = self.cell_size
+        return max(0, int(lo // cs)), min(n - 1, math.ceil(hi / cs) - 1)
+
+    def _inside(self, lo, hi, n):
+        """Cellules entièrement comprises dans [lo, hi]."""
+        cs = self.cell_size
+        return max(0, math.ceil(lo / cs)), min(n - 1, math.floor(hi / cs) - 1)
+
+    def material_at(self, x, y):
+        """Matériau sous le point (x, y) : une lecture, herbe hors de la map."""
+        cx, cy = int(x // self.cell_size), int(y // self.cell_size)
+        if 0 <= cx < self.cols and 0 <= cy < self.rows:
+            return self.cells[cy * self.cols + cx]
+        return GRASS
+
+    def _table(self, plane, bits):
+        key = (plane is self.full, bits)
+        table = self._sums.get(key)
+        if table is None:
+            cols = self.cols
+            prev = [0] * (cols + 1)
+            table = array("i", prev)
+            for cy in range(self.rows):
+                row = accumulate((1 if v & bits else 0 for v in plane[cy * cols:(cy + 1) * cols]), initial=0)
+                prev = [a + b for a, b in zip(row, prev)]
+                table.extend(prev)
+            self._sums[key] = table
+        return table
+
+    def touches(self, left, top, right, bottom, bits):
+        """False si la boîte ne touche sûrement aucun matériau de `bits`."""
+        cs = self.cell_size
+        x0, x1 = max(0, int(left // cs)), min(self.cols, math.ceil(right / cs))
+        y0, y1 = max(0, int(top // cs)), min(self.rows, math.ceil(bottom / cs))
+        if x0 >= x1 or y0 >= y1:
+            return False
+        table, w = self._sums.get((False, bits)) or self._table(self.cover, bits), self.cols + 1
+        return table[y1 * w + x1] - table[y0 * w + x1] - table[y1 * w + x0] + table[y0 * w + x0] > 0
+
+    def footprint_state(self, x, y, width, height, bits):
+        """FREE / BLOCKED / MIXED pour une boîte width x height de coin haut-gauche (x, y).
+
+        MIXED : un bord d'obstacle passe à portée, le test exact tranche.
+        """
+        states = self._footprints.get((width, height, bits)) or self.prepare_footprint(width, height, bits)
+        cx, cy = int(x // self.cell_size), int(y // self.cell_size)
+        if 0 <= cx < self.cols and 0 <= cy < self.rows:
+            return states[cy * self.cols + cx]
+        return MIXED
+
+    def prepare_footprint(self, width, height, bits):
+        """Calcule (une fois) les états de footprint ; à appeler au chargement de la map."""
+        key = (width, height, bits)
+        if key not in self._footprints:
+            self._footprints[key] = self._build_footprint(width, height, bits)
+        return self._footprints[key]
+
+    def _build_footprint(self, width, height, bits):
+        """Sommes préfixées lues ligne par ligne : positions alignées sur les cellules."""
+        cs, cols, rows = self.cell_size, self.cols, self.rows
+        w = cols + 1
+        cover, full = self._table(self.cover, bits), self._table(self.full, bits)
+        # Union des boîtes possibles : cellules [c, c + kx] ; intersection : [c + 1, c + fx - 1]
+        kx, ky = math.ceil(width / cs), math.ceil(height / cs)
+        fx, fy = math.floor(width / cs), math.floor(height / cs)
+        states = bytearray(cols * rows)
+        for cy in range(rows):
+            # Sommes par colonne sur les lignes de l'union, puis fenêtre de kx + 1 colonnes
+            y1 = min(rows, cy + ky + 1)
+            d = [a - b for a, b in zip(cover[y1 * w:(y1 + 1) * w], cover[cy * w:(cy + 1) * w])]
+            near = [d[min(cols, cx + kx + 1)] - d[cx] for cx in range(cols)]
+            if not any(near):
+                continue        # rien à portée sur toute la ligne → libre
+            iy0, iy1 = cy + 1, min(rows, cy + fy)
+            f = [a - b for a, b in zip(full[iy1 * w:(iy1 + 1) * w], full[iy0 * w:(iy0 + 1) * w])] \
+                if iy0 < iy1 else None
+            for cx, n in enumerate(near):
+                if n:
+                    ix1 = min(cols, cx + fx)
+                    # Cellule pleine sous toutes les positions → bloqué, sinon à vérifier
+                    blocked = f is not None and cx + 1 < ix1 and f[ix1] - f[cx + 1]
+                    states[cy * cols + cx] = BLOCKED if blocked else MIXED
+        return states
@@ -1,18 +1,187 @@
 import math
+from bisect import bisect_left, bisect_right
+from Config import MAP_WIDTH, MAP_HEIGHT
+
+SWEEP_EPSILON = 1e-3    # px — écart laissé entre le shell et la surface touchée
+BROADPHASE_MIN_TANKS = 4    # en dessous, tester chaque paire coûte moins que trier
+
+
+def _ray_box(px, py, dx, dy, left, top, right, bottom):
+    """Entrée du segment p + t·d (t ∈ [0, 1]) dans une boîte : (t, nx, ny) ou None.
+
+    None aussi si p est déjà dans la boîte (géré à part, voir _overlap_normal).
+    """
+    t_enter, t_exit = 0.0, 1.0
+    nx = ny = 0.0
+    if dx:
+        t0, t1 = (left - px) / dx, (right - px) / dx
+        n = -1.0 if dx > 0 else 1.0
+        if t0 > t1:
+            t0, t1 = t1, t0
+        if t0 > t_enter:
+            t_enter, nx, ny = t0, n, 0.0
+        t_exit = min(t_exit, t1)
+    elif not left < px < right:
+        return None
+    if dy:
+        t0, t1 = (top - py) / dy, (bottom - py) / dy
+        n = -1.0 if dy > 0 else 1.0
+        if t0 > t1:
+            t0, t1 = t1, t0
+        if t0 > t_enter:
+            t_enter, nx, ny = t0, 0.0, n
+        t_exit = min(t_exit, t1)
+    elif not top < py < bottom:
+        return None
+    if t_enter > t_exit or (nx == 0.0 and ny == 0.0):
+        return None
+    return t_enter, nx, ny
+
+
+def _ray_circle(px, py, dx, dy, cx, cy, r):
+    """Premier contact du segment p + t·d avec le cercle (c, r) : (t, nx, ny) ou None."""
+    fx, fy = px - cx, py - cy
+    a = dx * dx + dy * dy
+    b = fx * dx + fy * dy
+    c = fx * fx + fy * fy - r * r
+    if b >= 0 or a == 0:     # s'éloigne (ou immobile)
+        return None
+    disc = b * b - a * c
+    if disc < 0:
+        return None
+    t = (-b - math.sqrt(disc)) / a
+    if not 0.0 <= t <= 1.0:
+        return None
+    return t, (fx + dx * t) / r, (fy + dy * t) / r
+
+
+def _sweep_rect(px, py, dx, dy, r, rect):
+    """Temps d'impact exact d'un cercle (rayon r) contre un rect : (t, nx, ny) ou None.
+
+    Somme de Minkowski : le centre du cercle heurte le rect arrondi de r,
+    soit deux boîtes élargies (faces) et quatre cercles (coins).
+    """
+    left, top, right, bottom = rect.left, rect.top, rect.right, rect.bottom
+    best = None
+    for hit in (_ray_box(px, py, dx, dy, left - r, top, right + r, bottom),
+                _ray_box(px, py, dx, dy, left, top - r, right, bottom + r),
+                _ray_circle(px, py, dx, dy, left, top, r),
+                _ray_circle(px, py, dx, dy, right, top, r),
+                _ray_circle(px, py, dx, dy, left, bottom, r),
+                _ray_circle(px, py, dx, dy, right, bottom, r)):
+        if hit is not None and (best is None or hit[0] < best[0]):
+            best = hit
+    return best
+
+
+def _overlap_normal(px, py, r, rect):
+    """Normale de sortie si le cercle chevauche déjà le rect, sinon None."""
+    qx = min(max(px, rect.left), rect.right)
+    qy = min(max(py, rect.top), rect.bottom)
+    ox, oy = px - qx, py - qy
+    d2 = ox * ox + oy * oy
+    if d2 >= r * r:
+        return None
+    if d2 > 0:
+        d = math.sqrt(d2)
+        return ox / d, oy / d
+    # Centre dans le rect : sortie par la face la plus proche
+    faces = ((px - rect.left, -1.0, 0.0), (rect.right - px, 1.0, 0.0),
+             (py - rect.top, 0.0, -1.0), (rect.bottom - py, 0.0, 1.0))
+    _, nx, ny = min(faces)
+    return nx, ny
+
+
+def _sweep_borders(px, py, dx, dy, r):
+    """Impact avec les bords de la map (demi-plans) : (t, nx, ny) ou None."""
+    best = None
+    for dist, speed, nx, ny in ((px - r, -dx, 1.0, 0.0), (MAP_WIDTH - r - px, dx, -1.0, 0.0),
+                                (py - r, -dy, 0.0, 1.0), (MAP_HEIGHT - r - py, dy, 0.0, -1.0)):
+        if speed > 0:
+            t = max(0.0, dist / speed)
+            if t <= 1.0 and (best is None or t < best[0]):
+                best = (t, nx, ny)
+    return best
+
+
+def _candidates(obstacles, left, top, right, bottom):
+    query = getattr(obstacles, "query_box", None)
+    return query(left, top, right, bottom) if query else obstacles
 
 
 class ShellCollisions:
     """Gestion des collisions projectile ↔ obstacles / tanks."""
 
+    @staticmethod
+    def sweep(shell, bouncing_obstacles, destroying_obstacles=(), game_map=None):
+        """Déplace le shell d'un tick avec collision continue (balayée).
+
+        Le temps d'impact exact est calculé contre les obstacles et les bords ;
+        la vitesse est réfléchie selon la normale au point de contact et le
+        reste du déplacement est poursuivi, plusieurs rebonds par tick compris.
+        Plus d'effet tunnel à travers les murs fins, quel que soit la vitesse.
+        Avec `game_map`, son raster de matériaux règle d'une lecture les
+        trajets en terrain dégagé, sans bords ni obstacles à tester.
+        """
+        if not shell.active:
+            return
+        r = shell.radius
+        remaining = 1.0
+        for _ in range(shell.max_bounces + 2):
+            px, py = shell.x, shell.y
+            dx, dy = shell.vx * remaining, shell.vy * remaining
+            box = (min(px, px + dx) - r, min(py, py + dy) - r,
+                   max(px, px + dx) + r, max(py, py + dy) + r)
+
+            if (game_map is not None and box[0] > 0 and box[1] > 0
+                    and box[2] < MAP_WIDTH and box[3] < MAP_HEIGHT
+                    and not game_map.shell_obstacles_near(*box)):
+                # Terrain dégagé loin des bords : une lecture du raster suffit
+                shell.x, shell.y = px + dx, py + dy
+                return
+
+            hit, destroy = _sweep_borders(px, py, dx, dy, r), False
+            for obstacles, kills in ((bouncing_obstacles, False), (destroying_obstacles, True)):
+                for rect in _candidates(obstacles, *box):
+                    if rect.right < box[0] or rect.left > box[2] or rect.bottom < box[1] or rect.top > box[3]:
+                        continue
+                    normal = _overlap_normal(px, py, r, rect)
+                    if normal is not None:
+                        # Déjà en contact (tir à bout portant) : rebond immédiat s'il s'enfonce
+                        if dx * normal[0] + dy * normal[1] < 0:
+                            candidate = (0.0,) + normal
+                        else:
+                            continue
+                    else:
+                        candidate = _sweep_rect(px, py, dx, dy, r, rect)
+                    if candidate is not None and (hit is None or candidate[0] < hit[0]):
+                        hit, destroy = candidate, kills
+
+            if hit is None:
+                shell.x, shell.y = px + dx, py + dy
+                return
+            t, nx, ny = hit
+            shell.x = px + dx * t + nx * SWEEP_EPSILON
+            shell.y = py + dy * t + ny * SWEEP_EPSILON
+            remaining *= 1.0 - t
+            if destroy or not shell.reflect(nx, ny):
+                shell.active = False
+                return
+            if remaining <= 0.0:
+                return
+
     @staticmethod
     def check_all_collisions(shells, bouncing_obstacles, destroying_obstacles, tanks=None):
-        """Teste toutes les collisions pour une liste de projectiles.
+        """Teste toutes les collisions pour une liste de projectiles (test discret).
 
         Retourne {'shells_to_remove': [...], 'tanks_hit': [(tank, shell), ...]}.
+        Les boucles de jeu déplacent les shells avec sweep() puis n'appellent
+        que check_tank_hits() ; ce chemin reste la référence du benchmark.
         """
         from Game.Collisions.Map_Collisions import MapCollisions
 
         result = {'shells_to_remove': [], 'tanks_hit': []}
+        remaining = []
 
         for shell in shells:
             # Eau → destruction immédiate
@@ -41,19 +210,59 @@ class ShellCollisions:
                     shell.y = obs.bottom + shell.radius + 1
                 continue
 
-            # Tanks → dégâts (friendly fire seulement après ≥1 rebond)
-            if tanks:
-                for tank in tanks:
-                    if ShellCollisions._shell_hits_tank(shell, tank):
-                        if shell.owner == tank and shell.bounces == 0:
-                            continue
-                        shell.active = False
-                        result['shells_to_remove'].append(shell)
-                        result['tanks_hit'].append((tank, shell))
-                        break
+            remaining.append(shell)
 
+        if tanks:
+            hits = ShellCollisions.check_tank_hits(remaining, tanks)
+            result['shells_to_remove'] += hits['shells_to_remove']
+            result['tanks_hit'] = hits['tanks_hit']
         return result
 
+    @staticmethod
+    def check_tank_hits(shells, tanks):
+        """Tanks → dégâts (friendly fire seulement après ≥1 rebond). Même format de retour.
+
+        À partir de BROADPHASE_MIN_TANKS tanks, phase large « sweep and prune »
+        sur x : seuls les tanks dont le centre est à portée du shell en x
+        (recherche dichotomique dans les centres triés) passent au test exact.
+        """
+        result = {'shells_to_remove': [], 'tanks_hit': []}
+        broadphase = None
+        if len(tanks) >= BROADPHASE_MIN_TANKS:
+            broadphase = ShellCollisions._tank_broadphase(tanks)
+        for shell in shells:
+            if not shell.active:
+                continue
+            for tank in (broadphase(shell) if broadphase else tanks):
+                if ShellCollisions._shell_hits_tank(shell, tank):
+                    if shell.owner == tank and shell.bounces == 0:
+                        continue
+                    shell.active = False
+                    result['shells_to_remove'].append(shell)
+                    result['tanks_hit'].append((tank, shell))
+                    break
+        return result
+
+    @staticmethod
+    def _tank_broadphase(tanks):
+        """Trie les tanks par centre x une fois par tick ; retourne shell → tanks candidats.
+
+        Les candidats gardent l'ordre de `tanks` : le premier tank touché reste
+        le même qu'avec le parcours complet.
+        """
+        centers = sorted((t.x + t.width / 2, i) for i, t in enumerate(tanks))
+        xs = [cx for cx, _ in centers]
+        half = max(max(t.width, t.height) for t in tanks) / 2
+
+        def candidates(shell):
+            reach = half + shell.radius
+            lo = bisect_left(xs, shell.x - reach)
+            hi = bisect_right(xs, shell.x + reach, lo)
+            if hi - lo == 1:
+                return (tanks[centers[lo][1]],)
+            return [tanks[i] for i in sorted(centers[k][1] for k in range(lo, hi))]
+        return candidates
+
     @staticmethod
     def _shell_hits_tank(shell, tank):
         """Collision cercle (shell) vs cercle englobant (tank)."""
@@ -0,0 +1,72 @@
+"""Index spatial en grille uniforme pour les obstacles statiques de la map.
+
+Grille « lâche » : chaque cellule référence les rects qui touchent sa zone
+étendue de `margin` px vers la droite et le bas. Une requête plus petite que
+`margin` (tank, shell, power-up) ne lit donc qu'une seule cellule, celle de
+son coin haut-gauche ; les plus grandes fusionnent les cellules couvertes.
+Le coût d'une collision ne dépend plus du nombre total d'obstacles ni de la
+taille de la map.
+
+La grille s'itère comme la liste d'origine (ordre d'insertion) : elle peut
+remplacer une liste d'obstacles partout où l'on attend un itérable.
+"""
+
+CELL_SIZE = 128     # px
+MARGIN = 64         # px — plus grande requête servie par une seule cellule
+
+
+class SpatialGrid:
+    """Grille uniforme de rects statiques, construite une fois au chargement."""
+
+    def __init__(self, rects=(), cell_size=CELL_SIZE, margin=MARGIN):
+        self.cell_size = cell_size
+        self.margin = margin
+        self._rects = []
+        self._index = {}        # id(rect) → ordre d'insertion
+        self._cells = {}        # (cx, cy) → [rects], en ordre d'insertion
+        for rect in rects:
+            self.insert(rect)
+
+    def __iter__(self):
+        return iter(self._rects)
+
+    def __len__(self):
+        return len(self._rects)
+
+    def insert(self, rect):
+        self._index[id(rect)] = len(self._rects)
+        self._rects.append(rect)
+        cs = self.cell_size
+        # Cellules dont la zone [c*cs, (c+1)*cs + margin) touche le rect
+        x0, y0 = (rect.left - self.margin) // cs, (rect.top - self.margin) // cs
+        x1, y1 = (rect.right - 1) // cs, (rect.bottom - 1) // cs
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                self._cells.setdefault((cx, cy), []).append(rect)
+
+    def query(self, rect):
+        """Obstacles candidats pour `rect` (sur-ensemble des collisions, ordre d'insertion)."""
+        return self.query_box(rect.left, rect.top, rect.right, rect.bottom)
+
+    def query_box(self, left, top, right, bottom):
+        """Comme query, pour une boîte en flottants (shells, segments balayés)."""
+        cs = self.cell_size
+        x0, y0 = int(left // cs), int(top // cs)
+        if right - left <= self.margin and bottom - top <= self.margin:
+            return self._cells.get((x0, y0), ())
+
+        cells = self._cells
+        buckets = [b for b in (cells.get((cx, cy)) for cx in range(x0, int(right // cs) + 1)
+                               for cy in range(y0, int(bottom // cs) + 1)) if b]
+        if len(buckets) < 2:
+            return buckets[0] if buckets else ()
+        index = self._index
+        found = {index[id(r)]: r for b in buckets for r in b}
+        return [found[i] for i in sorted(found)]
+
+
+def nearby(obstacles, rect):
+    """Candidats d'`obstacles` proches de `rect` : requête si c'est une grille, sinon tout."""
+    if isinstance(obstacles, SpatialGrid):
+        return obstacles.query(rect)
+    return obstacles
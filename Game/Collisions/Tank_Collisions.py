@@ -1,4 +1,4 @@
-import pygame
+from Game.Core.Geometry import entity_rect
 
 class TankCollisions:
     """Gère les collisions entre tanks"""
@@ -14,8 +14,8 @@ class TankCollisions:
         Returns:
             bool: True si collision, False sinon
         """
-        rect1 = pygame.Rect(tank1.x, tank1.y, tank1.width, tank1.height)
-        rect2 = pygame.Rect(tank2.x, tank2.y, tank2.width, tank2.height)
+        rect1 = entity_rect(tank1)
+        rect2 = entity_rect(tank2)
         
         return rect1.colliderect(rect2)
     
@@ -0,0 +1,219 @@
+"""État de partie et règles du jeu, sans affichage ni pygame.
+
+`GameState` simule tanks, projectiles, collisions et power-ups à pas fixe
+(1/SIM_HZ s) à partir des entrées des joueurs :
+    {"move": [dx, dy], "aim": angle, "fire": bool, "reload": bool}
+`fire` et `reload` sont des états maintenus (bouton enfoncé), pas des évènements.
+Son horloge est dérivée du numéro de pas : rien ne dépend du temps réel,
+on peut donc l'avancer aussi vite que le CPU le permet (serveur, bots,
+benchmarks). Le rendu (Game.Rendering) lit cet état sans le modifier.
+
+Déterministe : tous les tirages viennent de la graine de partie, les
+minuteries comptent des pas et les identifiants (shells, power-ups) sont
+alloués par l'état lui-même. Deux états de même graine, nourris des mêmes
+entrées dans le même ordre, restent identiques au bit près (même mode
+shells, objets ou ShellPool) ; `checksum()` permet de le vérifier.
+"""
+
+import math
+import random
+import struct
+import zlib
+from Config import MAP_WIDTH, MAP_HEIGHT, SIM_HZ
+from Game.Core.Geometry import entity_rect
+from Game.Core.Map_Layout import MapLayout
+from Game.Assets.Tank import Tank
+from Game.Assets.Shell_Pool import ShellPool, NUMPY_AVAILABLE
+from Game.Movement.Player_Movement import PlayerMovement
+from Game.Movement.Shell_Movement import ShellMovement
+from Game.Collisions.Shell_Collisions import ShellCollisions
+from Game.Powerups.PowerUp_Manager import PowerUpManager
+
+SHELL_DAMAGE = 25
+RESPAWN_TICKS = 3 * SIM_HZ
+
+PLAYER_COLORS = [
+    (0, 100, 255), (255, 50, 50), (0, 200, 80), (255, 200, 0),
+    (180, 80, 255), (255, 140, 0), (0, 220, 220), (255, 100, 180),
+]
+
+
+class PlayerState:
+    """Joueur de la simulation : son tank, ses dernières entrées, son score."""
+
+    def __init__(self, client_id, tank):
+        self.client_id = client_id
+        self.tank = tank
+        self.move = (0, 0)
+        self.aim = 0.0
+        self.fire = False       # boutons maintenus
+        self.reload = False
+        self.kills = 0
+        self.deaths = 0
+        self.respawn_in = 0
+
+    @property
+    def alive(self):
+        return self.respawn_in == 0
+
+    def apply_input(self, data):
+        """Adopte l'entrée d'un client ; une valeur invalide garde la précédente."""
+        move = data.get("move", (0, 0))
+        if isinstance(move, (list, tuple)) and len(move) == 2 and all(map(_finite, move)):
+            self.move = (max(-1, min(1, int(move[0]))), max(-1, min(1, int(move[1]))))
+        aim = data.get("aim", self.aim)
+        if _finite(aim):
+            self.aim = float(aim)
+        self.fire = bool(data.get("fire"))
+        self.reload = bool(data.get("reload"))
+
+
+def _finite(value):
+    """Nombre fini (ni NaN ni infini) : tout ce qu'accepte la simulation."""
+    if not isinstance(value, (int, float)):
+        return False
+    try:
+        return math.isfinite(value)
+    except OverflowError:       # entier JSON trop grand pour un float
+        return False
+
+
+class GameState:
+    """Partie à N joueurs : avance d'un pas de simulation à chaque step()."""
+
+    def __init__(self, seed=None, use_pool=NUMPY_AVAILABLE):
+        self.rng = random.Random(seed)
+        self.layout = MapLayout()
+        self.solid = self.layout.get_solid_obstacles()
+        self.bouncing = self.layout.get_bouncing_obstacles()
+        self.destroying = self.layout.get_destroying_obstacles()
+        self.powerup_manager = PowerUpManager(self.rng.getrandbits(32))
+        self.players = {}       # id joueur → PlayerState
+        # Shells en tableaux NumPy si disponible, sinon liste d'objets Shell
+        self.shell_pool = ShellPool() if use_pool else None
+        self.shells = []
+        self.next_shell_id = 1
+        self.tick_count = 0
+
+    @property
+    def now_ms(self):
+        """Horloge de simulation, dérivée du numéro de pas."""
+        return self.tick_count * 1000 // SIM_HZ
+
+    # ── Joueurs ─────────────────────────────────────────────────
+
+    def _spawn_point(self, tank):
+        """Position libre (hors obstacles et autres tanks), tirée au hasard."""
+        others = [p.tank for p in self.players.values() if p.tank is not tank]
+        for _ in range(100):
+            tank.x = self.rng.randint(0, MAP_WIDTH - tank.width)
+            tank.y = self.rng.randint(0, MAP_HEIGHT - tank.height)
+            if self.layout.tank_blocked(entity_rect(tank)):
+                continue
+            if any(abs(tank.x - o.x) < 2 * tank.width and abs(tank.y - o.y) < 2 * tank.height
+                   for o in others):
+                continue
+            return
+
+    def add_player(self, client_id):
+        color = PLAYER_COLORS[(client_id - 1) % len(PLAYER_COLORS)]
+        player = PlayerState(client_id, Tank(0, 0, color))
+        self._spawn_point(player.tank)
+        self.players[client_id] = player
+        return player
+
+    def remove_player(self, client_id):
+        player = self.players.pop(client_id, None)
+        if player:
+            self.powerup_manager.forget_tank(player.tank)
+
+    def _respawn(self, player):
+        tank = player.tank
+        tank.health = 100
+        tank.ammo = tank.mag_size
+        tank.reloading = False
+        tank.fire_cooldown = tank.reload_cooldown = 0
+        self._spawn_point(tank)
+
+    # ── Simulation ──────────────────────────────────────────────
+
+    def step(self):
+        """Un pas de simulation. Retourne les impacts [(joueur touché, tireur ou None)]."""
+        alive = []
+        for player in self.players.values():
+            tank = player.tank
+            if not player.alive:
+                player.respawn_in -= 1
+                if player.respawn_in == 0:
+                    self._respawn(player)
+                continue
+
+            PlayerMovement.apply_move(tank, player.move[0], player.move[1], self.solid, self.layout)
+            tank.turret_angle = player.aim
+            tank.update()
+            if player.reload:
+                tank.reload()
+            if player.fire:
+                shell = tank.fire(self.next_shell_id)
+                if shell:
+                    self.next_shell_id += 1
+                    if self.shell_pool is not None:
+                        self.shell_pool.add_shell(shell, player.client_id)
+                    else:
+                        self.shells.append(shell)
+            alive.append(player)
+
+        hits = self._move_shells(alive)
+        for victim, shooter in hits:
+            tank = victim.tank
+            if tank.health <= 0:
+                continue    # déjà détruit ce pas
+            tank.take_damage(SHELL_DAMAGE)
+            if tank.health <= 0:
+                victim.deaths += 1
+                victim.respawn_in = RESPAWN_TICKS
+                if shooter and shooter is not victim:
+                    shooter.kills += 1
+
+        alive = [p.tank for p in alive if p.tank.health > 0]
+        self.powerup_manager.update_tanks(alive, self.solid, self.now_ms)
+
+        self.tick_count += 1
+        return hits
+
+    def _move_shells(self, alive):
+        """Déplace les shells, retourne les impacts [(joueur touché, tireur ou None)]."""
+        if self.shell_pool is not None:
+            pool = self.shell_pool
+            pool.step(self.bouncing, self.destroying)
+            hits = pool.hit_tanks([p.tank for p in alive], [p.client_id for p in alive])
+            pool.compact()
+            return [(alive[i], self.players.get(owner)) for i, owner, _ in hits]
+
+        self.shells = ShellMovement.update_shells(self.shells, self.bouncing, self.destroying, self.layout)
+        result = ShellCollisions.check_tank_hits(self.shells, [p.tank for p in alive])
+        if result['shells_to_remove']:
+            self.shells = [s for s in self.shells if s.active]
+        owners = {id(p.tank): p for p in self.players.values()}
+        return [(owners[id(tank)], owners.get(id(shell.owner))) for tank, shell in result['tanks_hit']]
+
+    def checksum(self):
+        """CRC32 de tout l'état simulé (flottants au bit près), pour comparer deux pairs."""
+        pack = struct.Struct("<idddddiiiiiii").pack
+        crc = zlib.crc32(struct.pack("<ii", self.tick_count, self.next_shell_id))
+        for client_id, p in sorted(self.players.items()):
+            t = p.tank
+            crc = zlib.crc32(pack(client_id, t.x, t.y, t.hull_angle, t.turret_angle, t.speed,
+                                  t.health, t.ammo, t.fire_cooldown, t.reload_cooldown,
+                                  p.kills, p.deaths, p.respawn_in), crc)
+        for row in self.shell_rows():
+            crc = zlib.crc32(struct.pack("<iddddi", *row), crc)
+        for powerup in self.powerup_manager.powerups:
+            crc = zlib.crc32(struct.pack("<idd", powerup.powerup_id, powerup.x, powerup.y), crc)
+        return crc
+
+    def shell_rows(self):
+        """(id, x, y, vx, vy, bounces) de chaque shell en vol."""
+        if self.shell_pool is not None:
+            return self.shell_pool.rows()
+        return ((s.shell_id, s.x, s.y, s.vx, s.vy, s.bounces) for s in self.shells)
@@ -0,0 +1,88 @@
+"""Géométrie de la simulation, sans pygame.
+
+`Rect` reprend le sous-ensemble de `pygame.Rect` utilisé par les règles du
+jeu (bords, chevauchement, inflate), en flottants : la simulation tourne
+ainsi sans pygame installé ni SDL initialisé. Un `Rect` reste une séquence
+(x, y, w, h), que `pygame.draw.rect` ou `pygame.Rect` acceptent tels quels
+côté rendu.
+"""
+
+
+class Rect:
+    """Rectangle aligné sur les axes : coin haut-gauche (x, y), taille (width, height)."""
+
+    __slots__ = ("x", "y", "width", "height")
+
+    def __init__(self, x, y, width, height):
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+
+    # Séquence (x, y, w, h), comme pygame.Rect
+    def __len__(self):
+        return 4
+
+    def __getitem__(self, i):
+        return (self.x, self.y, self.width, self.height)[i]
+
+    def __iter__(self):
+        return iter((self.x, self.y, self.width, self.height))
+
+    def __eq__(self, other):
+        return tuple(self) == tuple(other)
+
+    def __hash__(self):
+        return hash(tuple(self))
+
+    def __repr__(self):
+        return f"Rect({self.x}, {self.y}, {self.width}, {self.height})"
+
+    @property
+    def left(self):
+        return self.x
+
+    @property
+    def top(self):
+        return self.y
+
+    @property
+    def right(self):
+        return self.x + self.width
+
+    @property
+    def bottom(self):
+        return self.y + self.height
+
+    @property
+    def centerx(self):
+        return self.x + self.width / 2
+
+    @property
+    def centery(self):
+        return self.y + self.height / 2
+
+    @property
+    def center(self):
+        return self.centerx, self.centery
+
+    def copy(self):
+        return Rect(self.x, self.y, self.width, self.height)
+
+    def inflate(self, dx, dy):
+        """Nouveau rect agrandi de dx / dy au total, même centre."""
+        return Rect(self.x - dx / 2, self.y - dy / 2, self.width + dx, self.height + dy)
+
+    def colliderect(self, other):
+        """Chevauchement strict (bords jointifs exclus, rect vide jamais en collision)."""
+        return (self.width > 0 and self.height > 0 and other.width > 0 and other.height > 0
+                and self.x < other.x + other.width and other.x < self.x + self.width
+                and self.y < other.y + other.height and other.y < self.y + self.height)
+
+    def collidepoint(self, px, py):
+        return self.x <= px < self.x + self.width and self.y <= py < self.y + self.height
+
+
+def entity_rect(entity):
+    """Rect d'une entité positionnée par son coin haut-gauche (tank)."""
+    return Rect(entity.x, entity.y, entity.width, entity.height)
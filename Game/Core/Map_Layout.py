@@ -0,0 +1,112 @@
+from Config import MAP_WIDTH, MAP_HEIGHT
+from Game.Core.Geometry import Rect
+from Game.Collisions.Spatial_Grid import SpatialGrid
+from Game.Collisions.Material_Raster import (MaterialRaster, SAND, DIRT, WATER, ROCK,
+                                              BLOCKED, MIXED, mask)
+
+SOLID_MATERIALS = mask(WATER, ROCK)     # bloquent les tanks
+SHELL_MATERIALS = mask(ROCK)            # arrêtent les projectiles (rebond)
+TERRAIN_SPEED = {SAND: 0.5, DIRT: 0.7}  # herbe : 1.0
+TANK_FOOTPRINT = (40, 40)               # Tank.width x Tank.height
+
+
+class MapLayout:
+    """Carte côté simulation : obstacles et zones par catégorie, sans texture.
+
+    Le terrain dessiné est produit à part par Rendering.Map_Renderer.
+    """
+
+    def __init__(self):
+        self.width = MAP_WIDTH
+        self.height = MAP_HEIGHT
+
+        # Rochers / murs — solides, font rebondir les projectiles
+        self.obstacles = [
+            Rect(587, 423, 97, 103),
+            Rect(1013, 594, 147, 83),
+            Rect(1587, 1094, 127, 118),
+            Rect(314, 812, 73, 194),
+            Rect(1823, 217, 193, 76),
+            Rect(213, 1287, 487, 213),
+            Rect(1117, 1214, 163, 337),
+            Rect(1794, 423, 207, 94),  # Déplacé loin du spawn client (1920, 800)
+            Rect(456, 178, 89, 124),
+            Rect(2147, 934, 156, 203),
+            Rect(743, 1456, 184, 87),
+            Rect(1923, 512, 112, 168),
+            Rect(134, 423, 97, 97),
+            Rect(2314, 1289, 143, 176),
+            Rect(891, 67, 203, 119),
+            Rect(1756, 1343, 78, 234),
+            Rect(523, 1089, 167, 92),
+            Rect(2089, 134, 186, 154),
+        ]
+
+        # Zones décoratives (pas de collision)
+        self.sand_zones = [
+            Rect(200, 200, 400, 300),
+            Rect(1500, 800, 500, 400),
+            Rect(800, 1200, 600, 300),
+        ]
+        self.dirt_zones = [
+            Rect(1800, 400, 400, 400),
+            Rect(100, 700, 300, 300),
+        ]
+
+        # Eau — bloque les tanks (les projectiles la traversent)
+        self.water_zones = [
+            Rect(1200, 200, 300, 300),
+            Rect(400, 1000, 400, 200),
+        ]
+
+        # Index spatiaux construits une fois : les collisions n'interrogent que les cellules voisines
+        self._solid = SpatialGrid(self.water_zones + self.obstacles)
+        self._bouncing = SpatialGrid(self.obstacles)
+        self._destroying = SpatialGrid()
+
+        # Raster de matériaux (ordre de dessin du terrain) : vitesse, passage, shells
+        self.materials = MaterialRaster(self.width, self.height, [
+            (SAND, self.sand_zones), (WATER, self.water_zones),
+            (DIRT, self.dirt_zones), (ROCK, self.obstacles),
+        ])
+        self.materials.prepare_footprint(*TANK_FOOTPRINT, SOLID_MATERIALS)
+
+    # --- Accesseurs pour le système de collision ---
+
+    def get_solid_obstacles(self):
+        """Obstacles qui bloquent le déplacement des tanks (rochers + eau), indexés en grille."""
+        return self._solid
+
+    def get_bouncing_obstacles(self):
+        """Obstacles qui font rebondir les projectiles (rochers uniquement), indexés en grille."""
+        return self._bouncing
+
+    def get_destroying_obstacles(self):
+        """Obstacles qui détruisent les projectiles (aucun actuellement)."""
+        return self._destroying
+
+    def get_terrain_speed_modifier(self, tank_rect):
+        """Retourne le coefficient de vitesse selon le terrain sous le centre du tank.
+
+        Sable : 0.5 (50% vitesse)
+        Terre : 0.7 (70% vitesse)
+        Herbe : 1.0 (100% vitesse)
+        """
+        material = self.materials.material_at(tank_rect.centerx, tank_rect.centery)
+        return TERRAIN_SPEED.get(material, 1.0)
+
+    def tank_blocked(self, tank_rect):
+        """True si le rect chevauche un obstacle solide (rocher, eau).
+
+        Une lecture du footprint précalculé ; près d'un bord d'obstacle
+        seulement, test exact contre les rects voisins.
+        """
+        state = self.materials.footprint_state(tank_rect.left, tank_rect.top,
+                                               tank_rect.width, tank_rect.height, SOLID_MATERIALS)
+        if state != MIXED:
+            return state == BLOCKED
+        return any(tank_rect.colliderect(obs) for obs in self._solid.query(tank_rect))
+
+    def shell_obstacles_near(self, left, top, right, bottom):
+        """False si la boîte (trajet balayé d'un shell) ne touche sûrement aucun obstacle."""
+        return self.materials.touches(left - 1, top - 1, right + 1, bottom + 1, SHELL_MATERIALS)
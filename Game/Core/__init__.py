@@ -0,0 +1,2 @@
+# Package Core
+# Simulation sans pygame : géométrie, carte, état de partie
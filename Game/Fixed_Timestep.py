@@ -0,0 +1,50 @@
+"""Simulation à pas fixe, découplée de la fréquence de rendu.
+
+Le temps réel écoulé entre deux frames s'accumule ; la boucle de jeu
+exécute autant de pas de simulation de 1/SIM_HZ s qu'il en tient, puis
+rend l'image en interpolant entre les deux derniers états (`alpha`).
+Une machine qui perd des frames joue donc à la même vitesse, et deux
+pairs à FPS différents simulent au même rythme.
+"""
+
+import time
+from Config import SIM_HZ, MAX_FRAME_TIME
+
+
+class FixedTimestep:
+    """Accumulateur : nombre de pas de simulation à exécuter à chaque frame."""
+
+    def __init__(self, rate=SIM_HZ, max_frame_time=MAX_FRAME_TIME, clock=time.perf_counter):
+        self.rate = rate
+        self.dt = 1.0 / rate
+        self.max_frame_time = max_frame_time
+        self._clock = clock
+        self._last = None
+        self.accumulator = 0.0
+        self.steps = 0          # pas exécutés depuis le début
+
+    def reset(self):
+        """Repart de zéro (nouvelle partie, retour d'un écran bloquant)."""
+        self._last = None
+        self.accumulator = 0.0
+
+    def advance(self):
+        """Ajoute le temps écoulé depuis l'appel précédent, retourne le nombre de pas dus."""
+        now = self._clock()
+        if self._last is not None:
+            self.accumulator += min(now - self._last, self.max_frame_time)
+        self._last = now
+        steps = int(self.accumulator / self.dt + 1e-9)     # tolérance d'arrondi flottant
+        self.accumulator = max(0.0, self.accumulator - steps * self.dt)
+        self.steps += steps
+        return steps
+
+    @property
+    def alpha(self):
+        """Fraction du pas suivant déjà écoulée : 0 = dernier état simulé, 1 = état suivant."""
+        return min(1.0, self.accumulator / self.dt)
+
+    @property
+    def time_ms(self):
+        """Horloge de simulation (ms), dérivée du nombre de pas."""
+        return self.steps * 1000 // self.rate
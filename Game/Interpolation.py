@@ -0,0 +1,114 @@
+"""Interpolation des états distants (jitter buffer).
+
+Chaque snapshot porte l'horloge de l'émetteur `t` (ms). Le SnapshotBuffer
+estime le décalage entre les deux horloges (plus petit écart observé =
+paquet le moins retardé) et affiche le pair avec un retard fixe : l'état
+rendu est interpolé entre les deux snapshots qui encadrent l'instant visé.
+Si les paquets sont en retard, l'état est extrapolé, au plus de
+`max_extrapolation_ms`, puis figé.
+"""
+
+from collections import deque
+from Game.Network_Config import INTERP_DELAY_MS, MAX_EXTRAPOLATION_MS
+from Config import SIM_HZ
+
+OFFSET_WINDOW = 64      # échantillons retenus pour l'estimation du décalage d'horloge
+TICK_MS = 1000 / SIM_HZ # les vitesses des shells sont exprimées par pas de simulation
+
+
+def lerp(a, b, alpha):
+    return a + (b - a) * alpha
+
+
+def lerp_angle(a, b, alpha):
+    """Interpolation d'angle (degrés) par le plus court chemin."""
+    diff = (b - a + 180.0) % 360.0 - 180.0
+    return (a + diff * alpha) % 360.0
+
+
+class SnapshotBuffer:
+    """Snapshots horodatés d'un pair, restitués avec un retard d'affichage fixe."""
+
+    def __init__(self, delay_ms=INTERP_DELAY_MS, max_extrapolation_ms=MAX_EXTRAPOLATION_MS, size=32):
+        self.delay_ms = delay_ms
+        self.max_extrapolation_ms = max_extrapolation_ms
+        self._snapshots = deque(maxlen=size)        # (t émetteur, état), t croissant
+        self._offsets = deque(maxlen=OFFSET_WINDOW)
+        self.offset = None                          # horloge locale - horloge émetteur (ms)
+        self.late_frames = 0                        # frames rendues en extrapolation
+
+    def __len__(self):
+        return len(self._snapshots)
+
+    def clear(self):
+        self._snapshots.clear()
+        self._offsets.clear()
+        self.offset = None
+
+    def push(self, state, now_ms):
+        """Ajoute un état complet reçu à `now_ms` (horloge locale). Ignore les doublons."""
+        t = state.get("t")
+        if t is None or (self._snapshots and t <= self._snapshots[-1][0]):
+            return
+        self._snapshots.append((t, state))
+        self._offsets.append(now_ms - t)
+        self.offset = min(self._offsets)
+
+    def sample(self, now_ms):
+        """État à afficher à `now_ms`, ou None si le buffer est vide."""
+        if not self._snapshots:
+            return None
+        render_t = now_ms - self.offset - self.delay_ms
+        snaps = self._snapshots
+
+        if render_t <= snaps[0][0]:
+            return snaps[0][1]
+
+        newest_t, newest = snaps[-1]
+        if render_t >= newest_t:
+            if len(snaps) < 2:
+                return newest
+            self.late_frames += 1
+            prev_t, prev = snaps[-2]
+            ahead = min(render_t - newest_t, self.max_extrapolation_ms)
+            return self._blend(prev, newest, 1.0 + ahead / (newest_t - prev_t),
+                               newest_t - prev_t + ahead, ahead)
+
+        # Snapshots encadrants (buffer court : parcours linéaire depuis la fin)
+        for i in range(len(snaps) - 1, 0, -1):
+            a_t, a = snaps[i - 1]
+            if a_t <= render_t:
+                b_t, b = snaps[i]
+                return self._blend(a, b, (render_t - a_t) / (b_t - a_t), render_t - a_t, render_t - b_t)
+        return snaps[0][1]
+
+    @staticmethod
+    def _blend(a, b, alpha, since_a_ms, since_b_ms):
+        """Pose entre a et b (alpha > 1 : extrapolation), champs discrets de b.
+
+        Les shells présents des deux côtés sont interpolés par id. Un shell
+        absent de b avance depuis a selon sa vitesse tant que b n'est pas
+        atteint ; un shell apparu dans b n'est montré qu'une fois b atteint.
+        """
+        state = dict(b)
+        state["x"] = lerp(a["x"], b["x"], alpha)
+        state["y"] = lerp(a["y"], b["y"], alpha)
+        state["hull_angle"] = lerp_angle(a["hull_angle"], b["hull_angle"], alpha)
+        state["turret_angle"] = lerp_angle(a["turret_angle"], b["turret_angle"], alpha)
+
+        reached_b = since_b_ms >= 0
+        b_shells = {s["id"]: s for s in b["shells_data"]}
+        shells = []
+        for sa in a["shells_data"]:
+            sb = b_shells.pop(sa["id"], None)
+            if sb is not None:
+                shells.append({**sb, "x": lerp(sa["x"], sb["x"], alpha), "y": lerp(sa["y"], sb["y"], alpha)})
+            elif not reached_b:
+                ticks = since_a_ms / TICK_MS
+                shells.append({**sa, "x": sa["x"] + sa["vx"] * ticks, "y": sa["y"] + sa["vy"] * ticks})
+        if reached_b:
+            ticks = since_b_ms / TICK_MS
+            shells += [{**s, "x": s["x"] + s["vx"] * ticks, "y": s["y"] + s["vy"] * ticks}
+                       for s in b_shells.values()]
+        state["shells_data"] = shells
+        return state
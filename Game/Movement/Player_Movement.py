@@ -1,6 +1,6 @@
-import pygame
 import math
 from Config import MAP_WIDTH, MAP_HEIGHT
+from Game.Core.Geometry import entity_rect
 
 
 class PlayerMovement:
@@ -9,7 +9,8 @@ class PlayerMovement:
     @staticmethod
     def handle_input(tank, keys, obstacles=None, game_map=None):
         """Déplace le tank, oriente le châssis selon la direction, applique ralentissement terrain, clamp aux bords, et résout les collisions."""
-        old_x, old_y = tank.x, tank.y
+        import pygame   # entrée clavier seulement : apply_move reste sans pygame
+
         dx, dy = 0, 0
 
         # Flèches + ZQSD
@@ -18,6 +19,12 @@ class PlayerMovement:
         if keys[pygame.K_LEFT] or keys[pygame.K_q]:  dx -= 1
         if keys[pygame.K_RIGHT] or keys[pygame.K_d]: dx += 1
 
+        return PlayerMovement.apply_move(tank, dx, dy, obstacles, game_map)
+
+    @staticmethod
+    def apply_move(tank, dx, dy, obstacles=None, game_map=None):
+        """Applique une direction (-1/0/1 par axe) au tank — sans clavier (serveur dédié)."""
+        old_x, old_y = tank.x, tank.y
         moved = (dx != 0 or dy != 0)
 
         if moved:
@@ -32,7 +39,7 @@ class PlayerMovement:
 
             # Appliquer le modificateur de vitesse selon le terrain
             if game_map:
-                tank_rect = pygame.Rect(tank.x, tank.y, tank.width, tank.height)
+                tank_rect = entity_rect(tank)
                 speed_modifier = game_map.get_terrain_speed_modifier(tank_rect)
                 dx *= speed_modifier
                 dy *= speed_modifier
@@ -45,7 +52,11 @@ class PlayerMovement:
         tank.y = max(0, min(tank.y, MAP_HEIGHT - tank.height))
 
         # Collision avec les obstacles → annuler le déplacement
-        if obstacles and moved:
+        if moved and game_map is not None:
+            # Raster de la map : une lecture hors des bords d'obstacles
+            if game_map.tank_blocked(entity_rect(tank)):
+                tank.x, tank.y = old_x, old_y
+        elif obstacles and moved:
             from Game.Collisions.Map_Collisions import MapCollisions
             MapCollisions.resolve_tank_collision(tank, old_x, old_y, obstacles)
 
@@ -2,8 +2,17 @@ class ShellMovement:
     """Met à jour et nettoie la liste de projectiles."""
 
     @staticmethod
-    def update_shells(shells):
-        """Tick tous les shells, retourne uniquement les actifs."""
-        for shell in shells:
-            shell.update()
+    def update_shells(shells, bouncing_obstacles=None, destroying_obstacles=(), game_map=None):
+        """Tick tous les shells, retourne uniquement les actifs.
+
+        Avec des obstacles, le déplacement est balayé (ShellCollisions.sweep) :
+        rebonds exacts sur les obstacles et les bords pendant le tick.
+        """
+        if bouncing_obstacles is None:
+            for shell in shells:
+                shell.update()
+        else:
+            from Game.Collisions.Shell_Collisions import ShellCollisions
+            for shell in shells:
+                ShellCollisions.sweep(shell, bouncing_obstacles, destroying_obstacles, game_map)
         return [s for s in shells if s.active]
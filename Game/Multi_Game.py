@@ -6,8 +6,15 @@ from Game.Assets.Tank import Tank
 from Game.Assets.Shell import Shell
 from Game.Assets.Camera import Camera
 from Game.Movement.Player_Movement import PlayerMovement
+from Game.Movement.Shell_Movement import ShellMovement
 from Game.Collisions.Shell_Collisions import ShellCollisions
 from Game.Powerups.PowerUp_Manager import PowerUpManager
+from Game.Snapshot_Delta import DeltaEncoder, DeltaDecoder
+from Game.Network_Scheduler import SendScheduler
+from Game.Interpolation import SnapshotBuffer
+from Game.Remote_Entities import RemoteEntityTable
+from Game.Fixed_Timestep import FixedTimestep
+from Game.Rendering.Hud_Renderer import HudRenderer
 from Config import MENU_WIDTH, MENU_HEIGHT, FPS, MAP_WIDTH, MAP_HEIGHT
 from Score_Manager import add_score, get_leaderboard, merge_scores
 from UI.Name_Input import NameInput
@@ -22,10 +29,17 @@ class MultiGame:
         self.network = network_obj
         self.font = pygame.font.Font(None, 36)
         self.font_small = pygame.font.Font(None, 24)
+        self.hud = HudRenderer(screen)     # textes / barres rendus seulement quand ils changent
+        self.sender = SendScheduler(network_obj)   # envois à NETWORK_FPS, regroupés par tick
+        self.show_net_stats = False                 # overlay télémétrie (F3)
+        self.round = 0                              # manche, incrémentée à chaque rematch
         self._init_game()
 
     def _init_game(self):
         """(Ré)initialise la partie — appelé aussi lors d'un rematch."""
+        self.round += 1
+        # Réponses de scores arrivées après les délais de la manche précédente
+        self.network.discard_control("scores_sync", "scores_merged")
         self.game_map = GameMap()
 
         if self.is_host:
@@ -42,12 +56,27 @@ class MultiGame:
 
         self.camera = Camera(MENU_WIDTH, MENU_HEIGHT)
         self.shells = []            # nos projectiles
-        self.opponent_shells = []   # projectiles reçus du réseau
+        # Projectiles reçus du réseau, persistants par ID
+        self.opponent_shells = RemoteEntityTable(
+            lambda data: Shell.from_state(data, self.opponent), Shell.apply_state)
         self._hit_shell_ids = set() # IDs des shells adverses ayant déjà infligé des dégâts
         
         # Power-ups (host gère spawn/lifetime, client synchronise les positions)
-        self.powerup_manager = PowerUpManager()
-        
+        self.powerup_manager = PowerUpManager(self.network.match_seed)
+        self._pending_picked = set()  # pickups client renvoyés jusqu'à confirmation du host
+
+        # Snapshots delta : encodés contre la dernière base acquittée par le pair,
+        # numérotés par manche (seq repart de 1 à chaque rematch)
+        self.delta_out = DeltaEncoder(round_no=self.round)
+        self.delta_in = DeltaDecoder(round_no=self.round)
+
+        # États adverses horodatés, affichés avec un léger retard (interpolation)
+        self.remote = SnapshotBuffer()
+        self._clock_origin = time.perf_counter()
+
+        # Simulation locale à pas fixe (SIM_HZ), rendue par interpolation
+        self.timestep = FixedTimestep()
+
         self.running = True
         self.connection_lost = False
 
@@ -62,6 +91,8 @@ class MultiGame:
                     return "MENU"
                 if event.key == pygame.K_r:
                     self.player.reload()
+                if event.key == pygame.K_F3:
+                    self.show_net_stats = not self.show_net_stats
             if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                 shell = self.player.fire()
                 if shell:
@@ -71,6 +102,23 @@ class MultiGame:
     # ── Logique ─────────────────────────────────────────────────
 
     def update(self):
+        """Frame : pas de simulation dus, puis réseau (réception, vue du pair, envoi)."""
+        for _ in range(self.timestep.advance()):
+            self.step()
+
+        if not self.receive_opponent_data():
+            self.connection_lost = True
+        self._apply_remote_view()
+        if self.sender.due():
+            self.send_player_data()
+            self.sender.flush()
+        self.network.tick_telemetry(self._telemetry_extra)
+
+    def step(self):
+        """Un pas de simulation locale (1/SIM_HZ s) : notre tank et nos projectiles."""
+        self.player.save_pose()
+        for shell in self.shells:
+            shell.save_pose()
         keys = pygame.key.get_pressed()
 
         solid = self.game_map.get_solid_obstacles()
@@ -80,15 +128,12 @@ class MultiGame:
         mouse_x, mouse_y = pygame.mouse.get_pos()
         self.player.aim_at_mouse(mouse_x, mouse_y, self.camera.x, self.camera.y)
 
-        for shell in self.shells[:]:
-            shell.update()
-
         bouncing = self.game_map.get_bouncing_obstacles()
         destroying = self.game_map.get_destroying_obstacles()
 
-        # Nos projectiles vs obstacles + friendly fire
-        local = ShellCollisions.check_all_collisions(
-            self.shells, bouncing, destroying, [self.player])
+        # Nos projectiles : déplacement balayé (rebonds exacts) puis friendly fire
+        self.shells = ShellMovement.update_shells(self.shells, bouncing, destroying, self.game_map)
+        local = ShellCollisions.check_tank_hits(self.shells, [self.player])
         for tank, _ in local['tanks_hit']:
             tank.take_damage(25)
         if local['shells_to_remove']:
@@ -96,30 +141,33 @@ class MultiGame:
 
         # Projectiles adverses vs notre tank (dédupliqué par shell_id)
         if self.opponent_shells:
-            opp = ShellCollisions.check_all_collisions(
-                self.opponent_shells, bouncing, destroying, [self.player])
+            opp = ShellCollisions.check_tank_hits(self.opponent_shells, [self.player])
             for tank, s in opp['tanks_hit']:
                 if s.shell_id not in self._hit_shell_ids:
                     self._hit_shell_ids.add(s.shell_id)
                     tank.take_damage(25)
-            if opp['shells_to_remove']:
-                self.opponent_shells = [s for s in self.opponent_shells if s.active]
 
         # Power-ups (host gère spawn/lifetime, client reçoit la liste)
         if self.is_host:
-            self.powerup_manager.update(self.player, solid)
+            self.powerup_manager.update(self.player, solid, self.timestep.time_ms)
         else:
             # Client vérifie les pickups sur les powerups reçus
-            self.powerup_manager._check_pickup(self.player)
+            self.powerup_manager._check_pickup(self.player, self.timestep.time_ms)
 
         self.camera.follow(self.player)
 
-        if not self.receive_opponent_data():
-            self.connection_lost = True
-        self.send_player_data()
-
     # ── Réseau ──────────────────────────────────────────────────
 
+    def _telemetry_extra(self):
+        """Champs propres au jeu ajoutés à chaque période de télémétrie."""
+        return {"send_rate": round(self.sender.achieved_rate, 1),
+                "interp_late_frames": self.remote.late_frames,
+                "interp_buffered": len(self.remote)}
+
+    def _now_ms(self):
+        """Horloge locale (ms) servant à horodater les snapshots envoyés."""
+        return int((time.perf_counter() - self._clock_origin) * 1000)
+
     def send_player_data(self):
         shells_data = [
             {"id": s.shell_id, "x": round(s.x, 1), "y": round(s.y, 1),
@@ -135,12 +183,14 @@ class MultiGame:
                 for p in self.powerup_manager.powerups
             ]
         
-        # Client envoie les IDs des powerups pickupés
+        # Client renvoie les IDs pickupés tant que le host les expose encore (UDP = pertes possibles)
         picked_ids = []
         if not self.is_host:
-            picked_ids = self.powerup_manager.get_picked_ids()
+            self._pending_picked.update(self.powerup_manager.get_picked_ids())
+            picked_ids = sorted(self._pending_picked)
         
-        self.network.send({
+        state = {
+            "t": self._now_ms(),
             "x": self.player.x, "y": self.player.y,
             "hull_angle": self.player.hull_angle,
             "turret_angle": self.player.turret_angle,
@@ -148,124 +198,173 @@ class MultiGame:
             "shells_data": shells_data,
             "powerups_data": powerups_data,
             "picked_powerup_ids": picked_ids,
-        })
+        }
+        self.network.send_state(self.delta_out.encode(state, self.delta_in.ack))
 
     def receive_opponent_data(self):
-        """Draine la file réseau, n'applique que le dernier état de jeu."""
-        latest = None
-        while True:
-            data = self.network.receive()
-            if data is None:
-                break
-            # Ignorer les messages de contrôle (scores, rematch)
-            if any(k in data for k in ("scores_sync", "scores_merged", "rematch")):
-                continue
-            latest = data
-
+        """Applique le dernier état reçu (canal d'état latest-wins, les messages de contrôle restent en file)."""
+        data = self.network.receive_state()
+        if data is None or "seq" not in data:
+            return True
+        if data.get("round", 0) != self.round:
+            # Manche précédente (ou suivante si le pair a relancé avant nous) : son seq,
+            # son ack et son horloge `t` n'ont pas de sens pour nos encodeur / jitter buffer
+            self.network.telemetry.on_drop("round")
+            return True
+        self.delta_out.on_ack(data.get("ack", -1), self.round)
+        latest = self.delta_in.decode(data)
         if latest is None:
+            self.network.telemetry.on_drop("delta_base")    # base inconnue : en attente d'une keyframe
             return True
+        # Le client renvoie ses pickups jusqu'à confirmation : le dernier état les contient tous
+        picked_ids = latest["picked_powerup_ids"]
 
         try:
-            self.opponent.x = latest.get("x", self.opponent.x)
-            self.opponent.y = latest.get("y", self.opponent.y)
-            self.opponent.hull_angle = latest.get("hull_angle", self.opponent.hull_angle)
-            self.opponent.turret_angle = latest.get("turret_angle", self.opponent.turret_angle)
+            # Pose et shells : interpolés à chaque frame (_apply_remote_view) ;
+            # la santé sert à la logique de fin de partie, appliquée sans retard
+            self.remote.push(latest, self._now_ms())
             self.opponent.health = latest.get("health", self.opponent.health)
 
-            # Recréer les shells adverses depuis les données réseau
-            self.opponent_shells = []
-            active_ids = set()
-            for sd in latest.get("shells_data", []):
-                s = Shell(sd["x"], sd["y"], 0, self.opponent)
-                s.shell_id = sd.get("id", s.shell_id)
-                s.vx, s.vy, s.bounces = sd["vx"], sd["vy"], sd["bounces"]
-                s.active = True
-                s._update_color()
-                self.opponent_shells.append(s)
-                active_ids.add(s.shell_id)
-
-            # Nettoyer les anciens IDs de shells qui n'existent plus
-            self._hit_shell_ids &= active_ids
-
-            # Synchroniser les power-ups reçus depuis le host
-            powerups_data = latest.get("powerups_data", [])
-            if powerups_data:
-                self.powerup_manager.sync_received_powerups(powerups_data)
-            
-            # Host reçoit les IDs pickupés du client et les applique
-            if self.is_host:
-                picked_ids = latest.get("picked_powerup_ids", [])
-                if picked_ids:
-                    self.powerup_manager.apply_picked_ids(picked_ids)
+            # Synchroniser les power-ups reçus depuis le host (état complet reconstruit),
+            # sans réafficher ceux qu'on a ramassés et que le host n'a pas encore retirés
+            if not self.is_host:
+                host_ids = {p["id"] for p in latest["powerups_data"]}
+                self._pending_picked &= host_ids
+                self.powerup_manager.sync_received_powerups(
+                    [p for p in latest["powerups_data"] if p["id"] not in self._pending_picked])
+
+            # Host reçoit les IDs pickupés du client
+            if self.is_host and picked_ids:
+                self.powerup_manager.apply_picked_ids(picked_ids)
 
             return True
         except Exception as e:
             print(f"Erreur réseau: {e}")
             return False
 
-    # ── Affichage ───────────────────────────────────────────────
+    def _apply_remote_view(self):
+        """Place le tank et les shells adverses à l'instant interpolé du jitter buffer."""
+        view = self.remote.sample(self._now_ms())
+        if view is None:
+            return
+        self.opponent.x = view["x"]
+        self.opponent.y = view["y"]
+        self.opponent.hull_angle = view["hull_angle"]
+        self.opponent.turret_angle = view["turret_angle"]
 
-    def _draw_health_bar(self, x, y, w, h, health, max_hp=100):
-        ratio = max(0.0, health / max_hp)
-        color = (0, 255, 0) if ratio > 0.5 else (255, 200, 0) if ratio > 0.25 else (255, 0, 0)
-        pygame.draw.rect(self.screen, (100, 0, 0), (x, y, w, h))
-        pygame.draw.rect(self.screen, color, (x, y, int(w * ratio), h))
-        pygame.draw.rect(self.screen, (255, 255, 255), (x, y, w, h), 2)
+        # Shells adverses mis à jour en place par ID, créés / retirés seulement à l'apparition / disparition
+        self.opponent_shells.sync(view["shells_data"])
+
+        # Nettoyer les anciens IDs de shells qui n'existent plus
+        self._hit_shell_ids.intersection_update(self.opponent_shells.entities)
+
+    # ── Affichage ───────────────────────────────────────────────
 
     def draw(self):
-        self.screen.fill((20, 20, 30))
-        self.camera.follow(self.player)
+        # Rendu interpolé entre les deux derniers pas ; le pair l'est déjà (jitter buffer)
+        alpha = self.timestep.alpha
+        self.camera.follow(self.player, alpha)
+        # Terrain : complet si la caméra a bougé, sinon seulement sous les sprites du frame précédent
         self.game_map.draw(self.screen, self.camera.x, self.camera.y)
+        dirty = []      # zones dessinées ce frame, restaurées au suivant
 
         for shell in self.shells:
-            shell.draw(self.screen, self.camera.x, self.camera.y)
+            dirty.append(shell.draw(self.screen, self.camera.x, self.camera.y, alpha))
         for shell in self.opponent_shells:
-            shell.draw(self.screen, self.camera.x, self.camera.y)
+            dirty.append(shell.draw(self.screen, self.camera.x, self.camera.y))
 
         # Draw power-ups (host et client affichent via le manager)
-        self.powerup_manager.draw(self.screen, self.camera.x, self.camera.y)
+        dirty += self.powerup_manager.draw(self.screen, self.camera.x, self.camera.y)
 
-        self.player.draw(self.screen, self.camera.x, self.camera.y)
-        self.opponent.draw(self.screen, self.camera.x, self.camera.y)
+        dirty.append(self.player.draw(self.screen, self.camera.x, self.camera.y, alpha))
+        dirty.append(self.opponent.draw(self.screen, self.camera.x, self.camera.y))
 
-        # HUD — barres de vie
-        self.screen.blit(
-            self.font.render(f"Vous: {self.player.health} HP", True, (0, 255, 0)), (10, 10))
-        self._draw_health_bar(10, 45, 200, 18, self.player.health)
+        # HUD — chaque texte / barre n'est re-rendu que si sa valeur change
+        hud = self.hud
+        hud.begin_frame()
+        dirty.append(hud.text("hp", self.font, f"Vous: {self.player.health} HP", (0, 255, 0), topleft=(10, 10)))
+        dirty.append(hud.health_bar("hp_bar", (10, 45, 200, 18), self.player.health))
 
-        self.screen.blit(
-            self.font.render(f"Adversaire: {self.opponent.health} HP", True, (255, 80, 80)), (10, 72))
-        self._draw_health_bar(10, 107, 200, 18, self.opponent.health)
+        dirty.append(hud.text("opponent_hp", self.font, f"Adversaire: {self.opponent.health} HP", (255, 80, 80),
+                              topleft=(10, 72)))
+        dirty.append(hud.health_bar("opponent_hp_bar", (10, 107, 200, 18), self.opponent.health))
 
         # Power-up HUD (affichage des effets actifs)
-        self.powerup_manager.draw_hud(self.screen, self.font_small, self.player)
+        dirty.append(self.powerup_manager.draw_hud(self.screen, self.font_small, self.player,
+                                                   self.timestep.time_ms, hud=hud))
 
         # Munitions / rechargement
         if self.player.reloading:
-            self.screen.blit(
-                self.font_small.render("Rechargement...", True, (255, 100, 100)), (10, 132))
+            dirty.append(hud.text("ammo", self.font_small, "Rechargement...", (255, 100, 100), topleft=(10, 132)))
             progress = 1.0 - (self.player.reload_cooldown / self.player.reload_time)
-            pygame.draw.rect(self.screen, (60, 60, 60), (10, 152, 150, 10))
-            pygame.draw.rect(self.screen, (255, 165, 0), (10, 152, int(150 * progress), 10))
-            pygame.draw.rect(self.screen, (255, 255, 255), (10, 152, 150, 10), 1)
+            dirty.append(hud.bar("reload", (10, 152, 150, 10), progress, (255, 165, 0), (60, 60, 60),
+                                 border_width=1))
         else:
             p = self.player
             dots = '● ' * p.ammo + '○ ' * (p.mag_size - p.ammo)
             color = (255, 255, 0) if p.ammo > 0 else (255, 100, 100)
-            self.screen.blit(
-                self.font_small.render(f"Munitions: {dots} [R]", True, color), (10, 132))
+            dirty.append(hud.text("ammo", self.font_small, f"Munitions: {dots} [R]", color, topleft=(10, 132)))
 
         if self.connection_lost:
-            msg = self.font.render("CONNEXION PERDUE!", True, (255, 0, 0))
-            self.screen.blit(msg, msg.get_rect(center=(MENU_WIDTH // 2, MENU_HEIGHT // 2)))
+            dirty.append(hud.text("connection_lost", self.font, "CONNEXION PERDUE!", (255, 0, 0),
+                                  center=(MENU_WIDTH // 2, MENU_HEIGHT // 2)))
 
-        self.screen.blit(
-            self.font_small.render("ESC pour quitter", True, (150, 150, 150)), (10, MENU_HEIGHT - 40))
+        dirty.append(hud.text("quit", self.font_small, "ESC pour quitter", (150, 150, 150),
+                              topleft=(10, MENU_HEIGHT - 40)))
 
+        if self.show_net_stats:
+            dirty.append(self._draw_net_stats())
+
+        self.game_map.mark_dirty(dirty)
         pygame.display.flip()
 
+    def _draw_net_stats(self):
+        """Overlay F3 : dernière période de télémétrie réseau, recomposé à chaque période."""
+        t = self.network.telemetry.last
+        hud = self.hud
+        # Rendus du HUD au frame précédent (celui-ci n'est pas fini)
+        hud_line = f"HUD     rendus {hud.last_renders}  évités {hud.last_reused}"
+        panel = hud.surface("net_stats", (t, hud_line), lambda: self._build_net_panel(t, hud_line))
+        return self.screen.blit(panel, (MENU_WIDTH - panel.get_width() - 10, 10))
+
+    def _build_net_panel(self, t, hud_line):
+        if not t:
+            lines = ["Télémétrie : mesure en cours..."]
+        else:
+            rtt, dec = t["rtt_ms"], t["decode_us"]
+            lines = [
+                f"RTT ms  moy {rtt['mean']}  p50 {rtt['p50']}  p95 {rtt['p95']}  max {rtt['max']}",
+                f"Débit   in {t['kb_in_s']} ko/s  out {t['kb_out_s']} ko/s",
+                f"Msgs/s  in {t['msgs_in_s']}  out {t['msgs_out_s']}  (envoi {t['send_rate']} Hz)",
+                f"Files   réception {t['queue_depth']}  envoi {t['send_queue_bytes']} o",
+                f"Décodage us  moy {dec['mean']}  p95 {dec['p95']}",
+                f"Pertes  {t['dropped']} {t['drops'] or ''}",
+                f"Interp  tampon {t['interp_buffered']}  extrapolées {t['interp_late_frames']}",
+            ]
+        lines.append(hud_line)
+        width = max(self.font_small.size(line)[0] for line in lines) + 20
+        panel = pygame.Surface((width, 22 * len(lines) + 12), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 170))
+        for i, line in enumerate(lines):
+            panel.blit(self.font_small.render(line, True, (200, 255, 200)), (10, 6 + 22 * i))
+        return panel
+
     # ── Fin de partie ───────────────────────────────────────────
 
+    def _receive_scores(self, kind, timeout):
+        """Scoreboard adverse de cette manche (`kind`), ou None après `timeout` s.
+
+        Les réponses d'une manche précédente, arrivées après leur délai, sont ignorées.
+        """
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            message = self.network.receive_control(kind)
+            if message is None:
+                pygame.time.wait(50)
+            elif isinstance(message, dict) and message.get("round") == self.round:
+                return message.get("scores")
+        return None
+
     def _show_end_screen(self, won):
         """Saisie du nom → sync scoreboard réseau → menu rejouer/quitter."""
         font_big = pygame.font.Font(None, 72)
@@ -284,30 +383,19 @@ class MultiGame:
 
         # 2) Synchronisation des scoreboards via le réseau
         try:
-            my_scores = get_leaderboard()
-            self.network.send({"scores_sync": my_scores})
+            self.network.send({"round": self.round, "scores": get_leaderboard()}, "scores_sync")
+            self.sender.flush()
 
             # Attendre le scoreboard adverse (timeout 5 s)
-            t0 = time.time()
-            remote = None
-            while time.time() - t0 < 5:
-                data = self.network.receive()
-                if data and "scores_sync" in data:
-                    remote = data["scores_sync"]
-                    break
-                pygame.time.wait(50)
-
+            remote = self._receive_scores("scores_sync", 5)
             if remote:
                 merge_scores(remote)
-                self.network.send({"scores_merged": get_leaderboard()})
+                self.network.send({"round": self.round, "scores": get_leaderboard()}, "scores_merged")
+                self.sender.flush()
                 # Recevoir le scoreboard fusionné final
-                t1 = time.time()
-                while time.time() - t1 < 3:
-                    data2 = self.network.receive()
-                    if data2 and "scores_merged" in data2:
-                        merge_scores(data2["scores_merged"])
-                        break
-                    pygame.time.wait(50)
+                merged = self._receive_scores("scores_merged", 3)
+                if merged:
+                    merge_scores(merged)
         except Exception as e:
             print(f"Erreur sync scoreboard: {e}")
 
@@ -374,7 +462,6 @@ class MultiGame:
 
                     if choice == "REJOUER":
                         self._init_game()
-                        self.network.send({"rematch": True})
                         break
                     else:
                         self.network.stop() if self.is_host else self.network.disconnect()
@@ -1,121 +1,695 @@
-"""Réseau TCP avec protocole newline-delimited JSON.
+"""Réseau TCP + UDP avec codec négocié par connexion.
 
-Chaque message est un objet JSON terminé par \\n.
-Les messages sont stockés dans une deque (FIFO) côté réception.
+Chaque message TCP commence par un octet de canal :
+- "S" (état)    : snapshot d'état ; côté réception, seul le dernier est gardé
+                  (latest-wins) — un état périmé n'a plus de valeur.
+- "C" (contrôle): {"type": nom, "data": ...} ; rangé dans une file FIFO par
+                  type, jamais évincée par le flot d'états (scores, départs...).
+
+À la connexion, le client envoie en JSON le contrôle "hello"
+{"version", "codec", "udp"}, auquel le serveur répond "hello_ack"
+{"version", "codec", "udp_port", "client_id", "seed"}. `seed` est la graine
+de la partie, tirée par le serveur : les pairs en dérivent une simulation
+identique (voir Game.Core.Game_State).
+- codec "json"   : chaque message est un objet JSON terminé par \\n.
+- codec "binary" : chaque message est préfixé par sa longueur (uint32),
+                   les snapshots d'état sont packés (voir Network_Codec).
+Les messages de contrôle restent sur le flux TCP fiable.
+
+Canal UDP (optionnel) pour les snapshots d'état à haute fréquence : chaque
+datagramme porte un numéro de séquence, les paquets périmés sont ignorés.
+Chaque côté envoie des sondes UDP ; à la réception d'une sonde il confirme
+par le contrôle TCP "udp_ok". Un côté n'envoie ses états en UDP qu'une fois sa
+propre réception confirmée par le pair, sinon il reste sur TCP. Les sondes
+du client portent l'id attribué dans le hello_ack : le serveur partage un
+seul socket UDP entre tous ses clients.
+
+Le serveur accepte jusqu'à `max_clients` clients (1 pour une partie à deux,
+N pour le serveur dédié) : send / send_state diffusent à tous, send_to /
+send_state_to visent un client, receive_from rend (id client, data) et
+receive_state(id client) le dernier état de ce client.
+
+Tous les sockets sont non bloquants et multiplexés par un NetworkEngine
+unique (voir Network_Engine) : aucun thread par connexion. Sans thread
+d'E/S, les receive*() pompent le moteur eux-mêmes.
+
+Le découpage du flux se fait sans recopie (voir Network_Framing).
+Chaque endpoint alimente un NetworkTelemetry (voir Network_Telemetry) ;
+tick_telemetry() envoie les pings et clôt les périodes de mesure.
 """
 
+import random
 import socket
-import json
+import struct
 import threading
 import time
-from collections import deque
+from collections import defaultdict, deque
+from Game.Network_Codec import JsonCodec, get_codec, CODEC_JSON, CODEC_BINARY
+from Game.Network_Engine import get_engine, EVENT_READ, EVENT_WRITE
+from Game.Network_Framing import FrameBuffer, frame
+from Game.Network_Telemetry import NetworkTelemetry
 from Game.Network_Config import (
-    CONNECTION_TIMEOUT, RECEIVE_TIMEOUT, MAX_MESSAGE_SIZE,
-    MAX_RECONNECT_ATTEMPTS, RECONNECT_DELAY,
-    SERVER_BIND_ADDRESS, DEBUG
+    CONNECTION_TIMEOUT, MAX_DATAGRAM_SIZE,
+    MAX_RECONNECT_ATTEMPTS, RECONNECT_DELAY, UDP_PROBE_TIMEOUT,
+    SERVER_BIND_ADDRESS, NETWORK_CODEC, USE_UDP, PROTOCOL_VERSION, PING_INTERVAL, DEBUG
 )
 
-_DELIMITER = b'\n'
+# RecursionError : JSON trop imbriqué (b'[' * 100000) ; compté comme les autres échecs de décodage
+_DECODE_ERRORS = (ValueError, struct.error, IndexError, KeyError, RecursionError)
 
+_DATAGRAM = struct.Struct("<BI")   # type, seq
+_DGRAM_PROBE = 0
+_DGRAM_STATE = 1
+_CLIENT_ID = struct.Struct("<I")   # payload des sondes client
 
-class NetworkServer:
-    """Serveur TCP — accepte un seul client."""
+CHANNEL_STATE = ord("S")
+CHANNEL_CONTROL = ord("C")
+MSG_DEFAULT = "message"            # type des messages de contrôle sans type explicite
 
-    def __init__(self, port=5555):
-        self.port = port
-        self.server_socket = None
-        self.client_socket = None
+
+class Connection:
+    """Connexion TCP non bloquante : lecture par FrameBuffer, écriture bufferisée.
+
+    Ce qui ne part pas immédiatement reste dans un buffer de sortie, vidé
+    par le moteur quand le socket redevient inscriptible. En mode `corked`,
+    les messages s'accumulent jusqu'à flush() : un seul write par tick réseau.
+    Nagle est désactivé, le regroupement est fait ici.
+    """
+
+    def __init__(self, engine, sock, on_message, on_close=None, length_prefixed=False, corked=False,
+                 telemetry=None):
+        self.engine = engine
+        self.sock = sock
+        self.corked = corked
+        self.telemetry = telemetry or NetworkTelemetry(log_path=None)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.codec = JsonCodec()
+        self.frames = FrameBuffer(length_prefixed)
+        self.closed = False
+        self._on_message = on_message
+        self._on_close = on_close
+        self._out = bytearray()
+        self._out_lock = threading.Lock()
+        self._events = EVENT_READ
+        engine.register(sock, self)
+
+    def set_codec(self, codec):
+        self.codec = codec
+        self.frames.length_prefixed = codec.name == CODEC_BINARY
+
+    def handle_event(self, mask):
+        if mask & EVENT_READ:
+            self._read()
+        if mask & EVENT_WRITE and not self.closed:
+            with self._out_lock:
+                self._flush()
+
+    def _read(self):
+        try:
+            n = self.frames.recv_into(self.sock)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError:
+            self.close()
+            return
+        if not n:
+            self.close()
+            return
+        telemetry = self.telemetry
+        telemetry.on_receive(n)
+        for raw in self.frames.frames():
+            if not raw:
+                continue
+            start = time.perf_counter()
+            try:
+                message = self.codec.decode(raw[1:])
+            except _DECODE_ERRORS:
+                telemetry.on_drop("decode")
+                continue
+            telemetry.on_decode(time.perf_counter() - start)
+            telemetry.on_receive(0, 1)
+            if isinstance(message, dict):
+                self._on_message(self, raw[0], message)
+        if self.frames.oversized:
+            # Message plus grand que MAX_MESSAGE_SIZE : on coupe ce pair seul
+            telemetry.on_drop("oversize")
+            self.close()
+
+    def send(self, channel, data, codec=None):
+        """Encode, frame et envoie un message sur un canal (codec de la connexion par défaut)."""
+        codec = codec or self.codec
+        payload = frame(bytes((channel,)) + codec.encode(data), codec.name == CODEC_BINARY)
+        self.telemetry.on_send(len(payload))
+        return self.send_bytes(payload)
+
+    def send_control(self, kind, data=None, codec=None):
+        return self.send(CHANNEL_CONTROL, {"type": kind, "data": data}, codec)
+
+    def send_state(self, data):
+        return self.send(CHANNEL_STATE, data)
+
+    def send_bytes(self, data):
+        if self.closed:
+            return False
+        with self._out_lock:
+            self._out += data
+            if not self.corked:
+                self._flush()
+        return not self.closed
+
+    def flush(self):
+        """Écrit d'un coup tout ce qui a été accumulé."""
+        if not self.closed:
+            with self._out_lock:
+                self._flush()
+
+    def _flush(self):
+        try:
+            sent = self.sock.send(self._out) if self._out else 0
+        except (BlockingIOError, InterruptedError):
+            sent = 0
+        except OSError:
+            self.close()
+            return
+        del self._out[:sent]
+        events = EVENT_READ | EVENT_WRITE if self._out else EVENT_READ
+        if events != self._events:
+            self._events = events
+            self.engine.modify(self.sock, events, self)
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        self.engine.unregister(self.sock)
+        try:
+            self.sock.close()
+        except Exception:
+            pass
+        if self._on_close:
+            self._on_close(self)
+
+
+
+
+class DatagramSocket:
+    """Socket UDP non bloquant : lit les datagrammes et les remet à l'endpoint."""
+
+    def __init__(self, engine, address, on_datagram, telemetry=None):
+        self.engine = engine
+        self.telemetry = telemetry or NetworkTelemetry(log_path=None)
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            self.sock.bind(address)
+        except OSError:
+            self.sock.close()
+            raise
+        self.port = self.sock.getsockname()[1]
+        self._on_datagram = on_datagram
+        self._buf = bytearray(MAX_DATAGRAM_SIZE)
+        self._view = memoryview(self._buf)
+        engine.register(self.sock, self)
+
+    def handle_event(self, mask):
+        """Vide la file de datagrammes du socket (appelé par le moteur)."""
+        while True:
+            try:
+                size, addr = self.sock.recvfrom_into(self._buf)
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError:
+                # ICMP port unreachable (Windows) : le pair n'écoute pas encore
+                return
+            self.telemetry.on_receive(size, 1)
+            if size < _DATAGRAM.size:
+                self.telemetry.on_drop("runt")
+                continue
+            kind, seq = _DATAGRAM.unpack_from(self._buf)
+            self._on_datagram(addr, kind, seq, self._view[_DATAGRAM.size:size])
+
+    def close(self):
+        self.engine.unregister(self.sock)
+        try:
+            self.sock.close()
+        except Exception:
+            pass
+
+
+class UdpChannel:
+    """Canal datagramme vers un pair : séquençage et rejet des paquets périmés."""
+
+    def __init__(self, dgram, peer=None):
+        self.dgram = dgram
+        self.peer = peer                # (ip, port) du pair, appris via sonde côté serveur
+        self.peer_confirmed = False     # le pair a confirmé recevoir nos datagrammes
+        self.probe_received = False     # on a reçu au moins une sonde du pair
+        self.stale_dropped = 0
+        self._seq_out = 0
+        self._seq_in = 0
+
+    def send(self, kind, payload=b""):
+        if self.peer is None:
+            return False
+        self._seq_out += 1
+        packet = _DATAGRAM.pack(kind, self._seq_out) + payload
+        self.dgram.sock.sendto(packet, self.peer)
+        self.dgram.telemetry.on_send(len(packet))
+        return True
+
+    def accept(self, kind, seq):
+        """False si le snapshot est plus ancien que le dernier reçu."""
+        if kind == _DGRAM_STATE:
+            if seq <= self._seq_in:
+                self.stale_dropped += 1
+                self.dgram.telemetry.on_drop("stale")
+                return False
+            self._seq_in = seq
+        return True
+
+
+class RemoteClient:
+    """Client vu du serveur : connexion TCP, codec négocié, canal UDP éventuel."""
+
+    def __init__(self, client_id, connection, address):
+        self.client_id = client_id
+        self.connection = connection
+        self.address = address
+        self.negotiated = False
+        self.udp = None
+
+    @property
+    def codec(self):
+        return self.connection.codec
+
+    @property
+    def udp_ready(self):
+        return self.udp is not None and self.udp.peer_confirmed
+
+    def send(self, data, kind=MSG_DEFAULT):
+        return self.connection.send_control(kind, data)
+
+    def send_state(self, data):
+        if not self.udp_ready:
+            return self.connection.send_state(data)
+        return self.udp.send(_DGRAM_STATE, self.codec.encode(data))
+
+
+class _Endpoint:
+    """Partie commune serveur / client : moteur, canaux de réception, télémétrie."""
+
+    _role = ""
+
+    def __init__(self, udp, engine):
+        self.engine = engine or get_engine()
         self.is_running = False
-        self._queue = deque(maxlen=120)
-        self._buffer = b""
+        self.udp = None
+        self._udp_wanted = udp
+        self._state = {}                        # id client → dernier état reçu
+        self._control = defaultdict(deque)      # type → FIFO de (id client, data)
         self.lock = threading.Lock()
         self.last_error = ""
+        self.coalesce = False
+        self.telemetry = NetworkTelemetry(role=self._role)
+        self._last_ping = 0.0
+
+    def _connections(self):
+        return []
+
+    def set_coalescing(self, enabled):
+        """Active le regroupement des envois TCP jusqu'au prochain flush()."""
+        self.coalesce = enabled
+        for connection in self._connections():
+            connection.corked = enabled
+            if not enabled:
+                connection.flush()
+
+    def flush(self):
+        """Envoie en un write par connexion les messages regroupés."""
+        for connection in self._connections():
+            connection.flush()
+
+    def pump(self):
+        """Traite les E/S en attente quand aucun thread d'E/S ne tourne."""
+        if not self.engine.threaded:
+            self.engine.pump()
+
+    def _push_state(self, client_id, message):
+        with self.lock:
+            if client_id in self._state:
+                self.telemetry.on_drop("state_replaced")    # jamais lu : remplacé par plus récent
+            self._state[client_id] = message
+
+    def _push_control(self, client_id, message):
+        kind = message.get("type", MSG_DEFAULT)
+        if not isinstance(kind, str):
+            self.telemetry.on_drop("malformed")    # type inutilisable comme clé de file
+            return
+        with self.lock:
+            self._control[kind].append((client_id, message.get("data")))
+
+    def receive_state(self, client_id=None):
+        """Dernier état reçu (du client `client_id`, ou du premier disponible), ou None."""
+        self.pump()
+        with self.lock:
+            if client_id is None:
+                if not self._state:
+                    return None
+                client_id = next(iter(self._state))
+            return self._state.pop(client_id, None)
+
+    def receive_from(self, kind=MSG_DEFAULT):
+        """Prochain message de contrôle du type `kind` : (id client, data) ou None."""
+        self.pump()
+        with self.lock:
+            queue = self._control.get(kind)
+            return queue.popleft() if queue else None
+
+    def receive_control(self, kind=MSG_DEFAULT):
+        """Prochain message de contrôle du type `kind` (data seule), ou None."""
+        item = self.receive_from(kind)
+        return item[1] if item else None
+
+    receive = receive_control
+
+    def discard_control(self, *kinds):
+        """Vide les files de contrôle des types `kinds` (réponses périmées d'une manche passée)."""
+        with self.lock:
+            for kind in kinds:
+                self._control.pop(kind, None)
+
+    def _decode_state(self, codec, payload):
+        start = time.perf_counter()
+        try:
+            message = codec.decode(payload)
+        except _DECODE_ERRORS:
+            self.telemetry.on_drop("decode")
+            return None
+        self.telemetry.on_decode(time.perf_counter() - start)
+        return message
+
+    def _on_ping(self, message, reply):
+        """Ping / pong de contrôle. Retourne True si le message en était un."""
+        kind = message.get("type")
+        if kind == "ping":
+            reply(message.get("data"))
+            return True
+        if kind == "pong":
+            sent = message.get("data")
+            if isinstance(sent, (int, float)):
+                self.telemetry.on_rtt(time.perf_counter() * 1000 - sent)
+            return True
+        return False
+
+    def tick_telemetry(self, extra=None):
+        """À appeler à chaque frame / tick : pings périodiques, clôture des périodes.
+
+        `extra` : fonction rendant des champs à ajouter à l'enregistrement.
+        """
+        now = time.perf_counter()
+        if now - self._last_ping >= PING_INTERVAL:
+            self._last_ping = now
+            self.send(now * 1000, "ping")
+            self.flush()
+        if self.telemetry.due(now):
+            with self.lock:
+                self.telemetry.queue_depth = len(self._state) + sum(len(q) for q in self._control.values())
+            self.telemetry.send_queue_bytes = sum(len(c._out) for c in self._connections())
+            self.telemetry.roll(now, extra() if extra else None)
+
+
+class NetworkServer(_Endpoint):
+    """Serveur TCP (+ UDP) — accepte jusqu'à `max_clients` clients, chacun avec son codec."""
+
+    _role = "server"
+
+    def __init__(self, port=5555, udp=USE_UDP, engine=None, max_clients=1, seed=None):
+        super().__init__(udp, engine)
+        self.port = port
+        self.max_clients = max_clients
+        self.match_seed = random.getrandbits(32) if seed is None else seed
+        self.server_socket = None
+        self.clients = {}           # id → RemoteClient
+        self._by_addr = {}          # (ip, port) UDP → RemoteClient
+        self._next_id = 1
+        self.on_client_event = None     # rappel (kind, client_id) : "joined", "udp_ok", "left"
+
+    def _notify(self, kind, client_id):
+        """Signale un changement de client (appelé depuis le pompage ou le thread d'E/S)."""
+        if self.on_client_event:
+            self.on_client_event(kind, client_id)
+
+    def _first_client(self):
+        for client in self.clients.values():
+            if client.negotiated:
+                return client
+        return None
+
+    @property
+    def client_socket(self):
+        """Socket du premier client négocié (partie à deux), sinon None."""
+        client = self._first_client()
+        return client.connection.sock if client else None
+
+    @property
+    def client_address(self):
+        client = self._first_client()
+        return client.address if client else None
+
+    @property
+    def codec(self):
+        client = self._first_client()
+        return client.codec if client else JsonCodec()
+
+    @property
+    def udp_ready(self):
+        """True quand nos états partent en UDP vers tous les clients."""
+        return bool(self.clients) and all(c.udp_ready for c in self.clients.values())
 
     def start(self):
         try:
             self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
             self.server_socket.bind((SERVER_BIND_ADDRESS, self.port))
-            self.server_socket.listen(1)
+            self.server_socket.listen(self.max_clients)
             self.is_running = True
             if DEBUG:
                 print(f"[SERVER] Écoute sur {SERVER_BIND_ADDRESS}:{self.port}")
-            threading.Thread(target=self._listen, daemon=True).start()
+            if self._udp_wanted:
+                self._start_udp()
+            self.engine.register(self.server_socket, self)
             return True
         except Exception as e:
             self.last_error = f"{type(e).__name__}: {e}"
             print(f"Erreur démarrage serveur: {self.last_error}")
             return False
 
-    def _listen(self):
+    def _start_udp(self):
+        """Ouvre le socket UDP sur le même port. En cas d'échec, on reste en TCP seul."""
         try:
-            self.client_socket, addr = self.server_socket.accept()
-            self.client_socket.settimeout(RECEIVE_TIMEOUT)
+            self.udp = DatagramSocket(self.engine, (SERVER_BIND_ADDRESS, self.port), self._on_datagram,
+                                      self.telemetry)
+        except OSError as e:
+            self.udp = None
             if DEBUG:
-                print(f"[SERVER] Client connecté : {addr}")
-            self._read_loop(self.client_socket)
-        except Exception as e:
+                print(f"[SERVER] UDP indisponible : {e}")
+
+    def handle_event(self, mask):
+        """Socket d'écoute prêt : accepte un client s'il reste une place."""
+        try:
+            sock, addr = self.server_socket.accept()
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError as e:
             if DEBUG:
                 print(f"[SERVER] Erreur écoute : {e}")
+            return
+        if len(self.clients) >= self.max_clients:
+            sock.close()
+            return
+        client_id = self._next_id
+        self._next_id += 1
+        connection = Connection(
+            self.engine, sock,
+            lambda conn, channel, message: self._on_message(client_id, channel, message),
+            lambda conn: self._on_close(client_id),
+            corked=self.coalesce,
+            telemetry=self.telemetry,
+        )
+        self.clients[client_id] = RemoteClient(client_id, connection, addr)
+        if DEBUG:
+            print(f"[SERVER] Client {client_id} connecté : {addr}")
+
+    def _negotiate(self, client, message):
+        """Premier message reçu : adopte le codec annoncé par le client.
 
-    def _read_loop(self, sock):
-        """Boucle de lecture commune : découpe le flux TCP en messages JSON."""
-        while self.is_running:
+        Le client n'est exposé (client_socket, diffusion) qu'après la négociation,
+        pour ne jamais envoyer avec un framing qu'il n'attend pas.
+        Retourne True si le message était le hello (à ne pas mettre en file).
+        Un hello dont les données ne sont pas un objet (ou dont le codec n'est pas
+        une chaîne) ferme la connexion du client.
+        """
+        is_hello = isinstance(message, dict) and message.get("type") == "hello"
+        hello = (message.get("data") or {}) if is_hello else {}
+        if not isinstance(hello, dict) or not isinstance(hello.get("codec", CODEC_JSON), str):
+            self.telemetry.on_drop("malformed")
+            client.connection.close()
+            return True
+        if is_hello:
             try:
-                chunk = sock.recv(MAX_MESSAGE_SIZE)
-                if not chunk:
-                    break
-                self._buffer += chunk
-                while _DELIMITER in self._buffer:
-                    raw, self._buffer = self._buffer.split(_DELIMITER, 1)
-                    if raw:
-                        try:
-                            with self.lock:
-                                self._queue.append(json.loads(raw))
-                        except json.JSONDecodeError:
-                            pass
-            except socket.timeout:
-                continue
-            except Exception:
-                break
+                client.connection.set_codec(get_codec(hello.get("codec", CODEC_JSON)))
+            except ValueError as e:
+                self.last_error = str(e)
+            if DEBUG:
+                print(f"[SERVER] Client {client.client_id} : codec {client.codec.name}")
+        client.negotiated = True
+        if is_hello:
+            udp_port = None
+            if self.udp and hello.get("udp"):
+                udp_port = self.port
+                client.udp = UdpChannel(self.udp)
+            client.send({"version": PROTOCOL_VERSION, "codec": client.codec.name,
+                         "udp_port": udp_port, "client_id": client.client_id,
+                         "seed": self.match_seed}, "hello_ack")
+            client.connection.flush()
+        self._notify("joined", client.client_id)
+        return is_hello
+
+    def _on_message(self, client_id, channel, message):
+        client = self.clients.get(client_id)
+        if client is None:
+            return
+        if not client.negotiated and self._negotiate(client, message):
+            return
+        if channel == CHANNEL_STATE:
+            self._push_state(client_id, message)
+        elif message.get("type") == "udp_ok":
+            if client.udp:
+                client.udp.peer_confirmed = True
+                self._notify("udp_ok", client_id)
+        elif not self._on_ping(message, lambda data: self._pong(client, data)):
+            self._push_control(client_id, message)
+
+    @staticmethod
+    def _pong(client, data):
+        client.send(data, "pong")
+        client.connection.flush()
+
+    def _on_close(self, client_id):
+        client = self.clients.pop(client_id, None)
+        if client is None:
+            return
+        if client.udp and client.udp.peer:
+            self._by_addr.pop(client.udp.peer, None)
+        with self.lock:
+            self._state.pop(client_id, None)
+        self._push_control(client_id, {"type": "client_left"})
+        self._notify("left", client_id)
+        if DEBUG:
+            print(f"[SERVER] Client {client_id} déconnecté")
 
-    def send(self, data):
+    def _on_datagram(self, addr, kind, seq, payload):
+        """Sondes (qui lient une adresse UDP à un client) et snapshots d'état."""
+        client = self._by_addr.get(addr)
+        if client is None:
+            if kind != _DGRAM_PROBE or len(payload) < _CLIENT_ID.size:
+                return
+            client = self.clients.get(_CLIENT_ID.unpack_from(payload)[0])
+            if client is None or client.udp is None or client.address[0] != addr[0]:
+                self.telemetry.on_drop("foreign")
+                return
+            client.udp.peer = addr
+            self._by_addr[addr] = client
+        if not client.udp.accept(kind, seq):
+            return
+        if kind == _DGRAM_PROBE:
+            client.udp.send(_DGRAM_PROBE)
+            if not client.udp.probe_received:
+                client.udp.probe_received = True
+                client.send(None, "udp_ok")
+                client.connection.flush()
+            return
+        message = self._decode_state(client.codec, payload)
+        if isinstance(message, dict):
+            self._push_state(client.client_id, message)
+
+    def _connections(self):
+        return [c.connection for c in self.clients.values()]
+
+    def _each_client(self):
+        return [c for c in self.clients.values() if c.negotiated]
+
+    def send_to(self, client_id, data, kind=MSG_DEFAULT):
+        """Message de contrôle (type `kind`) vers un client."""
+        client = self.clients.get(client_id)
         try:
-            if self.client_socket:
-                self.client_socket.sendall(
-                    json.dumps(data, separators=(',', ':')).encode() + _DELIMITER
-                )
-                return True
+            return client is not None and client.negotiated and client.send(data, kind)
         except Exception as e:
             if DEBUG:
                 print(f"[SERVER] Erreur envoi : {e}")
-        return False
+            return False
 
-    def receive(self):
-        with self.lock:
-            return self._queue.popleft() if self._queue else None
+    def send_state_to(self, client_id, data):
+        """Snapshot d'état vers un client : UDP si son canal est confirmé, sinon TCP."""
+        client = self.clients.get(client_id)
+        try:
+            return client is not None and client.negotiated and client.send_state(data)
+        except OSError as e:
+            if DEBUG:
+                print(f"[SERVER] Erreur envoi UDP : {e}")
+            return False
+
+    def send(self, data, kind=MSG_DEFAULT):
+        """Diffuse un message de contrôle (type `kind`) à tous les clients."""
+        sent = False
+        for client in self._each_client():
+            sent = self.send_to(client.client_id, data, kind) or sent
+        return sent
+
+    def send_state(self, data):
+        """Diffuse un snapshot d'état à tous les clients."""
+        sent = False
+        for client in self._each_client():
+            sent = self.send_state_to(client.client_id, data) or sent
+        return sent
+
+    broadcast = send
 
     def stop(self):
         self.is_running = False
-        for s in (self.client_socket, self.server_socket):
+        self.telemetry.close()
+        for client in list(self.clients.values()):
+            client.connection.close()
+        if self.udp:
+            self.udp.close()
+        if self.server_socket:
+            self.engine.unregister(self.server_socket)
             try:
-                if s: s.close()
+                self.server_socket.close()
             except Exception:
                 pass
 
 
-class NetworkClient:
-    """Client TCP — se connecte à un NetworkServer."""
+class NetworkClient(_Endpoint):
+    """Client TCP (+ UDP) — se connecte à un NetworkServer avec le codec choisi."""
+
+    _role = "client"
 
-    def __init__(self, host, port=5555):
+    def __init__(self, host, port=5555, codec=NETWORK_CODEC, udp=USE_UDP, engine=None):
+        super().__init__(udp, engine)
         self.host = host
         self.port = port
         self.socket = None
-        self.is_running = False
-        self._queue = deque(maxlen=120)
-        self._buffer = b""
-        self.lock = threading.Lock()
-        self.last_error = ""
+        self.connection = None
+        self.codec = get_codec(codec)
+        self.client_id = None
+        self.match_seed = None      # graine de la partie, reçue dans le hello_ack
+        self._dgram = None
+        self._hello_acked = False
+
+    @property
+    def udp_ready(self):
+        """True quand nos états partent en UDP (réception confirmée par le serveur)."""
+        return self.udp is not None and self.udp.peer_confirmed
 
     def connect(self):
         self.last_error = ""
@@ -125,21 +699,27 @@ class NetworkClient:
                 self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
                 self.socket.settimeout(CONNECTION_TIMEOUT)
                 self.socket.connect((self.host, self.port))
-                self.socket.settimeout(RECEIVE_TIMEOUT)
+                self.connection = Connection(self.engine, self.socket, self._on_message,
+                                             telemetry=self.telemetry)
+                # Hello toujours en JSON + \n : le serveur ne connaît pas encore le codec
+                hello = {"version": PROTOCOL_VERSION, "codec": self.codec.name, "udp": self._udp_wanted}
+                self.connection.set_codec(self.codec)
+                self.connection.send_control("hello", hello, JsonCodec())
+                self.connection.corked = self.coalesce
                 self.is_running = True
                 if DEBUG:
                     print(f"[CLIENT] Connecté à {self.host}:{self.port} (tentative {attempt})")
-                threading.Thread(target=self._listen, daemon=True).start()
+                self._negotiate_udp()
                 return True
             except Exception as e:
                 self.last_error = f"{type(e).__name__}: {e}"
                 if DEBUG:
                     print(f"[CLIENT] Tentative {attempt}/{MAX_RECONNECT_ATTEMPTS} échouée: {self.last_error}")
-                try:
-                    if self.socket:
-                        self.socket.close()
-                except Exception:
-                    pass
+                if self.connection:
+                    self.connection.close()
+                    self.connection = None
+                elif self.socket:
+                    self.socket.close()
                 self.socket = None
 
                 if attempt < MAX_RECONNECT_ATTEMPTS:
@@ -148,47 +728,95 @@ class NetworkClient:
         print(f"Erreur connexion: {self.last_error}")
         return False
 
-    def _listen(self):
-        """Boucle de lecture : même logique que le serveur."""
-        while self.is_running:
+    def _negotiate_udp(self):
+        """Attend le hello_ack puis sonde le canal UDP (TCP seul en cas d'échec)."""
+        if not self.engine.wait_until(lambda: self._hello_acked, CONNECTION_TIMEOUT) or self.udp is None:
+            return
+        probe = _CLIENT_ID.pack(self.client_id or 0)
+        deadline = time.time() + UDP_PROBE_TIMEOUT
+        while time.time() < deadline and not self.udp.peer_confirmed:
             try:
-                chunk = self.socket.recv(MAX_MESSAGE_SIZE)
-                if not chunk:
-                    break
-                self._buffer += chunk
-                while _DELIMITER in self._buffer:
-                    raw, self._buffer = self._buffer.split(_DELIMITER, 1)
-                    if raw:
-                        try:
-                            with self.lock:
-                                self._queue.append(json.loads(raw))
-                        except json.JSONDecodeError:
-                            pass
-            except socket.timeout:
-                continue
-            except Exception:
+                self.udp.send(_DGRAM_PROBE, probe)
+            except OSError:
                 break
+            self.engine.wait_until(lambda: self.udp.peer_confirmed, 0.05)
+        if DEBUG:
+            print(f"[CLIENT] Canal UDP {'actif' if self.udp_ready else 'indisponible (TCP seul)'}")
+
+    def _connections(self):
+        return [self.connection] if self.connection else []
+
+    def _on_hello_ack(self, message):
+        message = message or {}
+        self.client_id = message.get("client_id")
+        self.match_seed = message.get("seed")
+        udp_port = message.get("udp_port")
+        if udp_port and self._udp_wanted:
+            try:
+                self._dgram = DatagramSocket(self.engine, ("", 0), self._on_datagram, self.telemetry)
+                self.udp = UdpChannel(self._dgram, (self.socket.getpeername()[0], udp_port))
+            except OSError as e:
+                self.udp = None
+                if DEBUG:
+                    print(f"[CLIENT] UDP indisponible : {e}")
+        self._hello_acked = True
+
+    def _on_message(self, connection, channel, message):
+        if channel == CHANNEL_STATE:
+            self._push_state(None, message)
+        elif message.get("type") == "hello_ack":
+            self._on_hello_ack(message.get("data"))
+        elif message.get("type") == "udp_ok":
+            if self.udp:
+                self.udp.peer_confirmed = True
+        elif not self._on_ping(message, self._pong):
+            self._push_control(None, message)
+
+    def _pong(self, data):
+        self.send(data, "pong")
+        self.flush()
+
+    def _on_datagram(self, addr, kind, seq, payload):
+        if self.udp is None or addr != self.udp.peer:
+            self.telemetry.on_drop("foreign")
+            return
+        if not self.udp.accept(kind, seq):
+            return
+        if kind == _DGRAM_PROBE:
+            if not self.udp.probe_received:
+                self.udp.probe_received = True
+                self.send(None, "udp_ok")
+                self.flush()
+            return
+        message = self._decode_state(self.codec, payload)
+        if isinstance(message, dict):
+            self._push_state(None, message)
 
-    def send(self, data):
+    def send(self, data, kind=MSG_DEFAULT):
+        """Message de contrôle (type `kind`) vers le serveur."""
         try:
-            if self.socket:
-                self.socket.sendall(
-                    json.dumps(data, separators=(',', ':')).encode() + _DELIMITER
-                )
-                return True
+            if self.connection:
+                return self.connection.send_control(kind, data)
         except Exception as e:
             if DEBUG:
                 print(f"[CLIENT] Erreur envoi : {e}")
         return False
 
-    def receive(self):
-        with self.lock:
-            return self._queue.popleft() if self._queue else None
+    def send_state(self, data):
+        """Snapshot d'état : UDP si le canal est confirmé, sinon TCP."""
+        try:
+            if not self.udp_ready:
+                return self.connection is not None and self.connection.send_state(data)
+            return self.udp.send(_DGRAM_STATE, self.codec.encode(data))
+        except OSError as e:
+            if DEBUG:
+                print(f"[CLIENT] Erreur envoi UDP : {e}")
+            return False
 
     def disconnect(self):
         self.is_running = False
-        try:
-            if self.socket:
-                self.socket.close()
-        except Exception:
-            pass
+        self.telemetry.close()
+        if self._dgram:
+            self._dgram.close()
+        if self.connection:
+            self.connection.close()
@@ -0,0 +1,254 @@
+"""Codecs de sérialisation des messages réseau.
+
+JsonCodec   : JSON texte (protocole historique, lisible).
+BinaryCodec : snapshots d'état packés avec struct, coordonnées et angles
+              en virgule fixe. Les autres messages (scores, départs...)
+              restent encodés en JSON à l'intérieur du même flux.
+
+Le premier octet d'un payload binaire vaut BINARY_MAGIC, jamais '{',
+ce qui permet de distinguer les deux formats à la réception.
+"""
+
+import json
+import struct
+
+CODEC_JSON = "json"
+CODEC_BINARY = "binary"
+
+BINARY_MAGIC = 0xA7
+BINARY_VERSION = 4
+
+# Virgule fixe : 1/8 px pour les positions, 1/256 px/frame pour les vitesses,
+# 360° répartis sur 16 bits pour les angles.
+POS_SCALE = 8
+VEL_SCALE = 256
+ANGLE_SCALE = 65536 / 360.0
+
+POWERUP_TYPES = ("heal", "speed")
+
+_HEADER = struct.Struct("<BBIiiIHB")     # magic, version, seq, ack, base, t, round, tank_mask
+_COUNTS = struct.Struct("<BBBBB")        # groupes de shells, shells_gone, powerups, powerups_gone, picked
+_GROUP = struct.Struct("<BB")            # masque des champs présents, nombre de shells
+_POWERUP = struct.Struct("<IhhB")        # id, x, y, type
+_ID = struct.Struct("<I")
+
+# (clé, format, échelle) — l'ordre fixe les bits du masque. Les champs "H" sont
+# des angles (modulo 360°), une échelle None signifie un entier transmis tel quel.
+_TANK_FIELDS = (
+    ("x", "h", POS_SCALE),
+    ("y", "h", POS_SCALE),
+    ("hull_angle", "H", ANGLE_SCALE),
+    ("turret_angle", "H", ANGLE_SCALE),
+    ("health", "B", None),
+)
+_SHELL_FIELDS = (
+    ("x", "h", POS_SCALE),
+    ("y", "h", POS_SCALE),
+    ("vx", "h", VEL_SCALE),
+    ("vy", "h", VEL_SCALE),
+    ("bounces", "B", None),
+)
+
+_STATE_KEYS = frozenset((
+    "seq", "ack", "round", "base", "t", "x", "y", "hull_angle", "turret_angle", "health",
+    "shells", "shells_gone", "powerups", "powerups_gone", "picked_powerup_ids",
+))
+
+
+def _layout(fields, mask, prefix=""):
+    """(Struct, [(clé, format, échelle)]) des champs présents dans `mask`, en cache.
+
+    `prefix` ajoute des champs fixes en tête (ex. "I" pour l'id d'un shell).
+    """
+    key = (id(fields), mask, prefix)
+    layout = _CACHE.get(key)
+    if layout is None:
+        present = [f for i, f in enumerate(fields) if mask & (1 << i)]
+        layout = (struct.Struct("<" + prefix + "".join(f[1] for f in present)), present)
+        _CACHE[key] = layout
+    return layout
+
+
+def _records(record, count):
+    """Struct pour `count` enregistrements consécutifs (un seul pack par liste)."""
+    key = (record.format, count)
+    packer = _CACHE.get(key)
+    if packer is None:
+        packer = struct.Struct("<" + record.format.lstrip("<") * count)
+        _CACHE[key] = packer
+    return packer
+
+
+_CACHE = {}
+
+
+def _pack_fields(fields, data):
+    """Retourne (masque, valeurs quantifiées) pour les clés présentes dans `data`."""
+    mask, values = 0, []
+    for i, (key, fmt, scale) in enumerate(fields):
+        if key in data:
+            mask |= 1 << i
+            v = data[key]
+            if scale is None:
+                values.append(int(v))
+            elif fmt == "H":
+                values.append(round((v % 360.0) * scale) & 0xFFFF)
+            else:
+                values.append(round(v * scale))
+    return mask, values
+
+
+def _unpack_fields(fields, mask, raw, offset, out):
+    packer, present = _layout(fields, mask)
+    for (key, _, scale), q in zip(present, packer.unpack_from(raw, offset)):
+        out[key] = q / scale if scale else q
+    return offset + packer.size
+
+
+class JsonCodec:
+    """Encodage JSON compact (séparateurs minimaux)."""
+
+    name = CODEC_JSON
+
+    def encode(self, data):
+        return json.dumps(data, separators=(',', ':')).encode()
+
+    def decode(self, raw):
+        if isinstance(raw, memoryview):
+            raw = str(raw, "utf-8")     # décodage direct depuis le buffer de réception
+        return json.loads(raw)
+
+
+class BinaryCodec:
+    """Snapshots d'état (keyframes et deltas, voir Snapshot_Delta) packés avec struct.
+
+    Layout (little-endian), les masques indiquent les champs présents :
+        header        B magic, B version, I seq, i ack, i base (-1 = keyframe),
+                      I t (horloge émetteur, ms), H round (manche), B masque tank
+        tank          h x, h y, H hull_angle, H turret_angle, B health   (selon masque)
+        counts        B groupes, B shells_gone, B powerups, B powerups_gone, B picked
+        groupe        B masque, B nombre, puis par shell :
+                      I id, h x, h y, h vx, h vy, B bounces             (selon masque)
+        shells_gone   I id
+        powerups      I id, h x, h y, B type
+        powerups_gone I id
+        picked        I id
+    """
+
+    name = CODEC_BINARY
+
+    def __init__(self):
+        self._json = JsonCodec()
+
+    @staticmethod
+    def is_snapshot(data):
+        return isinstance(data, dict) and "seq" in data and data.keys() <= _STATE_KEYS
+
+    def encode(self, data):
+        if not self.is_snapshot(data):
+            return self._json.encode(data)
+
+        shells = data.get("shells", ())[:255]
+        shells_gone = data.get("shells_gone", ())[:255]
+        powerups = data.get("powerups", ())[:255]
+        powerups_gone = data.get("powerups_gone", ())[:255]
+        picked = data.get("picked_powerup_ids", ())[:255]
+
+        # Shells regroupés par masque : un seul pack par groupe
+        groups = {}
+        for s in shells:
+            mask, values = _pack_fields(_SHELL_FIELDS, s)
+            groups.setdefault(mask, []).append((s["id"], values))
+
+        tank_mask, tank_values = _pack_fields(_TANK_FIELDS, data)
+        parts = [
+            _HEADER.pack(BINARY_MAGIC, BINARY_VERSION, data["seq"], data["ack"],
+                         data.get("base", -1), data.get("t", 0) & 0xFFFFFFFF, data.get("round", 0),
+                         tank_mask),
+            _layout(_TANK_FIELDS, tank_mask)[0].pack(*tank_values),
+            _COUNTS.pack(len(groups), len(shells_gone), len(powerups),
+                         len(powerups_gone), len(picked)),
+        ]
+        for mask, members in groups.items():
+            record = _layout(_SHELL_FIELDS, mask, "I")[0]
+            flat = []
+            for sid, values in members:
+                flat.append(sid)
+                flat += values
+            parts.append(_GROUP.pack(mask, len(members)))
+            parts.append(_records(record, len(members)).pack(*flat))
+        if shells_gone:
+            parts.append(_records(_ID, len(shells_gone)).pack(*shells_gone))
+        if powerups:
+            flat = []
+            for p in powerups:
+                flat += (p["id"], round(p["x"] * POS_SCALE), round(p["y"] * POS_SCALE),
+                         POWERUP_TYPES.index(p["type"]))
+            parts.append(_records(_POWERUP, len(powerups)).pack(*flat))
+        if powerups_gone:
+            parts.append(_records(_ID, len(powerups_gone)).pack(*powerups_gone))
+        if picked:
+            parts.append(_records(_ID, len(picked)).pack(*picked))
+        return b"".join(parts)
+
+    def decode(self, raw):
+        if not raw or raw[0] != BINARY_MAGIC:
+            return self._json.decode(raw)
+
+        _, version, seq, ack, base, t, round_no, tank_mask = _HEADER.unpack_from(raw, 0)
+        if version != BINARY_VERSION:
+            raise ValueError(f"Version de snapshot inconnue : {version}")
+
+        data = {"seq": seq, "ack": ack, "round": round_no, "t": t}
+        if base >= 0:
+            data["base"] = base
+        offset = _unpack_fields(_TANK_FIELDS, tank_mask, raw, _HEADER.size, data)
+
+        n_groups, n_gone, n_powerups, n_pgone, n_picked = _COUNTS.unpack_from(raw, offset)
+        offset += _COUNTS.size
+
+        view = memoryview(raw)
+        if n_groups:
+            shells = []
+            for _ in range(n_groups):
+                mask, count = _GROUP.unpack_from(raw, offset)
+                offset += _GROUP.size
+                record, present = _layout(_SHELL_FIELDS, mask, "I")
+                end = offset + count * record.size
+                keys = [("id", None)] + [(key, scale) for key, _, scale in present]
+                for values in record.iter_unpack(view[offset:end]):
+                    shells.append({key: q / scale if scale else q
+                                   for (key, scale), q in zip(keys, values)})
+                offset = end
+            data["shells"] = shells
+
+        if n_gone:
+            end = offset + n_gone * _ID.size
+            data["shells_gone"] = [sid for (sid,) in _ID.iter_unpack(view[offset:end])]
+            offset = end
+        if n_powerups:
+            end = offset + n_powerups * _POWERUP.size
+            data["powerups"] = [
+                {"id": pid, "x": px / POS_SCALE, "y": py / POS_SCALE, "type": POWERUP_TYPES[ptype]}
+                for pid, px, py, ptype in _POWERUP.iter_unpack(view[offset:end])
+            ]
+            offset = end
+        if n_pgone:
+            end = offset + n_pgone * _ID.size
+            data["powerups_gone"] = [pid for (pid,) in _ID.iter_unpack(view[offset:end])]
+            offset = end
+        if n_picked:
+            end = offset + n_picked * _ID.size
+            data["picked_powerup_ids"] = [pid for (pid,) in _ID.iter_unpack(view[offset:end])]
+        return data
+
+
+_CODECS = {CODEC_JSON: JsonCodec, CODEC_BINARY: BinaryCodec}
+
+
+def get_codec(name):
+    """Instancie un codec depuis son nom ('json' ou 'binary')."""
+    try:
+        return _CODECS[name]()
+    except (KeyError, TypeError):       # TypeError : nom non hachable (liste...)
+        raise ValueError(f"Codec réseau inconnu : {name}") from None
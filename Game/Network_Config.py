@@ -1,9 +1,30 @@
+import os
+from Config import SIM_HZ
+
 DEFAULT_PORT = 5555
 CONNECTION_TIMEOUT = 5     # secondes
 RECEIVE_TIMEOUT = 5        # secondes
-NETWORK_FPS = 50
+NETWORK_FPS = 50            # ticks d'envoi par seconde (SendScheduler), indépendant de FPS
 MAX_RECONNECT_ATTEMPTS = 3
 RECONNECT_DELAY = 1        # secondes
-MAX_MESSAGE_SIZE = 4096    # bytes
+MAX_MESSAGE_SIZE = 256 * 1024  # bytes : au-delà, la connexion est coupée (voir FrameBuffer)
 SERVER_BIND_ADDRESS = '0.0.0.0'
 DEBUG = False
+NETWORK_CODEC = 'binary'   # 'json' ou 'binary', annoncé par le client à la connexion
+PROTOCOL_VERSION = 1
+USE_UDP = True             # canal datagramme pour les snapshots d'état (repli TCP automatique)
+MAX_DATAGRAM_SIZE = 65507  # bytes
+UDP_PROBE_TIMEOUT = 1.0    # secondes pour confirmer le canal UDP à la connexion
+NETWORK_IO_THREAD = False  # False : le moteur réseau est pompé par la boucle de jeu
+IO_POLL_INTERVAL = 0.05    # secondes d'attente max par tour du moteur réseau
+SERVER_TICK_RATE = SIM_HZ  # ticks/s du serveur dédié : un tick = un pas de simulation
+SNAPSHOT_INTERVAL = 2      # un snapshot par client tous les N ticks
+VIEW_RADIUS = 1024         # rayon d'intérêt (pixels) autour du tank d'un client
+MAX_PLAYERS = 16
+INTERP_DELAY_MS = 80       # retard d'affichage du pair (jitter buffer), ms
+MAX_EXTRAPOLATION_MS = 200 # extrapolation max quand les snapshots sont en retard, ms
+TELEMETRY_INTERVAL = 1.0   # secondes par enregistrement de télémétrie (et par ping)
+# Journal JSONL de télémétrie : désactivé par défaut, chemin donné par la variable
+# d'environnement TANK_TELEMETRY_LOG (ou --telemetry-log du serveur dédié)
+TELEMETRY_LOG = os.environ.get('TANK_TELEMETRY_LOG') or None
+PING_INTERVAL = 0.5        # secondes entre deux pings de mesure du RTT
@@ -0,0 +1,109 @@
+"""Moteur réseau unique basé sur selectors.
+
+Un seul NetworkEngine multiplexe tous les sockets non bloquants (écoute,
+TCP, UDP) : plus de thread par connexion. Il est soit pompé depuis la
+boucle de jeu (pump), soit exécuté sur un unique thread d'E/S (start).
+
+Chaque socket est enregistré avec un handler exposant handle_event(mask).
+"""
+
+import selectors
+import threading
+import time
+from Game.Network_Config import NETWORK_IO_THREAD, IO_POLL_INTERVAL
+
+EVENT_READ = selectors.EVENT_READ
+EVENT_WRITE = selectors.EVENT_WRITE
+
+
+class NetworkEngine:
+    """Boucle d'évènements réseau partagée par serveurs et clients."""
+
+    def __init__(self):
+        self._selector = selectors.DefaultSelector()
+        self._lock = threading.Lock()        # enregistrements du selector
+        self._pump_lock = threading.Lock()   # un seul pump à la fois
+        self._thread = None
+        self.running = False
+
+    @property
+    def threaded(self):
+        return self._thread is not None
+
+    def register(self, sock, handler, events=EVENT_READ):
+        sock.setblocking(False)
+        with self._lock:
+            self._selector.register(sock, events, handler)
+
+    def modify(self, sock, events, handler):
+        with self._lock:
+            try:
+                self._selector.modify(sock, events, handler)
+            except (KeyError, ValueError):
+                pass
+
+    def unregister(self, sock):
+        with self._lock:
+            try:
+                self._selector.unregister(sock)
+            except (KeyError, ValueError):
+                pass
+
+    def pump(self, timeout=0.0):
+        """Traite les évènements prêts (attend au plus `timeout` s). Retourne leur nombre."""
+        with self._pump_lock:
+            with self._lock:
+                empty = not self._selector.get_map()
+            if empty:
+                # select() sans socket lève une erreur sous Windows
+                if timeout:
+                    time.sleep(timeout)
+                return 0
+            events = self._selector.select(timeout)
+            for key, mask in events:
+                key.data.handle_event(mask)
+            return len(events)
+
+    def start(self):
+        """Lance l'unique thread d'E/S (sans effet s'il tourne déjà)."""
+        if self._thread is None:
+            self.running = True
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """Arrête le thread d'E/S : la boucle de jeu reprend le pompage."""
+        if self._thread is not None:
+            self.running = False
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        while self.running:
+            self.pump(IO_POLL_INTERVAL)
+
+    def wait_until(self, predicate, timeout):
+        """Attend que `predicate()` soit vrai, en pompant si aucun thread d'E/S ne tourne."""
+        deadline = time.time() + timeout
+        while not predicate():
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                return False
+            if self.threaded:
+                time.sleep(min(0.01, remaining))
+            else:
+                self.pump(min(IO_POLL_INTERVAL, remaining))
+        return True
+
+
+_default_engine = None
+
+
+def get_engine():
+    """Moteur partagé par défaut, démarré sur son thread d'E/S si NETWORK_IO_THREAD."""
+    global _default_engine
+    if _default_engine is None:
+        _default_engine = NetworkEngine()
+        if NETWORK_IO_THREAD:
+            _default_engine.start()
+    return _default_engine
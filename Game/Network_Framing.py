@@ -0,0 +1,110 @@
+"""Découpage du flux TCP en messages, sans recopie du buffer.
+
+FrameBuffer lit avec recv_into dans un bytearray préalloué et cherche les
+frontières de messages par index : chaque message est rendu sous forme de
+memoryview sur le buffer, décodé une seule fois par le codec. Seul le
+fragment de message incomplet est déplacé en tête quand la place manque.
+
+Deux framings :
+- délimiteur  : payload + b"\\n" (JSON)
+- longueur    : uint32 little-endian + payload (binaire)
+
+Un message annoncé (ou un fragment sans délimiteur) plus grand que
+`max_size` arrête le découpage et lève `oversized` : l'appelant coupe la
+connexion plutôt que de laisser le buffer grossir sans fin.
+"""
+
+import struct
+from Game.Network_Config import MAX_MESSAGE_SIZE
+
+DELIMITER = b'\n'
+LENGTH = struct.Struct("<I")
+
+DEFAULT_CAPACITY = 64 * 1024
+MIN_RECV_SPACE = 4096               # place libre minimale avant un recv_into
+
+
+def frame(payload, length_prefixed):
+    """Ajoute le délimiteur ou le préfixe de longueur à un payload encodé."""
+    if length_prefixed:
+        return LENGTH.pack(len(payload)) + payload
+    return payload + DELIMITER
+
+
+class FrameBuffer:
+    """Buffer de réception préalloué partagé par les boucles de lecture."""
+
+    def __init__(self, length_prefixed=False, capacity=DEFAULT_CAPACITY, max_size=MAX_MESSAGE_SIZE):
+        self.length_prefixed = length_prefixed
+        self.max_size = max_size
+        self.oversized = False  # message trop long vu : flux à abandonner
+        self._buf = bytearray(capacity)
+        self._view = memoryview(self._buf)
+        self._start = 0     # début des données non consommées
+        self._end = 0       # fin des données reçues
+
+    def __len__(self):
+        return self._end - self._start
+
+    def recv_into(self, sock):
+        """Lit depuis le socket directement dans l'espace libre. Retourne 0 si fermé.
+
+        Le buffer double de taille si un message incomplet ne laisse plus assez de place.
+        """
+        self._make_room(MIN_RECV_SPACE)
+        n = sock.recv_into(self._view[self._end:])
+        self._end += n
+        return n
+
+    def feed(self, data):
+        """Ajoute des octets déjà reçus (tests, benchmarks)."""
+        self._make_room(len(data))
+        self._view[self._end:self._end + len(data)] = data
+        self._end += len(data)
+
+    def _make_room(self, needed):
+        if len(self._buf) - self._end >= needed:
+            return
+        pending = self._end - self._start
+        if len(self._buf) - pending >= needed:
+            # Recopie du seul fragment incomplet en tête de buffer
+            self._view[:pending] = self._view[self._start:self._end]
+        else:
+            size = len(self._buf)
+            while size - pending < needed:
+                size *= 2
+            grown = bytearray(size)
+            grown[:pending] = self._view[self._start:self._end]
+            self._buf, self._view = grown, memoryview(grown)
+        self._start, self._end = 0, pending
+
+    def frames(self):
+        """Itère sur les messages complets (memoryviews valides jusqu'au prochain recv_into).
+
+        `length_prefixed` est relu à chaque message : il peut changer en cours
+        de route (négociation du codec après le hello). S'arrête en levant
+        `oversized` si le message en attente dépasse `max_size`.
+        """
+        while True:
+            if self.length_prefixed:
+                if self._end - self._start < LENGTH.size:
+                    break
+                size = LENGTH.unpack_from(self._buf, self._start)[0]
+                if size > self.max_size:
+                    self.oversized = True
+                    return
+                begin = self._start + LENGTH.size
+                if self._end - begin < size:
+                    break
+                self._start = begin + size
+                yield self._view[begin:begin + size]
+            else:
+                idx = self._buf.find(DELIMITER, self._start, self._end)
+                if idx < 0:
+                    self.oversized = self._end - self._start > self.max_size
+                    break
+                begin, self._start = self._start, idx + 1
+                if idx > begin:
+                    yield self._view[begin:idx]
+        if self._start == self._end:
+            self._start = self._end = 0
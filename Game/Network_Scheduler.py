@@ -0,0 +1,53 @@
+"""Cadencement des envois réseau, indépendant du FPS de rendu.
+
+Le SendScheduler active le regroupement des envois sur l'endpoint : tout
+ce qui est envoyé pendant un tick réseau part en un seul write au flush().
+La boucle de jeu demande `due()` à chaque frame et n'envoie son état que
+lorsqu'un tick est dû (NETWORK_FPS par défaut).
+"""
+
+import time
+from collections import deque
+from Game.Network_Config import NETWORK_FPS
+
+
+class SendScheduler:
+    """Ticks d'envoi à fréquence fixe sur un NetworkServer / NetworkClient."""
+
+    def __init__(self, network, rate=NETWORK_FPS, clock=time.perf_counter):
+        self.network = network
+        self.rate = rate
+        self.interval = 1.0 / rate
+        self._clock = clock
+        self._next_send = 0.0
+        self._flushed_at = deque()
+        network.set_coalescing(True)
+
+    def due(self):
+        """True si un tick d'envoi est dû. Une frame lente ne provoque pas de rafale."""
+        now = self._clock()
+        if now < self._next_send:
+            return False
+        self._next_send += self.interval
+        if self._next_send <= now:
+            self._next_send = now + self.interval
+        return True
+
+    def flush(self):
+        """Fin de tick : envoie les messages regroupés en un write."""
+        self.network.flush()
+        now = self._clock()
+        self._flushed_at.append(now)
+        while self._flushed_at and now - self._flushed_at[0] > 1.0:
+            self._flushed_at.popleft()
+
+    @property
+    def achieved_rate(self):
+        """Ticks d'envoi effectués sur la dernière seconde."""
+        if self._flushed_at and self._clock() - self._flushed_at[-1] > 1.0:
+            self._flushed_at.clear()
+        return len(self._flushed_at)
+
+    def stop(self):
+        """Rend l'endpoint à l'envoi immédiat."""
+        self.network.set_coalescing(False)
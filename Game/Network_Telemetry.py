@@ -0,0 +1,149 @@
+"""Télémétrie réseau : compteurs, histogrammes et journal JSONL.
+
+Chaque endpoint possède un NetworkTelemetry alimenté par la couche réseau :
+octets et messages dans chaque sens, RTT (ping / pong de contrôle), temps
+de décodage, profondeur des files de réception, messages perdus ou ignorés.
+Toutes les `interval` secondes, roll() fige la période écoulée dans `last`
+(affiché par l'overlay F3 de MultiGame) et, si un chemin est configuré
+(TELEMETRY_LOG), l'ajoute au journal JSONL.
+"""
+
+import bisect
+import json
+import time
+from Game.Network_Config import TELEMETRY_INTERVAL, TELEMETRY_LOG
+
+RTT_BOUNDS_MS = (1, 2, 5, 10, 20, 30, 50, 75, 100, 150, 200, 300, 500, 1000)
+DECODE_BOUNDS_US = (5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+
+class Histogram:
+    """Histogramme à seaux fixes (bornes supérieures), avec moyenne et max."""
+
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.reset()
+
+    def reset(self):
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, value):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def percentile(self, p):
+        """Borne supérieure du seau contenant le p-ième centile (max au-delà de la dernière borne)."""
+        if not self.count:
+            return 0.0
+        target = p / 100.0 * self.count
+        seen = 0
+        for bound, n in zip(self.bounds, self.counts):
+            seen += n
+            if seen >= target:
+                return min(bound, self.max)
+        return self.max
+
+    def summary(self):
+        return {
+            "count": self.count,
+            "mean": round(self.total / self.count, 2) if self.count else 0.0,
+            "p50": round(self.percentile(50), 2),
+            "p95": round(self.percentile(95), 2),
+            "max": round(self.max, 2),
+        }
+
+
+class NetworkTelemetry:
+    """Compteurs d'un endpoint, figés par période dans `last`."""
+
+    def __init__(self, interval=TELEMETRY_INTERVAL, log_path=TELEMETRY_LOG, role=""):
+        self.interval = interval
+        self.log_path = log_path
+        self.role = role
+        self.rtt = Histogram(RTT_BOUNDS_MS)
+        self.decode = Histogram(DECODE_BOUNDS_US)
+        self.totals = {"bytes_in": 0, "bytes_out": 0, "msgs_in": 0, "msgs_out": 0, "dropped": 0}
+        self.last = {}
+        self.queue_depth = 0
+        self.send_queue_bytes = 0
+        self._period = dict.fromkeys(self.totals, 0)
+        self._drops = {}
+        self._period_start = time.perf_counter()
+        self._log = None
+
+    # ── Alimentation (couche réseau) ───────────────────────────
+
+    def on_receive(self, nbytes, messages=0):
+        self._period["bytes_in"] += nbytes
+        self._period["msgs_in"] += messages
+
+    def on_send(self, nbytes, messages=1):
+        self._period["bytes_out"] += nbytes
+        self._period["msgs_out"] += messages
+
+    def on_decode(self, seconds):
+        self.decode.add(seconds * 1e6)
+
+    def on_drop(self, reason):
+        """Message perdu ou ignoré : périmé, illisible, écrasé avant lecture..."""
+        self._period["dropped"] += 1
+        self._drops[reason] = self._drops.get(reason, 0) + 1
+
+    def on_rtt(self, ms):
+        self.rtt.add(ms)
+
+    # ── Périodes ────────────────────────────────────────────────
+
+    def due(self, now=None):
+        now = time.perf_counter() if now is None else now
+        return now - self._period_start >= self.interval
+
+    def roll(self, now=None, extra=None):
+        """Clôt la période : calcule les débits, remet les compteurs à zéro, journalise."""
+        now = time.perf_counter() if now is None else now
+        elapsed = max(1e-6, now - self._period_start)
+        for key, value in self._period.items():
+            self.totals[key] += value
+        self.last = {
+            "ts": round(time.time(), 3),
+            "role": self.role,
+            "kb_in_s": round(self._period["bytes_in"] / 1024 / elapsed, 2),
+            "kb_out_s": round(self._period["bytes_out"] / 1024 / elapsed, 2),
+            "msgs_in_s": round(self._period["msgs_in"] / elapsed, 1),
+            "msgs_out_s": round(self._period["msgs_out"] / elapsed, 1),
+            "queue_depth": self.queue_depth,
+            "send_queue_bytes": self.send_queue_bytes,
+            "dropped": self._period["dropped"],
+            "drops": dict(self._drops),
+            "rtt_ms": self.rtt.summary(),
+            "decode_us": self.decode.summary(),
+            **(extra or {}),
+        }
+        self._period = dict.fromkeys(self.totals, 0)
+        self._drops.clear()
+        self.rtt.reset()
+        self.decode.reset()
+        self._period_start = now
+        self._write(self.last)
+        return self.last
+
+    def _write(self, record):
+        if not self.log_path:
+            return
+        try:
+            if self._log is None:
+                self._log = open(self.log_path, "a", encoding="utf-8")
+            self._log.write(json.dumps(record, separators=(',', ':')) + "\n")
+            self._log.flush()
+        except OSError:
+            self.log_path = None    # disque indisponible : on garde l'overlay seul
+
+    def close(self):
+        if self._log:
+            self._log.close()
+            self._log = None
@@ -1,12 +1,22 @@
 import random
-import pygame
 from Config import MAP_WIDTH, MAP_HEIGHT
+from Game.Core.Geometry import Rect, entity_rect
 from Game.Powerups.PowerUp import PowerUp
+from Game.Remote_Entities import RemoteEntityTable
+from Game.Collisions.Spatial_Grid import nearby
 
 
 class PowerUpManager:
-    def __init__(self):
-        self.rng = random.Random()
+    """Power-ups au sol et effets actifs. Toutes les durées se mesurent sur
+    l'horloge de simulation `now_ms` fournie par l'appelant (pas de pygame).
+
+    Avec une graine, tirages et identifiants ne dépendent que d'elle et des
+    entrées : deux gestionnaires de même graine évoluent à l'identique.
+    """
+
+    def __init__(self, seed=None):
+        self.rng = random.Random(seed)
+        self._next_id = 0           # identifiants des power-ups créés ici
         self.powerups = []
         self.last_spawn_ms = 0
         self.spawn_interval_ms = 5000
@@ -17,7 +27,9 @@ class PowerUpManager:
         self._active_effects = {}
         self._base_speeds = {}
         self._picked_powerup_ids = set()  # IDs des powerups pickupés (pour sync réseau)
-        self._received_powerups = {}  # Cache des powerups reçus du host {id: powerup}
+        # Powerups reçus du host, persistants par ID (immobiles : pas de mise à jour)
+        self._received_powerups = RemoteEntityTable(
+            lambda pd: PowerUp(pd["type"], pd["x"], pd["y"], powerup_id=pd["id"]))
 
     def _register_tank(self, tank):
         tank_id = id(tank)
@@ -32,12 +44,13 @@ class PowerUpManager:
         for _ in range(40):
             x = self.rng.randint(40, MAP_WIDTH - 40)
             y = self.rng.randint(40, MAP_HEIGHT - 40)
-            candidate = PowerUp(power_type, x, y)
+            candidate = PowerUp(power_type, x, y, powerup_id=self._next_id)
 
-            blocked = any(candidate.rect.colliderect(obs) for obs in solid_obstacles)
+            blocked = any(candidate.rect.colliderect(obs) for obs in nearby(solid_obstacles, candidate.rect))
             occupied = any(candidate.rect.colliderect(existing.rect.inflate(14, 14)) for existing in self.powerups)
 
             if not blocked and not occupied:
+                self._next_id += 1
                 return candidate
 
         return None
@@ -69,17 +82,16 @@ class PowerUpManager:
                 del effects["speed"]
             tank.speed = base_speed
 
-    def _check_pickup(self, tank):
+    def _check_pickup(self, tank, now_ms):
         """Vérifie les pickups de powerups (utilisé côté client en multi)."""
-        now_ms = pygame.time.get_ticks()
         self._register_tank(tank)
 
         # Pickup - mettre à jour le rect pour éviter les bugs de collision
-        tank_rect = pygame.Rect(tank.x, tank.y, tank.width, tank.height)
+        tank_rect = entity_rect(tank)
         remaining = []
         for powerup in self.powerups:
             # Recalculer le rect au cas où
-            powerup.rect = pygame.Rect(powerup.x - powerup.size // 2, powerup.y - powerup.size // 2, powerup.size, powerup.size)
+            powerup.rect = Rect(powerup.x - powerup.size // 2, powerup.y - powerup.size // 2, powerup.size, powerup.size)
             
             if tank_rect.colliderect(powerup.rect):
                 self._apply_pickup(tank, powerup, now_ms)
@@ -97,19 +109,11 @@ class PowerUpManager:
 
     def sync_received_powerups(self, powerups_data):
         """Synchronise les powerups reçus du host (côté client en multi).
-        Utilise les IDs pour maintenir la cohérence sans écraser le manager."""
-        from Game.Powerups.PowerUp import PowerUp
-        
-        # Créer un dict des powerups reçus
-        received = {}
-        for pd in powerups_data:
-            p = PowerUp(pd["type"], pd["x"], pd["y"], powerup_id=pd.get("id"))
-            received[p.powerup_id] = p
-        
-        self._received_powerups = received
-        
+        Utilise les IDs : seuls les nouveaux powerups sont créés, les disparus retirés."""
+        self._received_powerups.sync(powerups_data)
+
         # Mettre à jour self.powerups avec les données reçues (pour affichage)
-        self.powerups = list(received.values())
+        self.powerups = list(self._received_powerups)
 
     def get_picked_ids(self):
         """Retourne les IDs des powerups pickupés depuis le dernier appel."""
@@ -117,10 +121,11 @@ class PowerUpManager:
         self._picked_powerup_ids.clear()
         return picked
 
-    def update(self, tank, solid_obstacles):
-        now_ms = pygame.time.get_ticks()
-        self._register_tank(tank)
+    def update(self, tank, solid_obstacles, now_ms):
+        self.update_tanks([tank], solid_obstacles, now_ms)
 
+    def update_tanks(self, tanks, solid_obstacles, now_ms):
+        """Spawn / expiration une fois par tick, puis pickups et effets de chaque tank."""
         # Spawn périodique
         if len(self.powerups) < self.max_powerups and now_ms - self.last_spawn_ms >= self.spawn_interval_ms:
             new_powerup = self._spawn_random_powerup(solid_obstacles)
@@ -139,30 +144,40 @@ class PowerUpManager:
                 self._spawned_at.pop(id(powerup), None)
         self.powerups = alive
 
-        # Pickup
-        tank_rect = pygame.Rect(tank.x, tank.y, tank.width, tank.height)
-        remaining = []
-        for powerup in self.powerups:
-            if tank_rect.colliderect(powerup.rect):
-                self._apply_pickup(tank, powerup, now_ms)
-                self._spawned_at.pop(id(powerup), None)
-            else:
-                remaining.append(powerup)
-        self.powerups = remaining
+        for tank in tanks:
+            self._register_tank(tank)
 
-        # Effets actifs
-        self._apply_effects_to_tank(tank, now_ms)
+            # Pickup
+            tank_rect = entity_rect(tank)
+            remaining = []
+            for powerup in self.powerups:
+                if tank_rect.colliderect(powerup.rect):
+                    self._apply_pickup(tank, powerup, now_ms)
+                    self._spawned_at.pop(id(powerup), None)
+                else:
+                    remaining.append(powerup)
+            self.powerups = remaining
+
+            # Effets actifs
+            self._apply_effects_to_tank(tank, now_ms)
+
+    def forget_tank(self, tank):
+        """Oublie les effets d'un tank retiré de la partie (serveur dédié)."""
+        self._active_effects.pop(id(tank), None)
+        self._base_speeds.pop(id(tank), None)
 
     def draw(self, screen, camera_x, camera_y):
-        for powerup in self.powerups:
-            powerup.draw(screen, camera_x, camera_y)
+        """Dessine les power-ups au sol, retourne les zones d'écran touchées."""
+        return [powerup.draw(screen, camera_x, camera_y) for powerup in self.powerups]
 
-    def draw_hud(self, screen, font_small, tank, x=10, y=120):
-        now_ms = pygame.time.get_ticks()
+    def draw_hud(self, screen, font_small, tank, now_ms, x=10, y=120, hud=None):
         effects = self._active_effects.get(id(tank), {})
 
         speed_end = effects.get("speed")
         if speed_end and speed_end > now_ms:
             sec_left = max(0.0, (speed_end - now_ms) / 1000.0)
-            txt = font_small.render(f"Boost vitesse: {sec_left:.1f}s", True, (120, 210, 255))
-            screen.blit(txt, (x, y))
+            text = f"Boost vitesse: {sec_left:.1f}s"
+            if hud is not None:     # HudRenderer : rendu seulement au changement de dixième
+                return hud.text("powerup", font_small, text, (120, 210, 255), topleft=(x, y))
+            return screen.blit(font_small.render(text, True, (120, 210, 255)), (x, y))
+        return None
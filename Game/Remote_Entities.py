@@ -0,0 +1,53 @@
+"""Entités distantes persistantes, réconciliées par ID réseau.
+
+Chaque snapshot reçu liste les entités du pair (shells, power-ups) avec leur
+identifiant. Plutôt que de tout reconstruire à chaque frame, la table met à
+jour en place les entités déjà connues, ne crée que les nouveaux IDs et
+retire ceux qui ont disparu du snapshot.
+"""
+
+
+class RemoteEntityTable:
+    """Entités indexées par ID ; `create(record)` et `update(entity, record)` fournis par l'appelant."""
+
+    def __init__(self, create, update=None, key="id"):
+        self._create = create
+        self._update = update
+        self._key = key
+        self.entities = {}          # id → entité, ordre d'apparition
+        self.created = 0            # compteurs cumulés (coût d'allocation évité)
+        self.retired = 0
+
+    def __iter__(self):
+        return iter(self.entities.values())
+
+    def __len__(self):
+        return len(self.entities)
+
+    def __contains__(self, entity_id):
+        return entity_id in self.entities
+
+    def get(self, entity_id):
+        return self.entities.get(entity_id)
+
+    def clear(self):
+        self.retired += len(self.entities)
+        self.entities.clear()
+
+    def sync(self, records):
+        """Réconcilie la table avec la liste complète `records` du dernier snapshot."""
+        entities, key = self.entities, self._key
+        seen = set()
+        for record in records:
+            entity_id = record[key]
+            seen.add(entity_id)
+            entity = entities.get(entity_id)
+            if entity is None:
+                entities[entity_id] = self._create(record)
+                self.created += 1
+            elif self._update is not None:
+                self._update(entity, record)
+        if len(seen) != len(entities):
+            for entity_id in [i for i in entities if i not in seen]:
+                del entities[entity_id]
+                self.retired += 1
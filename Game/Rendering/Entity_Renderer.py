@@ -0,0 +1,72 @@
+import pygame
+from Game.Rendering.Sprite_Cache import SpriteCache
+
+
+class EntityRenderer:
+    """Dessin des entités de la simulation (tanks, shells, power-ups) à l'écran.
+
+    Chaque draw_* retourne la zone d'écran touchée (rects à restaurer au
+    frame suivant, voir MapRenderer.mark_dirty).
+    """
+
+    sprites = SpriteCache()     # rotations pré-rendues, partagées par tous les tanks
+
+    @staticmethod
+    def draw_tank(screen, tank, camera_x, camera_y, alpha=1.0):
+        x, y, hull_angle, turret_angle = tank.render_pose(alpha)
+        sx = x - camera_x
+        sy = y - camera_y
+        cx = int(sx + tank.width // 2)
+        cy = int(sy + tank.height // 2)
+        sprites = EntityRenderer.sprites
+
+        # Châssis puis tourelle, centrés sur le tank
+        hull, (ox, oy) = sprites.hull(tank.color, tank.width, tank.height, hull_angle)
+        area = screen.blit(hull, (cx - ox, cy - oy))
+        turret, (ox, oy) = sprites.turret(tank.color, turret_angle)
+        area.union_ip(screen.blit(turret, (cx - ox, cy - oy)))
+
+        # Barre de santé (non tournée)
+        area.union_ip(screen.blit(sprites.health_bar(tank.width, tank.health), (sx, sy - 8)))
+        return area
+
+    @staticmethod
+    def draw_shell(screen, shell, camera_x, camera_y, alpha=1.0):
+        if not shell.active:
+            return None
+        sx = int(shell.prev_x + (shell.x - shell.prev_x) * alpha - camera_x)
+        sy = int(shell.prev_y + (shell.y - shell.prev_y) * alpha - camera_y)
+        area = pygame.draw.circle(screen, shell.color, (sx, sy), shell.radius)
+        pygame.draw.circle(screen, (255, 255, 255), (sx, sy), max(1, shell.radius // 2))
+        return area
+
+    @staticmethod
+    def draw_shell_pool(screen, pool, camera_x, camera_y):
+        """Retourne la liste des zones touchées (une par shell)."""
+        from Game.Assets.Shell_Pool import BOUNCE_COLORS
+        r = pool.radius
+        areas = []
+        for _, x, y, _, _, b in pool.rows():
+            sx, sy = int(x - camera_x), int(y - camera_y)
+            areas.append(pygame.draw.circle(screen, BOUNCE_COLORS[min(b, 3)], (sx, sy), r))
+            pygame.draw.circle(screen, (255, 255, 255), (sx, sy), max(1, r // 2))
+        return areas
+
+    @staticmethod
+    def draw_powerup(screen, powerup, camera_x, camera_y):
+        rect = powerup.rect
+        draw_rect = pygame.Rect(rect.x - camera_x, rect.y - camera_y, rect.width, rect.height)
+
+        if powerup.power_type == "heal":
+            area = pygame.draw.rect(screen, (60, 200, 80), draw_rect, border_radius=4)
+            pygame.draw.rect(screen, (255, 255, 255), draw_rect, 2, border_radius=4)
+            cx, cy = draw_rect.center
+            pygame.draw.line(screen, (255, 255, 255), (cx - 4, cy), (cx + 4, cy), 2)
+            pygame.draw.line(screen, (255, 255, 255), (cx, cy - 4), (cx, cy + 4), 2)
+        else:  # speed
+            area = pygame.draw.rect(screen, (70, 170, 255), draw_rect, border_radius=4)
+            pygame.draw.rect(screen, (255, 255, 255), draw_rect, 2, border_radius=4)
+            cx, cy = draw_rect.center
+            points = [(cx - 3, cy - 5), (cx + 1, cy - 1), (cx - 1, cy - 1), (cx + 3, cy + 5), (cx - 1, cy + 1), (cx + 1, cy + 1)]
+            pygame.draw.polygon(screen, (255, 255, 255), points)
+        return area
@@ -0,0 +1,69 @@
+"""HUD en jeu : textes et barres rendus une fois, reblittés tant que leur valeur ne change pas.
+
+Chaque élément a une clé (« hp », « ammo »...) et la dernière valeur affichée :
+la surface n'est recalculée que lorsque cette valeur change. Les éléments
+fixes (aides, « ESC pour quitter ») ne sont donc rendus qu'une fois.
+renders / reused comptent, pour le frame courant, les surfaces recalculées
+et celles réutilisées (rendus évités) ; last_* gardent ceux du frame précédent.
+"""
+
+import pygame
+
+
+class HudRenderer:
+    """Surfaces de HUD gardées par clé, avec la valeur qui les a produites."""
+
+    def __init__(self, screen):
+        self.screen = screen
+        self._slots = {}            # clé → (valeur, surface)
+        self.renders = self.reused = 0
+        self.last_renders = self.last_reused = 0
+        self.total_renders = self.total_reused = 0
+
+    def begin_frame(self):
+        """Remet à zéro les compteurs du frame (ceux du précédent restent dans last_*)."""
+        self.last_renders, self.last_reused = self.renders, self.reused
+        self.renders = self.reused = 0
+
+    def surface(self, key, value, build):
+        """Surface de `key`, reconstruite par build() seulement si `value` a changé."""
+        slot = self._slots.get(key)
+        if slot is not None and slot[0] == value:
+            self.reused += 1
+            self.total_reused += 1
+            return slot[1]
+        surface = build()
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha() if surface.get_flags() & pygame.SRCALPHA else surface.convert()
+        self._slots[key] = (value, surface)
+        self.renders += 1
+        self.total_renders += 1
+        return surface
+
+    def text(self, key, font, text, color, **anchor):
+        """Blitte un texte ancré comme un Rect (topleft=(10, 35), center=...). Retourne la zone."""
+        surface = self.surface(key, (text, color), lambda: font.render(text, True, color))
+        return self.screen.blit(surface, surface.get_rect(**anchor))
+
+    def bar(self, key, rect, ratio, color, back, border=(255, 255, 255), border_width=2):
+        """Jauge fond + remplissage + contour. Retourne la zone."""
+        rect = pygame.Rect(rect)
+        fill = int(rect.w * max(0.0, min(1.0, ratio)))
+
+        def build():
+            surface = pygame.Surface(rect.size)
+            surface.fill(back)
+            pygame.draw.rect(surface, color, (0, 0, fill, rect.h))
+            pygame.draw.rect(surface, border, (0, 0, rect.w, rect.h), border_width)
+            return surface
+
+        return self.screen.blit(self.surface(key, (rect.size, fill, color, back), build), rect)
+
+    def health_bar(self, key, rect, health, max_hp=100):
+        """Barre de vie : verte, orange sous 50 %, rouge sous 25 %."""
+        ratio = max(0.0, health / max_hp)
+        color = (0, 255, 0) if ratio > 0.5 else (255, 200, 0) if ratio > 0.25 else (255, 0, 0)
+        return self.bar(key, rect, ratio, color, (100, 0, 0))
+
+    def clear(self):
+        self._slots.clear()
@@ -0,0 +1,243 @@
+import hashlib
+import math
+import os
+import random
+import pygame
+
+TERRAIN_SEED = 42
+TERRAIN_VERSION = 1     # à incrémenter quand le dessin du terrain change
+TILE_SIZE = 256         # px, tuiles d'affichage
+TERRAIN_CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "cache")
+
+
+class MapRenderer:
+    """Texture du terrain générée depuis un MapLayout, puis blit de la portion visible.
+
+    La texture ne dépend que de la graine et du layout : elle est gardée en
+    mémoire (partagée entre les instances, donc entre les parties) et sur
+    disque dans TERRAIN_CACHE_DIR, sous une clé hachée de la graine, du layout
+    et de la palette. Un layout modifié donne une autre clé, donc une
+    nouvelle génération. La surface partagée ne doit pas être modifiée.
+    """
+
+    _textures = {}      # clé → surface, pour tout le processus
+
+    # Palette
+    COLOR_GRASS = (34, 139, 34)
+    COLOR_DIRT  = (139, 90, 43)
+    COLOR_SAND  = (194, 178, 128)
+    COLOR_WATER = (30, 144, 255)
+    COLOR_ROCK  = (105, 105, 105)
+
+    def __init__(self, layout, cache_dir=TERRAIN_CACHE_DIR):
+        self.layout = layout
+        self.width = layout.width
+        self.height = layout.height
+        self.rng = random.Random(TERRAIN_SEED)
+        self.key = self._cache_key()
+        self.surface = self._textures.get(self.key)
+        if self.surface is None:
+            path = os.path.join(cache_dir, f"terrain_{self.key}.bmp") if cache_dir else None
+            self.surface = self._load(path)
+            if self.surface is None:
+                self.surface = pygame.Surface((self.width, self.height))
+                self._generate_terrain()
+                self._save(path)
+            MapRenderer._textures[self.key] = self.surface
+        # Affichage par tuiles, construites au premier draw (l'écran fixe le format)
+        self.tiles = None
+        self._view = None       # (origine, taille, écran) du dernier frame complet
+        self._dirty = []
+
+    # ── Cache ───────────────────────────────────────────────────
+
+    def _cache_key(self):
+        layout = self.layout
+        zones = [[(r.x, r.y, r.width, r.height) for r in rects]
+                 for rects in (layout.obstacles, layout.sand_zones, layout.water_zones, layout.dirt_zones)]
+        palette = (self.COLOR_GRASS, self.COLOR_DIRT, self.COLOR_SAND, self.COLOR_WATER, self.COLOR_ROCK)
+        source = repr((TERRAIN_VERSION, TERRAIN_SEED, self.width, self.height, zones, palette,
+                       pygame.version.ver))
+        return hashlib.sha1(source.encode()).hexdigest()[:16]
+
+    def _load(self, path):
+        """Texture lue sur disque (BMP non compressé : lecture quasi immédiate), ou None."""
+        if not path or not os.path.exists(path):
+            return None
+        try:
+            surface = pygame.image.load(path)
+        except (pygame.error, OSError):
+            return None
+        if surface.get_size() != (self.width, self.height):
+            return None
+        return surface.convert() if pygame.display.get_surface() is not None else surface
+
+    def _save(self, path):
+        """Écrit la texture (fichier temporaire puis renommage) et retire les textures périmées.
+
+        Un échec (dossier en lecture seule...) n'est pas bloquant.
+        """
+        if not path:
+            return
+        folder, name = os.path.split(path)
+        tmp = f"{path}.{os.getpid()}.tmp.bmp"
+        try:
+            os.makedirs(folder, exist_ok=True)
+            pygame.image.save(self.surface, tmp)
+            os.replace(tmp, path)
+            for old in os.listdir(folder):
+                if old.startswith("terrain_") and old.endswith(".bmp") and old != name:
+                    os.remove(os.path.join(folder, old))
+        except (pygame.error, OSError):
+            if os.path.exists(tmp):
+                os.remove(tmp)
+
+    # ── Génération ──────────────────────────────────────────────
+
+    def _generate_terrain(self):
+        layout = self.layout
+        self._draw_grass_texture()
+
+        for zone in layout.sand_zones:
+            self._draw_sand_texture(zone)
+        for zone in layout.water_zones:
+            self._draw_water_texture(zone)
+        for zone in layout.dirt_zones:
+            self._draw_dirt_texture(zone)
+
+        for obs in layout.obstacles:
+            pygame.draw.rect(self.surface, self.COLOR_ROCK, obs)
+            pygame.draw.rect(self.surface, (70, 70, 70), obs, 3)  # bordure
+
+    def _draw_grass_texture(self):
+        self.surface.fill(self.COLOR_GRASS)
+
+        # Brins d'herbe en V
+        blade_dark = (24, 118, 24)
+        blade_light = (56, 170, 56)
+        for _ in range(4200):
+            x = self.rng.randint(3, self.width - 4)
+            y = self.rng.randint(3, self.height - 4)
+            blade_color = blade_light if self.rng.random() < 0.35 else blade_dark
+            height = self.rng.randint(2, 4)
+            pygame.draw.line(self.surface, blade_color, (x, y + height), (x, y - height), 1)
+            if self.rng.random() < 0.62:
+                pygame.draw.line(self.surface, blade_color, (x, y), (x - 2, y + height - 1), 1)
+            if self.rng.random() < 0.62:
+                pygame.draw.line(self.surface, blade_color, (x, y), (x + 2, y + height - 1), 1)
+
+    def _draw_water_texture(self, zone):
+        pygame.draw.rect(self.surface, self.COLOR_WATER, zone)
+
+        wave_light = (95, 185, 255)
+        wave_shadow = (20, 120, 220)
+
+        for y in range(zone.top + 6, zone.bottom, 12):
+            x = zone.left + self.rng.randint(0, 8)
+            while x < zone.right - 8:
+                seg = self.rng.randint(14, 34)
+                end_x = min(x + seg, zone.right - 2)
+
+                pygame.draw.line(self.surface, wave_light, (x, y), (end_x, y), 1)
+                if y + 1 < zone.bottom - 1:
+                    pygame.draw.line(self.surface, wave_shadow, (x, y + 1), (end_x, y + 1), 1)
+
+                x += seg + self.rng.randint(10, 24)
+
+    def _draw_sand_texture(self, zone):
+        pygame.draw.rect(self.surface, self.COLOR_SAND, zone)
+
+        wave_light = (224, 208, 158)
+        wave_shadow = (170, 154, 112)
+
+        for y in range(zone.top + 6, zone.bottom, 12):
+            x = zone.left + self.rng.randint(0, 8)
+            while x < zone.right - 8:
+                seg = self.rng.randint(14, 34)
+                end_x = min(x + seg, zone.right - 2)
+
+                amplitude = self.rng.randint(1, 2)
+                phase = self.rng.uniform(0.0, math.pi * 2)
+                frequency = self.rng.uniform(0.18, 0.32)
+
+                points = []
+                shadow_points = []
+                for px in range(x, end_x + 1, 2):
+                    offset = int(round(amplitude * math.sin((px - x) * frequency + phase)))
+                    py = y + offset
+                    points.append((px, py))
+                    shadow_points.append((px, py + 1))
+
+                if len(points) >= 2:
+                    pygame.draw.lines(self.surface, wave_light, False, points, 1)
+                if len(shadow_points) >= 2 and y + 1 < zone.bottom - 1:
+                    pygame.draw.lines(self.surface, wave_shadow, False, shadow_points, 1)
+
+                x += seg + self.rng.randint(10, 24)
+
+    def _draw_dirt_texture(self, zone):
+        pygame.draw.rect(self.surface, self.COLOR_DIRT, zone)
+
+        # Taches de terre (plus sombres)
+        for _ in range(max(70, (zone.width * zone.height) // 3500)):
+            x = self.rng.randint(zone.left, zone.right - 1)
+            y = self.rng.randint(zone.top, zone.bottom - 1)
+            tone = self.rng.randint(-30, -8)
+            color = (
+                max(0, min(255, self.COLOR_DIRT[0] + tone)),
+                max(0, min(255, self.COLOR_DIRT[1] + tone)),
+                max(0, min(255, self.COLOR_DIRT[2] + tone)),
+            )
+            pygame.draw.circle(self.surface, color, (x, y), self.rng.randint(2, 5))
+
+    # ── Affichage ───────────────────────────────────────────────
+
+    def _build_tiles(self, screen):
+        """Tuiles TILE_SIZE x TILE_SIZE au format de l'écran (sous-surfaces de la texture)."""
+        if (self.surface.get_bitsize(), self.surface.get_masks()) != (screen.get_bitsize(), screen.get_masks()):
+            self.surface = self.surface.convert(screen)
+            MapRenderer._textures[self.key] = self.surface
+        bounds = pygame.Rect(0, 0, self.width, self.height)
+        self.tiles = [[self.surface.subsurface(pygame.Rect(x, y, TILE_SIZE, TILE_SIZE).clip(bounds))
+                       for x in range(0, self.width, TILE_SIZE)]
+                      for y in range(0, self.height, TILE_SIZE)]
+
+    def invalidate(self):
+        """Force un redessin complet au prochain draw (écran effacé, overlay...)."""
+        self._view = None
+
+    def mark_dirty(self, rects):
+        """Zones d'écran recouvertes par des sprites ce frame, à restaurer au suivant."""
+        self._dirty.extend(r for r in rects if r)
+
+    def draw(self, screen, camera_x, camera_y):
+        """Blit le terrain visible.
+
+        Caméra déplacée : seules les tuiles qui coupent la vue sont blittées.
+        Caméra immobile : le fond déjà à l'écran est gardé, seules les zones
+        signalées par mark_dirty au frame précédent sont restaurées.
+        """
+        if self.tiles is None:
+            self._build_tiles(screen)
+        view = pygame.Rect(int(camera_x), int(camera_y), *screen.get_size())
+        view.clamp_ip(pygame.Rect(0, 0, self.width, self.height))
+        key = (view.topleft, view.size, id(screen))
+        dirty, self._dirty = self._dirty, []
+        if key != self._view:
+            self._view = key
+            self._blit_region(screen, view, view)
+            return
+        for rect in dirty:
+            self._blit_region(screen, rect.move(view.topleft).clip(view), view)
+
+    def _blit_region(self, screen, area, view):
+        """Blit la zone `area` (coordonnées map) depuis les tuiles qui la coupent."""
+        if not area:
+            return
+        ox, oy = view.topleft
+        for ty in range(area.top // TILE_SIZE, (area.bottom - 1) // TILE_SIZE + 1):
+            row = self.tiles[ty]
+            for tx in range(area.left // TILE_SIZE, (area.right - 1) // TILE_SIZE + 1):
+                x, y = tx * TILE_SIZE, ty * TILE_SIZE
+                part = area.clip((x, y, TILE_SIZE, TILE_SIZE))
+                screen.blit(row[tx], (part.x - ox, part.y - oy), part.move(-x, -y))
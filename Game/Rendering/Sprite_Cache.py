@@ -0,0 +1,146 @@
+"""Sprites de tanks pré-rendus, tournés par pas d'angle et gardés en cache.
+
+Châssis et tourelle sont dessinés une fois par couleur, puis chaque rotation
+demandée (angle arrondi à ANGLE_STEP degrés) est calculée à la première
+utilisation, recadrée sur ses pixels visibles puis réutilisée. Le cache est
+borné (LRU) : au-delà de `max_sprites` rotations, les moins récemment
+affichées sont oubliées.
+Les barres de santé sont gardées par (largeur, points de vie).
+"""
+
+from collections import OrderedDict
+import pygame
+
+ANGLE_STEP = 2          # degrés entre deux rotations pré-rendues
+MAX_SPRITES = 2304      # rotations gardées : 8 couleurs complètes, ≈ 20 Mo
+TREAD_COLOR = (40, 40, 40)
+
+
+class SpriteCache:
+    """Rotations de châssis / tourelle par (couleur, angle quantifié) et barres de santé.
+
+    hull() et turret() rendent (surface, décalage) : blitter en centre - décalage.
+    """
+
+    def __init__(self, max_sprites=MAX_SPRITES, angle_step=ANGLE_STEP):
+        self.max_sprites = max_sprites
+        self.angle_step = angle_step
+        self._bases = {}                # (pièce, couleur, taille) → surface non tournée
+        self._rotated = OrderedDict()   # (pièce, couleur, taille, angle) → surface tournée
+        self._health_bars = {}          # (largeur, santé) → surface
+        self.hits = self.misses = 0
+
+    def _quantize(self, angle, period=360):
+        step = self.angle_step
+        return round(angle / step) * step % period
+
+    def hull(self, color, width, height, angle):
+        # Châssis symétrique par demi-tour : 180° suffisent
+        return self._get("hull", color, (width, height), self._quantize(angle, 180))
+
+    def turret(self, color, angle):
+        return self._get("turret", color, None, self._quantize(angle))
+
+    def _get(self, part, color, size, angle):
+        key = (part, color, size, angle)
+        sprite = self._rotated.get(key)
+        if sprite is not None:
+            self._rotated.move_to_end(key)
+            self.hits += 1
+            return sprite
+        self.misses += 1
+        base = self._bases.get(key[:3])
+        if base is None:
+            base = _draw_hull(color, *size) if part == "hull" else _draw_turret(color)
+            self._bases[key[:3]] = base
+        sprite = _trimmed(pygame.transform.rotate(base, -angle))
+        if self.max_sprites:
+            self._rotated[key] = sprite
+            if len(self._rotated) > self.max_sprites:
+                self._rotated.popitem(last=False)
+        return sprite
+
+    def health_bar(self, width, health):
+        key = (width, health)
+        surface = self._health_bars.get(key)
+        if surface is None:
+            surface = _draw_health_bar(width, health)
+            if self.max_sprites:
+                self._health_bars[key] = surface
+        return surface
+
+    def clear(self):
+        self._bases.clear()
+        self._rotated.clear()
+        self._health_bars.clear()
+
+
+def _trimmed(surface):
+    """Recadre une rotation sur ses pixels visibles (moins de pixels à mélanger au blit).
+
+    Retourne (surface, décalage) où décalage est la position du centre de la
+    rotation d'origine dans la surface recadrée.
+    """
+    bounds = surface.get_bounding_rect()
+    offset = (surface.get_width() // 2 - bounds.x, surface.get_height() // 2 - bounds.y)
+    surface = surface.subsurface(bounds).copy()
+    if pygame.display.get_surface() is not None:
+        surface = surface.convert_alpha()
+    surface.set_alpha(255, pygame.RLEACCEL)     # blit RLE : saute les pixels transparents
+    return surface, offset
+
+
+def _draw_hull(color, width, height):
+    """Châssis vers le haut, chenilles de part et d'autre."""
+    body_dark = tuple(max(0, c - 40) for c in color)
+    surface = pygame.Surface((width + 10, height + 10), pygame.SRCALPHA)
+    offset = 5
+
+    # Corps principal
+    pygame.draw.rect(surface, color, (offset, offset, width, height))
+    pygame.draw.rect(surface, body_dark, (offset, offset, width, height), 2)
+
+    # Chenilles gauche/droite
+    pygame.draw.rect(surface, TREAD_COLOR, (offset - 4, offset, 4, height))
+    pygame.draw.rect(surface, (20, 20, 20), (offset - 4, offset, 4, height), 1)
+    pygame.draw.rect(surface, TREAD_COLOR, (offset + width, offset, 4, height))
+    pygame.draw.rect(surface, (20, 20, 20), (offset + width, offset, 4, height), 1)
+    return surface
+
+
+def _draw_turret(color):
+    """Tourelle circulaire, canon vers le haut de la surface."""
+    body_dark = tuple(max(0, c - 40) for c in color)
+    surface = pygame.Surface((60, 60), pygame.SRCALPHA)
+    t_center = 30
+
+    # Tourelle circulaire
+    pygame.draw.circle(surface, color, (t_center, t_center), 12)
+    pygame.draw.circle(surface, body_dark, (t_center, t_center), 12, 2)
+    # Écoutille
+    pygame.draw.circle(surface, tuple(min(255, c + 60) for c in color), (t_center, t_center), 4)
+
+    # Canon
+    barrel_length = 28
+    barrel_end_y = t_center - barrel_length
+    pygame.draw.line(surface, (200, 200, 200), (t_center, t_center), (t_center, barrel_end_y), 5)
+    pygame.draw.line(surface, (100, 100, 100), (t_center, t_center), (t_center, barrel_end_y), 2)
+    pygame.draw.circle(surface, (150, 150, 150), (t_center, int(barrel_end_y)), 4)
+    pygame.draw.circle(surface, (80, 80, 80), (t_center, int(barrel_end_y)), 4, 1)
+    return surface
+
+
+def _draw_health_bar(width, health, height=5):
+    """Fond gris, remplissage vert / orange / rouge selon la santé, contour blanc."""
+    health_ratio = max(0, health / 100.0)
+    surface = pygame.Surface((width, height))
+    surface.fill((50, 50, 50))
+    if health_ratio > 0.5:
+        hc = (0, 255, 0)
+    elif health_ratio > 0.25:
+        hc = (255, 200, 0)
+    else:
+        hc = (255, 0, 0)
+    pygame.draw.rect(surface, hc, (0, 0, width * health_ratio, height))
+    pygame.draw.rect(surface, (255, 255, 255), (0, 0, width, height), 1)
+    return surface
@@ -0,0 +1,2 @@
+# Package Rendering
+# Couche de rendu pygame : lit l'état de la simulation, ne le modifie pas
@@ -0,0 +1,152 @@
+"""Serveur dédié : relie la simulation GameState au réseau.
+
+Les clients n'envoient que leurs entrées, sur le canal d'état (latest-wins) :
+    {"input": {"move": [dx, dy], "aim": angle, "fire": bool, "reload": bool}}
+Le serveur avance la simulation (Game.Core.Game_State) à tick fixe,
+puis envoie à chaque client un snapshot limité à ce qui entoure son tank :
+    {"tick", "you", "tanks": [...], "shells": [...], "powerups": [...]}
+Un client qui quitte la partie libère son tank ; un tank détruit réapparaît.
+"""
+
+import time
+from Game.Core.Game_State import GameState
+from Game.Network_Config import SERVER_TICK_RATE, SNAPSHOT_INTERVAL, VIEW_RADIUS
+
+
+class ServerGame:
+    """Partie à N joueurs simulée par le serveur, diffusée par `network` (NetworkServer)."""
+
+    def __init__(self, network, seed=None):
+        self.network = network
+        self.state = GameState(seed)
+        self.players = self.state.players       # id client → PlayerState
+
+        # Statistiques de la boucle (voir run)
+        self.tick_time = 0.0
+        self.max_tick_time = 0.0
+        self.late_ticks = 0
+
+    @property
+    def tick_count(self):
+        return self.state.tick_count
+
+    # ── Simulation ──────────────────────────────────────────────
+
+    def process_messages(self):
+        """Départs et arrivées de joueurs, puis dernière entrée de chaque joueur."""
+        while True:
+            left = self.network.receive_from("client_left")
+            if left is None:
+                break
+            self.state.remove_player(left[0])
+
+        for client_id, client in self.network.clients.items():
+            if client.negotiated and client_id not in self.players:
+                self.state.add_player(client_id)
+
+        for client_id, player in self.players.items():
+            message = self.network.receive_state(client_id)
+            if message and isinstance(message.get("input"), dict):
+                try:
+                    player.apply_input(message["input"])
+                except (TypeError, ValueError, IndexError, KeyError, OverflowError):
+                    continue
+
+    def tick(self):
+        self.process_messages()
+        self.state.step()
+
+        if self.tick_count % SNAPSHOT_INTERVAL == 0:
+            self.send_snapshots()
+        self.network.tick_telemetry(lambda: {"players": len(self.players), "tick": self.tick_count})
+
+    # ── Réseau ──────────────────────────────────────────────────
+
+    def send_snapshots(self):
+        """Un snapshot par client, limité aux entités dans son rayon d'intérêt."""
+        tanks = [
+            (p.tank.x + p.tank.width / 2, p.tank.y + p.tank.height / 2,
+             {"id": p.client_id, "x": round(p.tank.x, 1), "y": round(p.tank.y, 1),
+              "hull_angle": round(p.tank.hull_angle, 1),
+              "turret_angle": round(p.tank.turret_angle, 1),
+              "health": p.tank.health, "kills": p.kills, "alive": p.alive})
+            for p in self.players.values()
+        ]
+        shells = [
+            (x, y, {"id": sid, "x": round(x, 1), "y": round(y, 1),
+                    "vx": round(vx, 2), "vy": round(vy, 2), "bounces": b})
+            for sid, x, y, vx, vy, b in self.state.shell_rows()
+        ]
+        powerups = [
+            {"id": p.powerup_id, "x": round(p.x, 1), "y": round(p.y, 1), "type": p.power_type}
+            for p in self.state.powerup_manager.powerups
+        ]
+
+        r2 = VIEW_RADIUS * VIEW_RADIUS
+        for client_id, player in self.players.items():
+            cx = player.tank.x + player.tank.width / 2
+            cy = player.tank.y + player.tank.height / 2
+            self.network.send_state_to(client_id, {
+                "tick": self.tick_count,
+                "you": client_id,
+                "tanks": [d for x, y, d in tanks
+                          if d["id"] == client_id or (x - cx) ** 2 + (y - cy) ** 2 <= r2],
+                "shells": [d for x, y, d in shells if (x - cx) ** 2 + (y - cy) ** 2 <= r2],
+                "powerups": powerups,
+            })
+
+    # ── Boucle ──────────────────────────────────────────────────
+
+    def _wait(self, seconds):
+        """Attend jusqu'au prochain tick en traitant les E/S réseau entre-temps."""
+        engine = self.network.engine
+        if engine.threaded:
+            time.sleep(seconds)
+        else:
+            engine.pump(seconds)
+
+    def run(self, duration=0, report_every=5.0, report=print):
+        """Boucle à tick fixe. `duration` en secondes (0 = sans fin).
+
+        Retourne un résumé : ticks/s obtenus, temps de tick moyen et max, retards.
+        """
+        period = 1.0 / SERVER_TICK_RATE
+        start = last_report = time.perf_counter()
+        next_tick = start
+        ticks_at_report = 0
+
+        while self.network.is_running:
+            now = time.perf_counter()
+            if duration and now - start >= duration:
+                break
+            if now < next_tick:
+                self._wait(next_tick - now)
+                continue
+
+            self.tick()
+            elapsed = time.perf_counter() - now
+            self.tick_time += elapsed
+            self.max_tick_time = max(self.max_tick_time, elapsed)
+
+            next_tick += period
+            if time.perf_counter() > next_tick + period:
+                # Plus d'un tick de retard : on ne rattrape pas en rafale
+                self.late_ticks += 1
+                next_tick = time.perf_counter()
+
+            if report and now - last_report >= report_every:
+                rate = (self.tick_count - ticks_at_report) / (now - last_report)
+                report(f"[SERVER] {len(self.players)} joueurs | {rate:.1f} ticks/s | "
+                       f"tick moyen {self.tick_time * 1000 / self.tick_count:.2f} ms | "
+                       f"retards {self.late_ticks}")
+                last_report, ticks_at_report = now, self.tick_count
+
+        total = time.perf_counter() - start
+        return {
+            "players": len(self.players),
+            "ticks": self.tick_count,
+            "tick_rate": self.tick_count / total if total else 0.0,
+            "avg_tick_ms": self.tick_time * 1000 / max(1, self.tick_count),
+            "max_tick_ms": self.max_tick_time * 1000,
+            "late_ticks": self.late_ticks,
+        }
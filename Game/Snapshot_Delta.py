@@ -0,0 +1,167 @@
+"""Compression delta des snapshots d'état contre la dernière base acquittée.
+
+Chaque snapshot porte un numéro `seq` et l'`ack` du dernier snapshot adverse
+reconstruit. L'émetteur encode le suivant contre l'état qu'il avait envoyé
+sous ce numéro (la base) : seuls les champs de tank, shells et power-ups qui
+ont changé sont transmis. Sans base valide, il envoie une keyframe complète.
+
+Format d'un message (les clés absentes = inchangé) :
+    seq, ack                      toujours présents (ack = -1 : keyframe demandée)
+    round                         manche (rematch) : seq repart de 1 à chaque manche
+    t                             horloge de l'émetteur en ms, si l'état en porte une
+    base                          seq de la base, absent pour une keyframe
+    x, y, hull_angle, turret_angle, health
+    shells / shells_gone          shells nouveaux ou modifiés (champs changés + id) / IDs disparus
+    powerups / powerups_gone      power-ups nouveaux ou modifiés (complets) / IDs disparus
+    picked_powerup_ids            événements, envoyés tels quels
+"""
+
+TANK_FIELDS = ("x", "y", "hull_angle", "turret_angle", "health")
+SHELL_FIELDS = ("x", "y", "vx", "vy", "bounces")
+
+NO_ACK = -1
+HISTORY_SIZE = 64   # snapshots conservés de chaque côté (~1 s à 60 Hz)
+
+
+def _index(items):
+    return {item["id"]: item for item in items}
+
+
+class DeltaEncoder:
+    """Côté émission : historique des états envoyés + base acquittée par le pair."""
+
+    def __init__(self, history_size=HISTORY_SIZE, round_no=0):
+        self.history_size = history_size
+        self.round = round_no
+        self.seq = 0
+        self.acked = NO_ACK
+        self._sent = {}
+        self.keyframes_sent = 0
+
+    def on_ack(self, ack, round_no=0):
+        """Enregistre l'ack porté par un message du pair (-1 = keyframe demandée).
+
+        Un ack d'une autre manche, ou au-delà du dernier seq envoyé, est ignoré :
+        accepté, il bloquerait les acks suivants (qui doivent croître).
+        """
+        if round_no != self.round or ack > self.seq:
+            return
+        if ack == NO_ACK or ack > self.acked:
+            self.acked = ack
+
+    def encode(self, state, ack):
+        """Construit le message delta pour `state` (snapshot complet)."""
+        self.seq += 1
+        base = self._sent.get(self.acked)
+        message = {"seq": self.seq, "ack": ack, "round": self.round}
+        if "t" in state:
+            message["t"] = state["t"]
+
+        if base is None:
+            self.keyframes_sent += 1
+            message.update({f: state[f] for f in TANK_FIELDS})
+            if state["shells_data"]:
+                message["shells"] = list(state["shells_data"])
+            if state["powerups_data"]:
+                message["powerups"] = list(state["powerups_data"])
+        else:
+            message["base"] = self.acked
+            for f in TANK_FIELDS:
+                if state[f] != base[f]:
+                    message[f] = state[f]
+            self._diff_shells(message, base["shells_data"], state["shells_data"])
+            self._diff_powerups(message, base["powerups_data"], state["powerups_data"])
+
+        if state["picked_powerup_ids"]:
+            message["picked_powerup_ids"] = state["picked_powerup_ids"]
+
+        self._sent[self.seq] = state
+        if len(self._sent) > self.history_size:
+            del self._sent[next(iter(self._sent))]
+        return message
+
+    @staticmethod
+    def _diff_shells(message, old, new):
+        old_by_id = _index(old)
+        changed = []
+        for shell in new:
+            prev = old_by_id.pop(shell["id"], None)
+            if prev is None:
+                changed.append(shell)
+                continue
+            diff = {f: shell[f] for f in SHELL_FIELDS if shell[f] != prev[f]}
+            if diff:
+                diff["id"] = shell["id"]
+                changed.append(diff)
+        if changed:
+            message["shells"] = changed
+        if old_by_id:
+            message["shells_gone"] = list(old_by_id)
+
+    @staticmethod
+    def _diff_powerups(message, old, new):
+        old_by_id = _index(old)
+        changed = [p for p in new if old_by_id.pop(p["id"], None) != p]
+        if changed:
+            message["powerups"] = changed
+        if old_by_id:
+            message["powerups_gone"] = list(old_by_id)
+
+
+class DeltaDecoder:
+    """Côté réception : reconstruit les snapshots complets depuis les deltas."""
+
+    def __init__(self, history_size=HISTORY_SIZE, round_no=0):
+        self.history_size = history_size
+        self.round = round_no
+        self.last_seq = NO_ACK
+        self._received = {}
+        self.baseline_lost = False
+
+    @property
+    def ack(self):
+        """Valeur d'ack à renvoyer au pair (-1 tant qu'une keyframe est attendue)."""
+        return NO_ACK if self.baseline_lost else self.last_seq
+
+    def decode(self, message):
+        """Retourne le snapshot complet, ou None si périmé / d'une autre manche / base inconnue."""
+        seq = message["seq"]
+        if message.get("round", 0) != self.round or seq <= self.last_seq:
+            return None
+
+        if "base" in message:
+            base = self._received.get(message["base"])
+            if base is None:
+                self.baseline_lost = True
+                return None
+        else:
+            base = {f: 0 for f in TANK_FIELDS}
+            base.update(shells_data=[], powerups_data=[])
+
+        state = {f: message.get(f, base[f]) for f in TANK_FIELDS}
+        if "t" in message:
+            state["t"] = message["t"]
+
+        shells = _index(base["shells_data"])
+        for sid in message.get("shells_gone", ()):
+            shells.pop(sid, None)
+        for diff in message.get("shells", ()):
+            prev = shells.get(diff["id"])
+            shells[diff["id"]] = {**prev, **diff} if prev else diff
+        state["shells_data"] = list(shells.values())
+
+        powerups = _index(base["powerups_data"])
+        for pid in message.get("powerups_gone", ()):
+            powerups.pop(pid, None)
+        for p in message.get("powerups", ()):
+            powerups[p["id"]] = p
+        state["powerups_data"] = list(powerups.values())
+
+        state["picked_powerup_ids"] = message.get("picked_powerup_ids", [])
+
+        self._received[seq] = state
+        if len(self._received) > self.history_size:
+            del self._received[next(iter(self._received))]
+        self.last_seq = seq
+        self.baseline_lost = False
+        return state
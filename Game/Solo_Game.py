@@ -7,6 +7,8 @@ from Game.Movement.Player_Movement import PlayerMovement
 from Game.Movement.Shell_Movement import ShellMovement
 from Game.Collisions.Shell_Collisions import ShellCollisions
 from Game.Powerups.PowerUp_Manager import PowerUpManager
+from Game.Fixed_Timestep import FixedTimestep
+from Game.Rendering.Hud_Renderer import HudRenderer
 from Config import MENU_WIDTH, MENU_HEIGHT, FPS, MAP_WIDTH, MAP_HEIGHT
 
 
@@ -22,6 +24,8 @@ class SoloGame:
         self.powerup_manager = PowerUpManager()
         self.font = pygame.font.Font(None, 36)
         self.font_small = pygame.font.Font(None, 24)
+        self.hud = HudRenderer(screen)     # textes / barres rendus seulement quand ils changent
+        self.timestep = FixedTimestep()
 
     def handle_events(self):
         for event in pygame.event.get():
@@ -39,6 +43,17 @@ class SoloGame:
         return None
 
     def update(self):
+        """Frame : exécute les pas de simulation dus depuis la frame précédente."""
+        for _ in range(self.timestep.advance()):
+            self.step()
+            if self.player.health <= 0:
+                break
+
+    def step(self):
+        """Un pas de simulation (1/SIM_HZ s)."""
+        self.player.save_pose()
+        for shell in self.shells:
+            shell.save_pose()
         keys = pygame.key.get_pressed()
 
         solid_obstacles = self.game_map.get_solid_obstacles()
@@ -48,12 +63,11 @@ class SoloGame:
         mouse_x, mouse_y = pygame.mouse.get_pos()
         self.player.aim_at_mouse(mouse_x, mouse_y, self.camera.x, self.camera.y)
 
-        self.shells = ShellMovement.update_shells(self.shells)
-
         # Seuls les rochers font rebondir ; l'eau est gérée comme solide pour le tank
         bouncing = self.game_map.get_bouncing_obstacles()
-        result = ShellCollisions.check_all_collisions(
-            self.shells, bouncing, [],
+        self.shells = ShellMovement.update_shells(self.shells, bouncing, (), self.game_map)
+        result = ShellCollisions.check_tank_hits(
+            self.shells,
             [self.player]  # friendly fire après rebond
         )
         for tank, _shell in result['tanks_hit']:
@@ -62,58 +76,58 @@ class SoloGame:
             self.shells = [s for s in self.shells if s.active]
 
         # Spawn + pickup + effets actifs des power-ups
-        self.powerup_manager.update(self.player, solid_obstacles)
+        self.powerup_manager.update(self.player, solid_obstacles, self.timestep.time_ms)
 
         self.camera.follow(self.player)
 
     def draw(self):
+        # Rendu interpolé entre les deux derniers pas de simulation
+        alpha = self.timestep.alpha
+        self.camera.follow(self.player, alpha)
+        # Terrain : complet si la caméra a bougé, sinon seulement sous les sprites du frame précédent
         self.game_map.draw(self.screen, self.camera.x, self.camera.y)
+        dirty = []      # zones dessinées ce frame, restaurées au suivant
 
         for shell in self.shells:
-            shell.draw(self.screen, self.camera.x, self.camera.y)
-        self.powerup_manager.draw(self.screen, self.camera.x, self.camera.y)
-        self.player.draw(self.screen, self.camera.x, self.camera.y)
-
-        # HUD — debug
-        self.screen.blit(self.font_small.render(
+            dirty.append(shell.draw(self.screen, self.camera.x, self.camera.y, alpha))
+        dirty += self.powerup_manager.draw(self.screen, self.camera.x, self.camera.y)
+        dirty.append(self.player.draw(self.screen, self.camera.x, self.camera.y, alpha))
+
+        # HUD — chaque texte / barre n'est re-rendu que si sa valeur change
+        hud = self.hud
+        hud.begin_frame()
+        # Debug
+        dirty.append(hud.text("debug", self.font_small,
             f"Pos: ({int(self.player.x)}, {int(self.player.y)}) | "
             f"Chassic: {int(self.player.hull_angle)}° | Tourelle: {int(self.player.turret_angle)}° | Shells: {len(self.shells)}",
-            True, (255, 255, 255)), (10, 10))
-
-        # HP
-        self.screen.blit(
-            self.font.render(f"HP: {self.player.health}", True, (255, 255, 255)), (10, 35))
+            (255, 255, 255), topleft=(10, 10)))
 
-        # Barre de vie
-        bx, by, bw, bh = 10, 65, 200, 20
-        ratio = max(0.0, self.player.health / 100.0)
-        bar_color = (0, 255, 0) if ratio > 0.5 else (255, 200, 0) if ratio > 0.25 else (255, 0, 0)
-        pygame.draw.rect(self.screen, (100, 0, 0), (bx, by, bw, bh))
-        pygame.draw.rect(self.screen, bar_color, (bx, by, int(bw * ratio), bh))
-        pygame.draw.rect(self.screen, (255, 255, 255), (bx, by, bw, bh), 2)
+        # HP + barre de vie
+        dirty.append(hud.text("hp", self.font, f"HP: {self.player.health}", (255, 255, 255), topleft=(10, 35)))
+        dirty.append(hud.health_bar("hp_bar", (10, 65, 200, 20), self.player.health))
 
         # Munitions / rechargement
         ammo_y = 92
         if self.player.reloading:
-            self.screen.blit(
-                self.font_small.render("Rechargement...", True, (255, 100, 100)), (10, ammo_y))
+            dirty.append(hud.text("ammo", self.font_small, "Rechargement...", (255, 100, 100), topleft=(10, ammo_y)))
             progress = 1.0 - (self.player.reload_cooldown / self.player.reload_time)
-            pygame.draw.rect(self.screen, (60, 60, 60), (10, ammo_y + 20, 150, 10))
-            pygame.draw.rect(self.screen, (255, 165, 0), (10, ammo_y + 20, int(150 * progress), 10))
-            pygame.draw.rect(self.screen, (255, 255, 255), (10, ammo_y + 20, 150, 10), 1)
+            dirty.append(hud.bar("reload", (10, ammo_y + 20, 150, 10), progress, (255, 165, 0), (60, 60, 60),
+                                 border_width=1))
         else:
             p = self.player
             dots = '● ' * p.ammo + '○ ' * (p.mag_size - p.ammo)
             color = (255, 255, 0) if p.ammo > 0 else (255, 100, 100)
-            self.screen.blit(
-                self.font_small.render(f"Munitions: {dots} [R] Recharger", True, color), (10, ammo_y))
+            dirty.append(hud.text("ammo", self.font_small, f"Munitions: {dots} [R] Recharger", color,
+                                  topleft=(10, ammo_y)))
 
-        self.powerup_manager.draw_hud(self.screen, self.font_small, self.player, x=10, y=118)
+        dirty.append(self.powerup_manager.draw_hud(self.screen, self.font_small, self.player,
+                                                   self.timestep.time_ms, x=10, y=118, hud=hud))
 
-        self.screen.blit(self.font_small.render(
+        dirty.append(hud.text("controls", self.font_small,
             "Flèches/ZQSD: Déplacer | Souris: Viser | Clic: Tirer | R: Recharger | ESC: Menu",
-            True, (255, 255, 255)), (10, MENU_HEIGHT - 30))
+            (255, 255, 255), topleft=(10, MENU_HEIGHT - 30)))
 
+        self.game_map.mark_dirty(dirty)
         pygame.display.flip()
 
     def run(self):
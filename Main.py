@@ -68,7 +68,7 @@ def main():
                     if isinstance(result, tuple) and result[0] == "CONNECT":
                         ip = result[1] or "127.0.0.1"
                         port = int(result[2]) if result[2].isdigit() else 5555
-                        client = NetworkClient(ip, port)
+                        client = NetworkClient(ip, port, udp=result[3])
                         if client.connect():
                             game_result = MultiGame(screen, client, is_host=False).run()
                             if game_result in ("WIN", "LOSE"):
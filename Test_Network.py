@@ -2,6 +2,8 @@
 
 import sys
 from Game.Network import NetworkServer, NetworkClient
+from Game.Network_Codec import BinaryCodec, BINARY_MAGIC
+from Game.Snapshot_Delta import DeltaEncoder
 import threading
 import time
 
@@ -12,6 +14,21 @@ def test_network():
     print("TEST DU SYSTÈME RÉSEAU")
     print("=" * 50)
 
+    # Test 0: Les snapshots delta doivent partir en binaire (pas de repli JSON silencieux)
+    print("\n[TEST 0] Encodage binaire des snapshots delta...")
+    codec = BinaryCodec()
+    encoder = DeltaEncoder(round_no=2)
+    state = {"t": 16, "x": 100.0, "y": 200.0, "hull_angle": 90.0, "turret_angle": 45.0, "health": 100,
+             "shells_data": [{"id": 1, "x": 110.0, "y": 190.0, "vx": 2.0, "vy": -1.0, "bounces": 0}],
+             "powerups_data": [], "picked_powerup_ids": []}
+    for ack in (-1, 1):      # keyframe, puis delta contre la base 1
+        encoder.on_ack(ack, 2)
+        raw = codec.encode(encoder.encode(dict(state, x=state["x"] + ack), ack))
+        if raw[0] != BINARY_MAGIC or codec.decode(raw).get("round") != 2:
+            print(f"❌ Erreur: snapshot non encodé en binaire ({bytes(raw[:8])!r})")
+            return False
+    print("✅ Keyframe et delta encodés en binaire")
+
     # Test 1: Créer un serveur
     print("\n[TEST 1] Création du serveur...")
     server = NetworkServer(5555)
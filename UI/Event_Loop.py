@@ -0,0 +1,46 @@
+# UI/Event_Loop.py
+"""Attente d'évènements pour les écrans de UI/ (menus, saisies, attente réseau).
+
+Au lieu de tourner à 60 Hz, un écran bloque dans pygame.event.wait jusqu'au
+prochain évènement ou à sa prochaine échéance (clignotement du curseur,
+délai d'attente) : une fenêtre inactive ne consomme presque plus de CPU.
+Le réseau réveille l'écran en postant un NETWORK_EVENT.
+"""
+
+import pygame
+
+IDLE_TIMEOUT = 1000         # ms : réveil maximal d'un écran inactif
+CURSOR_BLINK = 500          # ms entre deux bascules du curseur
+
+NETWORK_EVENT = pygame.USEREVENT + 1    # attributs : kind, client_id
+
+_EXPOSE_EVENTS = (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED)
+
+
+def wait_events(timeout=IDLE_TIMEOUT, layer=None):
+    """Bloque jusqu'à un évènement ou `timeout` ms, puis vide la file.
+
+    Retourne la liste des évènements (vide au réveil sur délai). Si la
+    fenêtre a été exposée, `layer` (UiLayer) est entièrement repeint.
+    """
+    event = pygame.event.wait(max(1, int(timeout)))
+    events = [] if event.type == pygame.NOEVENT else [event]
+    events += pygame.event.get()
+    if layer is not None and any(e.type in _EXPOSE_EVENTS for e in events):
+        layer.invalidate()
+    return events
+
+
+def post_network_event(kind, client_id=None):
+    """Poste un NETWORK_EVENT (appelable depuis le thread d'E/S)."""
+    pygame.event.post(pygame.event.Event(NETWORK_EVENT, kind=kind, client_id=client_id))
+
+
+def cursor_visible():
+    """Phase du curseur clignotant, calée sur l'horloge."""
+    return pygame.time.get_ticks() // CURSOR_BLINK % 2 == 0
+
+
+def until_cursor_blink():
+    """ms avant la prochaine bascule du curseur."""
+    return CURSOR_BLINK - pygame.time.get_ticks() % CURSOR_BLINK
@@ -4,6 +4,9 @@ import socket
 import sys
 import time
 from Game.Network import NetworkServer
+from Game.Network_Config import UDP_PROBE_TIMEOUT
+from UI.Widgets import UiLayer, Label, Line
+from UI.Event_Loop import wait_events, post_network_event, NETWORK_EVENT
 
 
 class HostScreen:
@@ -18,12 +21,26 @@ class HostScreen:
         self.local_ip = self._get_local_ip()
         self.server = NetworkServer(self.port)
         self.client_connected = False
+        self.timeout = 180      # secondes d'attente d'un joueur
 
         self.COLOR_BG = (20, 20, 30)
         self.COLOR_TITLE = (100, 200, 255)
         self.COLOR_INFO = (0, 255, 100)
         self.COLOR_TEXT = (255, 255, 255)
 
+        # Widgets construits une fois ; draw() ne fait que mettre à jour leur état
+        self.ui = UiLayer(self.COLOR_BG)
+        self.ui.add(Label(self.font_title, "HÉBERGER UNE PARTIE", self.COLOR_TITLE, center=(512, 100)),
+                    Line(self.COLOR_INFO, (300, 150), (724, 150), 2),
+                    Label(self.font_text, "Votre IP locale :", self.COLOR_TEXT, center=(512, 220)),
+                    Label(self.font_text, self.local_ip, self.COLOR_INFO, center=(512, 270)),
+                    Label(self.font_text, "Port :", self.COLOR_TEXT, center=(512, 330)))
+        self.port_label = self.ui.add(Label(self.font_text, "", self.COLOR_INFO, center=(512, 380)))
+        self.ui.add(Label(self.font_text, "Communiquez cette adresse au joueur 2", self.COLOR_TEXT,
+                          center=(512, 480)))
+        self.status_label = self.ui.add(Label(self.font_text, "", (150, 150, 150), center=(512, 560)))
+        self.ui.add(Label(self.font_text, "ESC pour annuler", (100, 100, 100), center=(512, 700)))
+
     @staticmethod
     def _get_local_ip():
         """Récupère l'IP LAN via un socket UDP éphémère."""
@@ -36,65 +53,69 @@ class HostScreen:
         except Exception:
             return "127.0.0.1"
 
-    def handle_events(self):
-        for event in pygame.event.get():
+    def handle_events(self, timeout=1.0):
+        for event in wait_events(timeout * 1000, self.ui):
             if event.type == pygame.QUIT:
                 return "QUIT"
             if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
                 return "CANCEL"
+            if event.type == NETWORK_EVENT and event.kind == "left":
+                self.client_connected = self.server.client_socket is not None
         return None
 
     def draw(self):
-        self.screen.fill(self.COLOR_BG)
-
-        title = self.font_title.render("HÉBERGER UNE PARTIE", True, self.COLOR_TITLE)
-        self.screen.blit(title, title.get_rect(center=(512, 100)))
-        pygame.draw.line(self.screen, self.COLOR_INFO, (300, 150), (724, 150), 2)
-
-        for label, value, y in [
-            ("Votre IP locale :", self.local_ip, 220),
-            ("Port :", str(self.port), 330),
-        ]:
-            lbl = self.font_text.render(label, True, self.COLOR_TEXT)
-            self.screen.blit(lbl, lbl.get_rect(center=(512, y)))
-            val = self.font_text.render(value, True, self.COLOR_INFO)
-            self.screen.blit(val, val.get_rect(center=(512, y + 50)))
-
-        instr = self.font_text.render("Communiquez cette adresse au joueur 2", True, self.COLOR_TEXT)
-        self.screen.blit(instr, instr.get_rect(center=(512, 480)))
-
-        wait = self.font_text.render("En attente de connexion...", True, (150, 150, 150))
-        self.screen.blit(wait, wait.get_rect(center=(512, 560)))
-
-        esc = self.font_text.render("ESC pour annuler", True, (100, 100, 100))
-        self.screen.blit(esc, esc.get_rect(center=(512, 700)))
-
-        pygame.display.flip()
+        transport = "TCP + UDP" if self.server.udp else "TCP"
+        self.port_label.set_text(f"{self.port} ({transport})")
+        status = "Négociation du canal UDP..." if self.client_connected else "En attente de connexion..."
+        self.status_label.set_text(status)
+        self.ui.render(self.screen)
 
     def run(self):
         if not self.server.start():
             return "CANCEL"
 
-        wait_time = 0
-        max_wait = 60 * 180  # 3 minutes
+        # Le réseau tourne sur le thread d'E/S et réveille l'écran par un NETWORK_EVENT :
+        # plus de scrutation de client_socket à chaque frame
+        engine = self.server.engine
+        own_thread = not engine.threaded
+        self.server.on_client_event = post_network_event
+        engine.start()
+        try:
+            result = self._wait_for_client()
+        finally:
+            self.server.on_client_event = None
+            if own_thread:
+                engine.stop()      # la partie reprend le pompage depuis sa boucle
+
+        if result == "QUIT":
+            self.server.stop(); pygame.quit(); sys.exit()
+        if result != "START_GAME":
+            self.server.stop()
+            return result
+        return ("START_GAME", self.server)
+
+    def _wait_for_client(self):
+        deadline = time.time() + self.timeout
+        negotiation_end = None
 
         while True:
+            self.draw()
             self.clock.tick(60)
-            wait_time += 1
-
-            action = self.handle_events()
-            if action == "QUIT":
-                self.server.stop(); pygame.quit(); sys.exit()
-            elif action == "CANCEL":
-                self.server.stop(); return "CANCEL"
+            now = time.time()
+            wake_at = negotiation_end if self.client_connected else deadline
+            action = self.handle_events(max(0.0, wake_at - now))
+            if action:
+                return action
 
-            # Un client vient de se connecter
+            # Un client vient de se connecter : laisser le temps au canal UDP de se confirmer
             if self.server.client_socket is not None and not self.client_connected:
                 self.client_connected = True
-                time.sleep(1)
-                return ("START_GAME", self.server)
+                negotiation_end = time.time() + UDP_PROBE_TIMEOUT + 0.5
 
-            if wait_time > max_wait:
-                self.server.stop(); return "TIMEOUT"
+            if self.client_connected:
+                negotiated = self.server.udp_ready or self.server.udp is None
+                if negotiated or time.time() > negotiation_end:
+                    return "START_GAME"
 
-            self.draw()
\ No newline at end of file
+            if time.time() > deadline:
+                return "TIMEOUT"
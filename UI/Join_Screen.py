@@ -1,5 +1,8 @@
 # UI/Join_Screen.py
 import pygame
+from Game.Network_Config import USE_UDP
+from UI.Widgets import UiLayer, Label, Box, Line
+from UI.Event_Loop import wait_events, cursor_visible, until_cursor_blink
 
 
 class JoinScreen:
@@ -27,27 +30,48 @@ class JoinScreen:
         self.ip_input = ""
         self.port_input = "5555"
         self.selected_field = 0  # 0 = IP, 1 = Port, 2 = Connecter
+        self.use_udp = USE_UDP   # canal UDP pour les états de jeu (touche F2)
 
         # États
         self.message = ""
 
         # Curseur clignotant
         self.cursor_visible = True
-        self.cursor_timer = 0
 
-        # Zones interactives (mises à jour dans draw)
+        # Zones interactives
         self.ip_rect = pygame.Rect(150, 250, 500, 50)
         self.port_rect = pygame.Rect(150, 380, 200, 50)
         self.connect_rect = pygame.Rect(200, 500, 400, 60)
 
+        # Widgets construits une fois ; draw() ne fait que mettre à jour leur état
+        ui = self.ui = UiLayer(self.COLOR_BG)
+        ui.add(Label(self.font_title, "REJOINDRE UNE PARTIE", self.COLOR_TITLE, center=(512, 80)),
+               Line(self.COLOR_INFO, (200, 140), (824, 140), 2),
+               Label(self.font_text, "Adresse IP :", self.COLOR_TEXT, topleft=(150, 200)))
+        self.ip_box = ui.add(Box(self.ip_rect, self.COLOR_INPUT_BG, (100, 100, 100), 3))
+        self.ip_label = ui.add(Label(self.font_text, "", self.COLOR_INFO, midleft=(160, self.ip_rect.centery)))
+        # Placeholder grisé quand le champ est vide et pas focus
+        self.ip_placeholder = ui.add(Label(self.font_text, "127.0.0.1", (80, 80, 80),
+                                           midleft=(160, self.ip_rect.centery)))
+        ui.add(Label(self.font_text, "Port :", self.COLOR_TEXT, topleft=(150, 330)))
+        self.port_box = ui.add(Box(self.port_rect, self.COLOR_INPUT_BG, (100, 100, 100), 3))
+        self.port_label = ui.add(Label(self.font_text, "", self.COLOR_INFO, midleft=(160, self.port_rect.centery)))
+        self.transport_label = ui.add(Label(self.font_small, "", (150, 150, 150),
+                                            midleft=(380, self.port_rect.centery)))
+        self.connect_box = ui.add(Box(self.connect_rect, (60, 60, 80), (200, 200, 200), 2, radius=6))
+        ui.add(Label(self.font_text, "CONNECTER", self.COLOR_TEXT, center=self.connect_rect.center))
+        self.message_label = ui.add(Label(self.font_small, "", self.COLOR_INFO, center=(512, 600)))
+        ui.add(Label(self.font_small, "TAB ou ↑↓ pour naviguer | ENTER: valider | ESC: annuler",
+                     (150, 150, 150), center=(512, 700)))
+
     def _build_connect_payload(self):
         ip = self.ip_input.strip() or "127.0.0.1"
         port = self.port_input.strip() or "5555"
-        return ("CONNECT", ip, port)
+        return ("CONNECT", ip, port, self.use_udp)
 
     def handle_events(self):
         """Gestion des événements clavier"""
-        for event in pygame.event.get():
+        for event in wait_events(until_cursor_blink(), self.ui):
             if event.type == pygame.QUIT:
                 return "QUIT"
 
@@ -65,6 +89,10 @@ class JoinScreen:
                 if event.key == pygame.K_ESCAPE:
                     return "CANCEL"
 
+                # F2 pour activer/désactiver le canal UDP
+                elif event.key == pygame.K_F2:
+                    self.use_udp = not self.use_udp
+
                 # TAB pour changer de champ
                 elif event.key == pygame.K_TAB:
                     self.selected_field = (self.selected_field + 1) % 3
@@ -99,89 +127,48 @@ class JoinScreen:
 
     def draw(self):
         """Afficher l'écran de connexion"""
-        self.screen.fill(self.COLOR_BG)
-
-        # Titre
-        title = self.font_title.render("REJOINDRE UNE PARTIE", True, self.COLOR_TITLE)
-        self.screen.blit(title, title.get_rect(center=(512, 80)))
-        pygame.draw.line(self.screen, self.COLOR_INFO, (200, 140), (824, 140), 2)
-
-        # Curseur clignotant (toggle toutes les 30 frames)
-        self.cursor_timer += 1
-        if self.cursor_timer >= 30:
-            self.cursor_visible = not self.cursor_visible
-            self.cursor_timer = 0
+        # Curseur clignotant (bascule toutes les CURSOR_BLINK ms)
+        self.cursor_visible = cursor_visible()
 
         # Champ IP
-        ip_label = self.font_text.render("Adresse IP :", True, self.COLOR_TEXT)
-        self.screen.blit(ip_label, ip_label.get_rect(topleft=(150, 200)))
-
-        self.ip_rect = pygame.Rect(150, 250, 500, 50)
-        border = self.COLOR_INPUT_BORDER if self.selected_field == 0 else (100, 100, 100)
-        pygame.draw.rect(self.screen, self.COLOR_INPUT_BG, self.ip_rect)
-        pygame.draw.rect(self.screen, border, self.ip_rect, 3)
-
-        if self.ip_input:
-            ip_display = self.ip_input
-        else:
-            ip_display = "127.0.0.1"
+        self.ip_box.set_colors(border=self.COLOR_INPUT_BORDER if self.selected_field == 0 else (100, 100, 100))
+        ip_display = self.ip_input or "127.0.0.1"
         # Ajouter le curseur si ce champ est sélectionné
         if self.selected_field == 0 and self.cursor_visible:
-            if self.ip_input:
-                ip_display = self.ip_input + "|"
-            else:
-                ip_display = "|"
-        ip_color = self.COLOR_INFO if self.ip_input else (100, 150, 100)
-        ip_text = self.font_text.render(ip_display, True, ip_color)
-        self.screen.blit(ip_text, ip_text.get_rect(midleft=(160, self.ip_rect.centery)))
-        # Placeholder grisé quand le champ est vide et pas focus
-        if not self.ip_input and self.selected_field != 0:
-            ph = self.font_text.render("127.0.0.1", True, (80, 80, 80))
-            self.screen.blit(ph, ph.get_rect(midleft=(160, self.ip_rect.centery)))
+            ip_display = self.ip_input + "|"
+        self.ip_label.set_text(ip_display, self.COLOR_INFO if self.ip_input else (100, 150, 100))
+        self.ip_placeholder.set_visible(not self.ip_input and self.selected_field != 0)
 
         # Champ Port
-        port_label = self.font_text.render("Port :", True, self.COLOR_TEXT)
-        self.screen.blit(port_label, port_label.get_rect(topleft=(150, 330)))
-
-        self.port_rect = pygame.Rect(150, 380, 200, 50)
-        border = self.COLOR_INPUT_BORDER if self.selected_field == 1 else (100, 100, 100)
-        pygame.draw.rect(self.screen, self.COLOR_INPUT_BG, self.port_rect)
-        pygame.draw.rect(self.screen, border, self.port_rect, 3)
-
+        self.port_box.set_colors(border=self.COLOR_INPUT_BORDER if self.selected_field == 1 else (100, 100, 100))
         port_display = self.port_input
         if self.selected_field == 1 and self.cursor_visible:
             port_display += "|"
-        port_text = self.font_text.render(port_display, True, self.COLOR_INFO)
-        self.screen.blit(port_text, port_text.get_rect(midleft=(160, self.port_rect.centery)))
+        self.port_label.set_text(port_display)
+
+        # Transport des états de jeu
+        transport = "Transport : TCP + UDP" if self.use_udp else "Transport : TCP seul"
+        self.transport_label.set_text(f"{transport}  [F2]")
 
         # Bouton Connecter
-        self.connect_rect = pygame.Rect(200, 500, 400, 60)
-        btn_color = self.COLOR_INPUT_BORDER if self.selected_field == 2 else (60, 60, 80)
-        pygame.draw.rect(self.screen, btn_color, self.connect_rect, border_radius=6)
-        pygame.draw.rect(self.screen, (200, 200, 200), self.connect_rect, 2, border_radius=6)
-        connect_text = self.font_text.render("CONNECTER", True, self.COLOR_TEXT)
-        self.screen.blit(connect_text, connect_text.get_rect(center=self.connect_rect.center))
+        self.connect_box.set_colors(fill=self.COLOR_INPUT_BORDER if self.selected_field == 2 else (60, 60, 80))
 
         # Message
+        self.message_label.set_visible(bool(self.message))
         if self.message:
-            color = self.COLOR_ERROR if "Erreur" in self.message else self.COLOR_INFO
-            msg = self.font_small.render(self.message, True, color)
-            self.screen.blit(msg, msg.get_rect(center=(512, 600)))
+            self.message_label.set_text(self.message, self.COLOR_ERROR if "Erreur" in self.message
+                                        else self.COLOR_INFO)
 
-        instr = self.font_small.render("TAB ou ↑↓ pour naviguer | ENTER: valider | ESC: annuler", True, (150, 150, 150))
-        self.screen.blit(instr, instr.get_rect(center=(512, 700)))
-
-        pygame.display.flip()
+        self.ui.render(self.screen)
 
     def run(self):
         """Boucle principale"""
         while True:
+            self.draw()
+            self.clock.tick(60)
             result = self.handle_events()
 
             if result:
                 return result
 
-            self.draw()
-            self.clock.tick(60)
-
 
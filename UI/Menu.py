@@ -1,6 +1,8 @@
 # ui/menu.py
 import pygame
 import sys
+from UI.Widgets import UiLayer, Label, Marker, get_font
+from UI.Event_Loop import wait_events
 
 
 class MainMenu:
@@ -20,8 +22,20 @@ class MainMenu:
         self.COLOR_NORMAL = (100, 100, 100)
         self.COLOR_ACCENT = (255, 200, 0)
 
+        # Widgets construits une fois ; draw() ne fait que mettre à jour leur état
+        self.ui = UiLayer(self.COLOR_BG)
+        self.ui.add(Label(self.font_title, "TANK BATTLE", self.COLOR_TITLE, center=(512, 150)))
+        self.option_labels = [
+            self.ui.add(Label(self.font_menu, option, self.COLOR_NORMAL, center=(512, 300 + i * 80)))
+            for i, option in enumerate(self.options)
+        ]
+        self.option_rects = [label.rect.inflate(80, 20) for label in self.option_labels]
+        self.marker = self.ui.add(Marker(self.COLOR_ACCENT))
+        self.ui.add(Label(get_font(28), "↑↓ / Souris: Naviguer  |  ENTER / Clic: Valider  |  ESC: Quitter",
+                          (80, 80, 80), center=(512, 730)))
+
     def handle_events(self):
-        for event in pygame.event.get():
+        for event in wait_events(layer=self.ui):
             if event.type == pygame.QUIT:
                 return "QUIT"
 
@@ -47,39 +61,19 @@ class MainMenu:
         return None
 
     def draw(self):
-        self.screen.fill(self.COLOR_BG)
-
-        title = self.font_title.render("TANK BATTLE", True, self.COLOR_TITLE)
-        self.screen.blit(title, title.get_rect(center=(512, 150)))
-
-        self.option_rects = []
-        for i, option in enumerate(self.options):
-            color = self.COLOR_SELECTED if i == self.selected else self.COLOR_NORMAL
-            text = self.font_menu.render(option, True, color)
-            text_rect = text.get_rect(center=(512, 300 + i * 80))
-            self.option_rects.append(text_rect.inflate(80, 20))
-            self.screen.blit(text, text_rect)
-
-            if i == self.selected:
-                pygame.draw.polygon(self.screen, self.COLOR_ACCENT, [
-                    (text_rect.right + 40, text_rect.centery),
-                    (text_rect.right + 20, text_rect.centery - 15),
-                    (text_rect.right + 20, text_rect.centery + 15)])
-
-        instr = pygame.font.Font(None, 28).render(
-            "↑↓ / Souris: Naviguer  |  ENTER / Clic: Valider  |  ESC: Quitter",
-            True, (80, 80, 80))
-        self.screen.blit(instr, instr.get_rect(center=(512, 730)))
-
-        pygame.display.flip()
+        for i, label in enumerate(self.option_labels):
+            label.set_color(self.COLOR_SELECTED if i == self.selected else self.COLOR_NORMAL)
+        selected = self.option_labels[self.selected].rect
+        self.marker.point_at(selected.right + 40, selected.centery)
+        self.ui.render(self.screen)
 
     def run(self):
         while True:
+            self.draw()
             self.clock.tick(60)
             choice = self.handle_events()
             if choice == "QUIT":
                 pygame.quit(); sys.exit()
             elif choice:
                 return choice
-            self.draw()
 
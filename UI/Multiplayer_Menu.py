@@ -1,6 +1,8 @@
 # UI/Multiplayer_Menu.py
 import pygame
 import sys
+from UI.Widgets import UiLayer, Label, Marker
+from UI.Event_Loop import wait_events
 
 
 class MultiplayerMenu:
@@ -17,9 +19,6 @@ class MultiplayerMenu:
         self.options = ["HÉBERGER", "REJOINDRE", "RETOUR"]
         self.selected = 0
 
-        # Rectangles cliquables (calculés dans draw)
-        self.option_rects = []
-
         # Couleurs
         self.COLOR_BG = (20, 20, 30)
         self.COLOR_TITLE = (100, 200, 255)
@@ -28,9 +27,32 @@ class MultiplayerMenu:
         self.COLOR_ACCENT = (100, 200, 255)
         self.COLOR_INFO = (150, 150, 150)
 
+        descriptions = ["Créer une partie et attendre un joueur",
+                        "Se connecter à une partie existante",
+                        "Revenir au menu principal"]
+
+        # Widgets construits une fois ; draw() ne fait que mettre à jour leur état
+        start_y = 300
+        self.ui = UiLayer(self.COLOR_BG)
+        self.ui.add(Label(self.font_title, "MULTIJOUEUR", self.COLOR_TITLE, center=(512, 120)),
+                    Label(self.font_subtitle, "Mode Réseau Local", self.COLOR_INFO, center=(512, 180)))
+        self.option_labels, self.desc_labels = [], []
+        for i, option in enumerate(self.options):
+            self.option_labels.append(self.ui.add(
+                Label(self.font_menu, option, self.COLOR_NORMAL, center=(512, start_y + i * 90))))
+            # Description affichée sous l'option sélectionnée
+            self.desc_labels.append(self.ui.add(
+                Label(self.font_subtitle, descriptions[i], self.COLOR_INFO, center=(512, start_y + i * 90 + 40))))
+        self.option_rects = [label.rect.inflate(80, 20) for label in self.option_labels]
+        self.marker = self.ui.add(Marker(self.COLOR_ACCENT))
+
+        # Instructions en bas
+        self.ui.add(Label(self.font_subtitle, "↑↓ / Souris: Naviguer  |  ENTER / Clic: Valider  |  ESC: Retour",
+                          (80, 80, 80), center=(512, 700)))
+
     def handle_events(self):
         """Gestion des événements clavier et souris"""
-        for event in pygame.event.get():
+        for event in wait_events(layer=self.ui):
             if event.type == pygame.QUIT:
                 return "QUIT"
 
@@ -62,63 +84,18 @@ class MultiplayerMenu:
 
     def draw(self):
         """Affichage du menu"""
-        self.screen.fill(self.COLOR_BG)
-
-        # Titre
-        title = self.font_title.render("MULTIJOUEUR", True, self.COLOR_TITLE)
-        title_rect = title.get_rect(center=(512, 120))
-        self.screen.blit(title, title_rect)
-
-        # Sous-titre
-        subtitle = self.font_subtitle.render("Mode Réseau Local", True, self.COLOR_INFO)
-        subtitle_rect = subtitle.get_rect(center=(512, 180))
-        self.screen.blit(subtitle, subtitle_rect)
-
-        # Options du menu
-        start_y = 300
-        self.option_rects = []
-        for i, option in enumerate(self.options):
-            color = self.COLOR_SELECTED if i == self.selected else self.COLOR_NORMAL
-
-            text = self.font_menu.render(option, True, color)
-            text_rect = text.get_rect(center=(512, start_y + i * 90))
-            click_rect = text_rect.inflate(80, 20)
-            self.option_rects.append(click_rect)
-            self.screen.blit(text, text_rect)
-
-            # Description
-            if i == 0:
-                desc = "Créer une partie et attendre un joueur"
-            elif i == 1:
-                desc = "Se connecter à une partie existante"
-            else:
-                desc = "Revenir au menu principal"
-
-            if i == self.selected:
-                desc_text = self.font_subtitle.render(desc, True, self.COLOR_INFO)
-                desc_rect = desc_text.get_rect(center=(512, start_y + i * 90 + 40))
-                self.screen.blit(desc_text, desc_rect)
-
-            # Triangle
-            if i == self.selected:
-                pygame.draw.polygon(self.screen, self.COLOR_ACCENT, [
-                    (text_rect.right + 40, text_rect.centery),
-                    (text_rect.right + 20, text_rect.centery - 15),
-                    (text_rect.right + 20, text_rect.centery + 15)
-                ])
-
-        # Instructions en bas
-        instructions = "↑↓ / Souris: Naviguer  |  ENTER / Clic: Valider  |  ESC: Retour"
-        instr_text = self.font_subtitle.render(instructions, True, (80, 80, 80))
-        instr_rect = instr_text.get_rect(center=(512, 700))
-        self.screen.blit(instr_text, instr_rect)
-
-        pygame.display.flip()
+        for i, label in enumerate(self.option_labels):
+            label.set_color(self.COLOR_SELECTED if i == self.selected else self.COLOR_NORMAL)
+            self.desc_labels[i].set_visible(i == self.selected)
+        selected = self.option_labels[self.selected].rect
+        self.marker.point_at(selected.right + 40, selected.centery)
+        self.ui.render(self.screen)
 
     def run(self):
         """Boucle principale du menu multijoueur"""
         running = True
         while running:
+            self.draw()
             self.clock.tick(60)
 
             choice = self.handle_events()
@@ -127,6 +104,4 @@ class MultiplayerMenu:
                 pygame.quit()
                 sys.exit()
             elif choice:
-                return choice
-
-            self.draw()
\ No newline at end of file
+                return choice
\ No newline at end of file
@@ -4,6 +4,8 @@
 import pygame
 import sys
 from Config import MENU_WIDTH
+from UI.Widgets import UiLayer, Label, Box
+from UI.Event_Loop import wait_events, cursor_visible, until_cursor_blink
 
 
 class NameInput:
@@ -23,11 +25,25 @@ class NameInput:
         self.name = ""
         self.max_length = 15
         self.cursor_visible = True
-        self.cursor_timer = 0
+
+        # Widgets construits une fois ; draw() ne fait que mettre à jour leur état
+        title_text = "VICTOIRE !" if self.won else "DÉFAITE..."
+        title_color = (0, 255, 0) if self.won else (255, 0, 0)
+        self.input_rect = pygame.Rect(MENU_WIDTH // 2 - 200, 300, 400, 60)
+        self.ui = UiLayer((20, 20, 30))
+        self.ui.add(Label(self.font_title, title_text, title_color, center=(MENU_WIDTH // 2, 120)),
+                    Label(self.font_text, "Entrez votre nom pour le leaderboard :", (255, 255, 255),
+                          center=(MENU_WIDTH // 2, 250)),
+                    # Champ de saisie
+                    Box(self.input_rect, (40, 40, 50), (255, 200, 0), 3))
+        self.name_label = self.ui.add(Label(self.font_input, "", (255, 255, 255),
+                                            midleft=(self.input_rect.left + 15, self.input_rect.centery)))
+        self.ui.add(Label(self.font_small, "ENTER pour valider", (0, 255, 100), center=(MENU_WIDTH // 2, 400)),
+                    Label(self.font_small, "ESC pour passer", (100, 100, 100), center=(MENU_WIDTH // 2, 430)))
 
     def handle_events(self):
         """Gestion des événements"""
-        for event in pygame.event.get():
+        for event in wait_events(until_cursor_blink(), self.ui):
             if event.type == pygame.QUIT:
                 return "QUIT"
             if event.type == pygame.KEYDOWN:
@@ -43,41 +59,16 @@ class NameInput:
 
     def draw(self):
         """Affichage de l'écran"""
-        self.screen.fill((20, 20, 30))
-
-        title_text = "VICTOIRE !" if self.won else "DÉFAITE..."
-        title_color = (0, 255, 0) if self.won else (255, 0, 0)
-        title = self.font_title.render(title_text, True, title_color)
-        self.screen.blit(title, title.get_rect(center=(MENU_WIDTH // 2, 120)))
-
-        instr = self.font_text.render("Entrez votre nom pour le leaderboard :", True, (255, 255, 255))
-        self.screen.blit(instr, instr.get_rect(center=(MENU_WIDTH // 2, 250)))
-
-        # Champ de saisie
-        input_rect = pygame.Rect(MENU_WIDTH // 2 - 200, 300, 400, 60)
-        pygame.draw.rect(self.screen, (40, 40, 50), input_rect)
-        pygame.draw.rect(self.screen, (255, 200, 0), input_rect, 3)
-
         # Curseur clignotant
-        self.cursor_timer += 1
-        if self.cursor_timer >= 30:
-            self.cursor_visible = not self.cursor_visible
-            self.cursor_timer = 0
-
-        display = self.name + ("|" if self.cursor_visible else "")
-        txt = self.font_input.render(display, True, (255, 255, 255))
-        self.screen.blit(txt, txt.get_rect(midleft=(input_rect.left + 15, input_rect.centery)))
+        self.cursor_visible = cursor_visible()
 
-        h1 = self.font_small.render("ENTER pour valider", True, (0, 255, 100))
-        self.screen.blit(h1, h1.get_rect(center=(MENU_WIDTH // 2, 400)))
-        h2 = self.font_small.render("ESC pour passer", True, (100, 100, 100))
-        self.screen.blit(h2, h2.get_rect(center=(MENU_WIDTH // 2, 430)))
-
-        pygame.display.flip()
+        self.name_label.set_text(self.name + ("|" if self.cursor_visible else ""))
+        self.ui.render(self.screen)
 
     def run(self):
         """Boucle principale — retourne le nom ou 'SKIP'"""
         while True:
+            self.draw()
             self.clock.tick(60)
             result = self.handle_events()
             if result == "QUIT":
@@ -86,5 +77,4 @@ class NameInput:
                 return None
             elif result is not None:
                 return result
-            self.draw()
 
@@ -5,6 +5,8 @@ import pygame
 import sys
 from Score_Manager import get_leaderboard, clear_scores
 from Config import MENU_WIDTH, MENU_HEIGHT
+from UI.Widgets import UiLayer, Label, Box, Line, Overlay
+from UI.Event_Loop import wait_events
 
 
 class Scoreboard:
@@ -50,9 +52,61 @@ class Scoreboard:
         self.confirm_btn_oui = pygame.Rect(MENU_WIDTH // 2 - 130, MENU_HEIGHT // 2 + 20, 110, 45)
         self.confirm_btn_non = pygame.Rect(MENU_WIDTH // 2 + 20, MENU_HEIGHT // 2 + 20, 110, 45)
 
+        self._build_widgets()
+
+    def _build_widgets(self):
+        """Widgets construits une fois ; draw() ne fait que mettre à jour leur état."""
+        ui = self.ui = UiLayer(self.COLOR_BG)
+
+        # Titre + ligne de séparation
+        ui.add(Label(self.font_title, "LEADERBOARD", self.COLOR_TITLE, center=(MENU_WIDTH // 2, 60)),
+               Line(self.COLOR_TITLE, (150, 100), (MENU_WIDTH - 150, 100), 2))
+
+        # En-têtes
+        y_start = 130
+        self.col_x = [80, 200, 450, 620, 780]
+        for header, x in zip(["#", "JOUEUR", "VICTOIRES", "DÉFAITES", "PARTIES"], self.col_x):
+            ui.add(Label(self.font_header, header, self.COLOR_HEADER, center=(x, y_start)))
+        ui.add(Line(self.COLOR_LINE, (50, y_start + 25), (MENU_WIDTH - 50, y_start + 25), 1))
+
+        self.no_score_label = ui.add(Label(self.font_row, "Aucun score enregistré", (100, 100, 100),
+                                           center=(MENU_WIDTH // 2, 300)))
+
+        # Lignes du leaderboard : fond alterné + 5 colonnes, remplies dans draw()
+        self.rows = []
+        for idx in range(self.max_visible):
+            row_y = y_start + 55 + idx * 45
+            row = [ui.add(Box((50, row_y - 15, MENU_WIDTH - 100, 40), (30, 30, 45)))] if idx % 2 == 0 else []
+            row += [ui.add(Label(self.font_row, "", self.COLOR_TEXT, center=(x, row_y))) for x in self.col_x]
+            self.rows.append(row)
+
+        # Indicateur de scroll
+        self.scroll_label = ui.add(Label(self.font_small, "", (100, 100, 100),
+                                         center=(MENU_WIDTH // 2, MENU_HEIGHT - 130)))
+
+        # Boutons SUPPRIMER / RETOUR
+        self.clear_box = ui.add(Box(self.clear_btn_rect, self.COLOR_BTN, (200, 80, 80), 2, radius=6))
+        ui.add(Label(self.font_button, "SUPPRIMER LES SCORES", (255, 255, 255), center=self.clear_btn_rect.center))
+        self.back_box = ui.add(Box(self.back_btn_rect, (40, 40, 55), (150, 150, 150), 2, radius=6))
+        ui.add(Label(self.font_button, "← RETOUR", (200, 200, 200), center=self.back_btn_rect.center),
+               Label(self.font_small, "ESC: Retour  |  DEL: Supprimer", (80, 80, 80),
+                     center=(MENU_WIDTH // 2, MENU_HEIGHT - 15)))
+
+        # Dialogue de confirmation (par dessus tout)
+        self.oui_box = Box(self.confirm_btn_oui)
+        self.non_box = Box(self.confirm_btn_non)
+        self.confirm_widgets = ui.add(
+            Overlay((0, 0, MENU_WIDTH, MENU_HEIGHT)),
+            Box((MENU_WIDTH // 2 - 200, MENU_HEIGHT // 2 - 60, 400, 150), (30, 30, 45), (255, 80, 80), 3),
+            Label(self.font_header, "Supprimer tous les scores ?", (255, 255, 255),
+                  center=(MENU_WIDTH // 2, MENU_HEIGHT // 2 - 25)),
+            self.oui_box, Label(self.font_button, "OUI", (255, 255, 255), center=self.confirm_btn_oui.center),
+            self.non_box, Label(self.font_button, "NON", (255, 255, 255), center=self.confirm_btn_non.center),
+        )
+
     def handle_events(self):
         """Gestion des événements"""
-        for event in pygame.event.get():
+        for event in wait_events(layer=self.ui):
             if event.type == pygame.QUIT:
                 return "QUIT"
 
@@ -124,147 +178,62 @@ class Scoreboard:
 
         return None
 
-    def _draw_confirm_dialog(self):
-        """Dessine la boîte de dialogue de confirmation"""
-        # Overlay sombre
-        overlay = pygame.Surface((MENU_WIDTH, MENU_HEIGHT))
-        overlay.fill((0, 0, 0))
-        overlay.set_alpha(180)
-        self.screen.blit(overlay, (0, 0))
-
-        # Boîte de dialogue
-        dialog_rect = pygame.Rect(MENU_WIDTH // 2 - 200, MENU_HEIGHT // 2 - 60, 400, 150)
-        pygame.draw.rect(self.screen, (30, 30, 45), dialog_rect)
-        pygame.draw.rect(self.screen, (255, 80, 80), dialog_rect, 3)
-
-        # Texte
-        text = self.font_header.render("Supprimer tous les scores ?", True, (255, 255, 255))
-        text_rect = text.get_rect(center=(MENU_WIDTH // 2, MENU_HEIGHT // 2 - 25))
-        self.screen.blit(text, text_rect)
-
-        # Bouton OUI
-        oui_color = (200, 60, 60) if self.confirm_selected == 0 else (80, 30, 30)
-        pygame.draw.rect(self.screen, oui_color, self.confirm_btn_oui)
-        pygame.draw.rect(self.screen, (255, 255, 255) if self.confirm_selected == 0 else (100, 100, 100),
-                         self.confirm_btn_oui, 2)
-        oui_text = self.font_button.render("OUI", True, (255, 255, 255))
-        oui_text_rect = oui_text.get_rect(center=self.confirm_btn_oui.center)
-        self.screen.blit(oui_text, oui_text_rect)
-
-        # Bouton NON
-        non_color = (40, 100, 40) if self.confirm_selected == 1 else (30, 50, 30)
-        pygame.draw.rect(self.screen, non_color, self.confirm_btn_non)
-        pygame.draw.rect(self.screen, (255, 255, 255) if self.confirm_selected == 1 else (100, 100, 100),
-                         self.confirm_btn_non, 2)
-        non_text = self.font_button.render("NON", True, (255, 255, 255))
-        non_text_rect = non_text.get_rect(center=self.confirm_btn_non.center)
-        self.screen.blit(non_text, non_text_rect)
+    def _update_confirm_dialog(self):
+        """Boîte de dialogue de confirmation : visibilité et bouton sélectionné."""
+        for widget in self.confirm_widgets:
+            widget.set_visible(self.confirm_active)
+        oui, non = self.confirm_selected == 0, self.confirm_selected == 1
+        self.oui_box.set_colors((200, 60, 60) if oui else (80, 30, 30), (255, 255, 255) if oui else (100, 100, 100))
+        self.non_box.set_colors((40, 100, 40) if non else (30, 50, 30), (255, 255, 255) if non else (100, 100, 100))
 
     def draw(self):
         """Affichage du scoreboard"""
-        self.screen.fill(self.COLOR_BG)
-
-        # Titre
-        title = self.font_title.render("LEADERBOARD", True, self.COLOR_TITLE)
-        title_rect = title.get_rect(center=(MENU_WIDTH // 2, 60))
-        self.screen.blit(title, title_rect)
-
-        # Ligne de séparation
-        pygame.draw.line(self.screen, self.COLOR_TITLE, (150, 100), (MENU_WIDTH - 150, 100), 2)
-
-        # En-têtes
-        y_start = 130
-        headers = ["#", "JOUEUR", "VICTOIRES", "DÉFAITES", "PARTIES"]
-        col_x = [80, 200, 450, 620, 780]
-
-        for i, header in enumerate(headers):
-            text = self.font_header.render(header, True, self.COLOR_HEADER)
-            text_rect = text.get_rect(center=(col_x[i], y_start))
-            self.screen.blit(text, text_rect)
-
-        pygame.draw.line(self.screen, self.COLOR_LINE, (50, y_start + 25), (MENU_WIDTH - 50, y_start + 25), 1)
+        self.no_score_label.set_visible(not self.scores)
 
         # Lignes du leaderboard
-        if not self.scores:
-            no_score = self.font_row.render("Aucun score enregistré", True, (100, 100, 100))
-            no_rect = no_score.get_rect(center=(MENU_WIDTH // 2, 300))
-            self.screen.blit(no_score, no_rect)
-        else:
-            visible_scores = self.scores[self.scroll_offset:self.scroll_offset + self.max_visible]
-            for idx, entry in enumerate(visible_scores):
-                rank = self.scroll_offset + idx + 1
-                row_y = y_start + 55 + idx * 45
-
-                if rank == 1:
-                    row_color = self.COLOR_GOLD
-                elif rank == 2:
-                    row_color = self.COLOR_SILVER
-                elif rank == 3:
-                    row_color = self.COLOR_BRONZE
-                else:
-                    row_color = self.COLOR_TEXT
-
-                # Fond alterné
-                if idx % 2 == 0:
-                    bg_rect = pygame.Rect(50, row_y - 15, MENU_WIDTH - 100, 40)
-                    pygame.draw.rect(self.screen, (30, 30, 45), bg_rect)
-
-                # Données
-                rank_text = self.font_row.render(str(rank), True, row_color)
-                name_text = self.font_row.render(entry["name"][:15], True, row_color)
-                wins_text = self.font_row.render(str(entry["wins"]), True, (0, 255, 0))
-                losses_text = self.font_row.render(str(entry["losses"]), True, (255, 80, 80))
-                games_text = self.font_row.render(str(entry["games"]), True, row_color)
-
-                for text, x in [(rank_text, col_x[0]), (name_text, col_x[1]),
-                                (wins_text, col_x[2]), (losses_text, col_x[3]),
-                                (games_text, col_x[4])]:
-                    rect = text.get_rect(center=(x, row_y))
-                    self.screen.blit(text, rect)
+        visible_scores = self.scores[self.scroll_offset:self.scroll_offset + self.max_visible]
+        for idx, row in enumerate(self.rows):
+            for widget in row:
+                widget.set_visible(idx < len(visible_scores))
+            if idx >= len(visible_scores):
+                continue
+            entry = visible_scores[idx]
+            rank = self.scroll_offset + idx + 1
+            if rank == 1:
+                row_color = self.COLOR_GOLD
+            elif rank == 2:
+                row_color = self.COLOR_SILVER
+            elif rank == 3:
+                row_color = self.COLOR_BRONZE
+            else:
+                row_color = self.COLOR_TEXT
+
+            values = [(str(rank), row_color), (entry["name"][:15], row_color),
+                      (str(entry["wins"]), (0, 255, 0)), (str(entry["losses"]), (255, 80, 80)),
+                      (str(entry["games"]), row_color)]
+            for label, (text, color) in zip(row[-5:], values):
+                label.set_text(text, color)
 
         # Indicateur de scroll
+        self.scroll_label.set_visible(len(self.scores) > self.max_visible)
         if len(self.scores) > self.max_visible:
-            scroll_info = self.font_small.render(
+            self.scroll_label.set_text(
                 f"↑↓ / Molette pour défiler ({self.scroll_offset + 1}-"
                 f"{min(self.scroll_offset + self.max_visible, len(self.scores))}"
-                f" / {len(self.scores)})",
-                True, (100, 100, 100)
-            )
-            scroll_rect = scroll_info.get_rect(center=(MENU_WIDTH // 2, MENU_HEIGHT - 130))
-            self.screen.blit(scroll_info, scroll_rect)
+                f" / {len(self.scores)})")
 
-        # === Bouton SUPPRIMER ===
+        # Boutons (grisé si pas de scores)
         btn_color = self.COLOR_BTN_HOVER if self.clear_btn_hover else self.COLOR_BTN
-        if not self.scores:
-            btn_color = (60, 30, 30)  # Grisé si pas de scores
-        pygame.draw.rect(self.screen, btn_color, self.clear_btn_rect, border_radius=6)
-        pygame.draw.rect(self.screen, (200, 80, 80), self.clear_btn_rect, 2, border_radius=6)
-        clear_text = self.font_button.render("SUPPRIMER LES SCORES", True, (255, 255, 255))
-        clear_text_rect = clear_text.get_rect(center=self.clear_btn_rect.center)
-        self.screen.blit(clear_text, clear_text_rect)
-
-        # === Bouton RETOUR ===
-        back_color = (60, 60, 80) if self.back_btn_hover else (40, 40, 55)
-        pygame.draw.rect(self.screen, back_color, self.back_btn_rect, border_radius=6)
-        pygame.draw.rect(self.screen, (150, 150, 150), self.back_btn_rect, 2, border_radius=6)
-        back_text = self.font_button.render("← RETOUR", True, (200, 200, 200))
-        back_text_rect = back_text.get_rect(center=self.back_btn_rect.center)
-        self.screen.blit(back_text, back_text_rect)
-
-        # Instructions
-        instr = self.font_small.render("ESC: Retour  |  DEL: Supprimer", True, (80, 80, 80))
-        instr_rect = instr.get_rect(center=(MENU_WIDTH // 2, MENU_HEIGHT - 15))
-        self.screen.blit(instr, instr_rect)
+        self.clear_box.set_colors(btn_color if self.scores else (60, 30, 30))
+        self.back_box.set_colors((60, 60, 80) if self.back_btn_hover else (40, 40, 55))
 
-        # Dialogue de confirmation (par dessus tout)
-        if self.confirm_active:
-            self._draw_confirm_dialog()
-
-        pygame.display.flip()
+        self._update_confirm_dialog()
+        self.ui.render(self.screen)
 
     def run(self):
         """Boucle principale"""
         while True:
+            self.draw()
             self.clock.tick(60)
             result = self.handle_events()
 
@@ -274,6 +243,4 @@ class Scoreboard:
             elif result == "MENU":
                 return "MENU"
 
-            self.draw()
-
 
@@ -0,0 +1,242 @@
+# UI/Widgets.py
+"""Couche UI retenue, partagée par les écrans de UI/.
+
+Un écran construit ses widgets une fois, puis à chaque frame ne fait que
+mettre à jour leur état (texte, couleur, visibilité). Un widget modifié se
+marque « sale » ; UiLayer.render ne repeint que les zones sales (fond +
+widgets qui les coupent, dans l'ordre) et met l'écran à jour avec
+pygame.display.update(zones) au lieu d'un flip complet.
+
+Les textes rendus sont gardés par (police, texte, couleur) : une étiquette
+qui revient (option de menu sélectionnée / normale) n'est rendue qu'une fois.
+"""
+
+import pygame
+
+TEXT_CACHE_SIZE = 512    # surfaces de texte gardées
+
+_text_cache = {}
+_fonts = {}
+
+
+def get_font(size, name=None):
+    """Police partagée par (nom, taille) : jamais recréée à chaque frame."""
+    key = (name, size)
+    font = _fonts.get(key)
+    if font is None:
+        font = _fonts[key] = pygame.font.Font(name, size)
+    return font
+
+
+def render_text(font, text, color):
+    """font.render mis en cache par (police, texte, couleur)."""
+    key = (font, text, color)
+    surface = _text_cache.get(key)
+    if surface is None:
+        if len(_text_cache) >= TEXT_CACHE_SIZE:
+            _text_cache.clear()
+        surface = _text_cache[key] = font.render(text, True, color)
+    return surface
+
+
+class Widget:
+    """Élément affiché : `rect` à l'écran, redessiné seulement s'il est sale."""
+
+    def __init__(self, rect=None):
+        self.rect = pygame.Rect(rect) if rect else pygame.Rect(0, 0, 0, 0)
+        self.visible = True
+        self.dirty = True
+        self._drawn_rect = None     # zone occupée au dernier rendu
+
+    def invalidate(self):
+        self.dirty = True
+
+    def set_visible(self, visible):
+        if visible != self.visible:
+            self.visible = visible
+            self.dirty = True
+
+    def _set(self, name, value):
+        """Affecte un attribut et invalide si la valeur change."""
+        if getattr(self, name) != value:
+            setattr(self, name, value)
+            self.dirty = True
+
+    def draw(self, surface):
+        """Dessine le widget ; chaque type de widget le redéfinit."""
+
+
+class Label(Widget):
+    """Texte ancré sur un point : Label(font, "Titre", couleur, center=(512, 100))."""
+
+    def __init__(self, font, text, color, **anchor):
+        super().__init__()
+        self.font = font
+        self.text = text
+        self.color = color
+        self.anchor = anchor
+        self._layout()
+
+    def _layout(self):
+        self.surface = render_text(self.font, self.text, self.color)
+        self.rect = self.surface.get_rect(**self.anchor)
+
+    def set_text(self, text, color=None):
+        color = self.color if color is None else color
+        if text != self.text or color != self.color:
+            self.text, self.color = text, color
+            self._layout()
+            self.dirty = True
+
+    def set_color(self, color):
+        self.set_text(self.text, color)
+
+    def move(self, **anchor):
+        if anchor != self.anchor:
+            self.anchor = anchor
+            self._layout()
+            self.dirty = True
+
+    def draw(self, surface):
+        surface.blit(self.surface, self.rect)
+
+
+class Box(Widget):
+    """Rectangle plein et / ou contour (champ de saisie, bouton, fond de ligne)."""
+
+    def __init__(self, rect, fill=None, border=None, width=2, radius=0):
+        super().__init__(rect)
+        self.fill = fill
+        self.border = border
+        self.width = width
+        self.radius = radius
+
+    def set_colors(self, fill=None, border=None):
+        self._set("fill", self.fill if fill is None else fill)
+        self._set("border", self.border if border is None else border)
+
+    def draw(self, surface):
+        if self.fill:
+            pygame.draw.rect(surface, self.fill, self.rect, border_radius=self.radius)
+        if self.border:
+            pygame.draw.rect(surface, self.border, self.rect, self.width, border_radius=self.radius)
+
+
+class Line(Widget):
+    def __init__(self, color, start, end, width=1):
+        x0, x1 = sorted((start[0], end[0]))
+        y0, y1 = sorted((start[1], end[1]))
+        super().__init__((x0 - width, y0 - width, x1 - x0 + 2 * width, y1 - y0 + 2 * width))
+        self.color, self.start, self.end, self.width = color, start, end, width
+
+    def draw(self, surface):
+        pygame.draw.line(surface, self.color, self.start, self.end, self.width)
+
+
+class Marker(Widget):
+    """Triangle de sélection, pointe vers la gauche (side=-1) ou la droite (1)."""
+
+    def __init__(self, color, side=1, size=(20, 30)):
+        super().__init__((0, 0, size[0] + 1, size[1] + 1))
+        self.color = color
+        self.side = side
+
+    def point_at(self, x, y):
+        """Place la pointe en (x, y)."""
+        w, h = self.rect.w - 1, self.rect.h - 1
+        rect = pygame.Rect(x - w if self.side > 0 else x, y - h // 2, w + 1, h + 1)
+        if rect != self.rect:
+            self.rect = rect
+            self.dirty = True
+
+    def draw(self, surface):
+        w, h = self.rect.w - 1, self.rect.h - 1
+        tip_x = self.rect.right - 1 if self.side > 0 else self.rect.left
+        base_x = tip_x - self.side * w
+        pygame.draw.polygon(surface, self.color, [
+            (tip_x, self.rect.centery), (base_x, self.rect.top), (base_x, self.rect.top + h)])
+
+
+class Overlay(Widget):
+    """Voile semi-transparent (boîte de dialogue par-dessus un écran)."""
+
+    def __init__(self, rect, color=(0, 0, 0), alpha=180):
+        super().__init__(rect)
+        self.surface = pygame.Surface(self.rect.size)
+        self.surface.fill(color)
+        self.surface.set_alpha(alpha)
+
+    def draw(self, surface):
+        surface.blit(self.surface, self.rect)
+
+
+class UiLayer:
+    """Widgets d'un écran, dans l'ordre de dessin, sur un fond uni."""
+
+    def __init__(self, background):
+        self.background = background
+        self.widgets = []
+        self._full = True
+
+    def add(self, *widgets):
+        self.widgets.extend(widgets)
+        self._full = True
+        return widgets[0] if len(widgets) == 1 else widgets
+
+    def invalidate(self):
+        """Tout repeindre au prochain rendu (retour sur l'écran, fenêtre exposée)."""
+        self._full = True
+
+    def _dirty_regions(self):
+        regions = []
+        for widget in self.widgets:
+            if not widget.dirty:
+                continue
+            if widget._drawn_rect:
+                regions.append(widget._drawn_rect)
+            if widget.visible:
+                regions.append(widget.rect)
+        return [r for r in regions if r.w and r.h]
+
+    def render(self, screen):
+        """Repeint les zones sales et met l'écran à jour. Retourne les zones repeintes."""
+        if self._full:
+            regions = [screen.get_rect()]
+        else:
+            regions = _merge(self._dirty_regions())
+        if not regions:
+            return []
+
+        for region in regions:
+            screen.set_clip(region)
+            screen.fill(self.background)
+            for widget in self.widgets:
+                if widget.visible and widget.rect.colliderect(region):
+                    widget.draw(screen)
+        screen.set_clip(None)
+
+        for widget in self.widgets:
+            widget.dirty = False
+            widget._drawn_rect = widget.rect.copy() if widget.visible else None
+        if self._full:
+            self._full = False
+            pygame.display.flip()
+        else:
+            pygame.display.update(regions)
+        return regions
+
+
+def _merge(regions):
+    """Fusionne les zones qui se chevauchent (moins de passes de repeinte)."""
+    merged = []
+    for rect in regions:
+        rect = rect.copy()
+        i = 0
+        while i < len(merged):
+            if merged[i].colliderect(rect):
+                rect.union_ip(merged.pop(i))
+                i = 0
+            else:
+                i += 1
+        merged.append(rect)
+    return merged